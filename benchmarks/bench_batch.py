@@ -0,0 +1,37 @@
+"""
+Compare a Python loop over `format_currency` with `format_currency_many` on lists, `array.array` and NumPy arrays.
+
+Run with `python benchmarks/bench_batch.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import array
+import random
+import time
+
+from format_currency import format_currency, format_currency_many, vectorized
+
+
+def timed(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def main(size=200000):
+    random.seed(0)
+    numbers = [random.uniform(-1e9, 1e9) for _ in range(size)]
+    buffer = array.array('d', numbers)
+    numpy = vectorized.load_numpy()
+
+    for country_code in ('US', 'IN', 'CN'):
+        loop = timed(lambda: [format_currency(number, country_code) for number in numbers])
+        many = timed(lambda: format_currency_many(numbers, country_code))
+        line = f'{country_code} n={size}  loop {loop:.3f}s  list {many:.3f}s'
+        if numpy is not None:
+            line += f'  array.array {timed(lambda: format_currency_many(buffer, country_code)):.3f}s'
+            values = numpy.asarray(numbers)
+            line += f'  numpy {timed(lambda: format_currency_many(values, country_code)):.3f}s'
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
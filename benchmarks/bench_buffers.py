@@ -0,0 +1,48 @@
+"""
+Compare formatting a binary column of int64 cents into a UTF-8 file with `format_currency_buffer`, against
+formatting, encoding and writing each amount with a reusable `CurrencyFormatter`.
+
+Run with `python benchmarks/bench_buffers.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import mmap
+import os
+import tempfile
+import time
+
+import numpy
+
+from format_currency import CurrencyFormatter, format_currency_buffer
+
+CASES = ['US', 'IN', 'ID']
+
+
+def scalar_write(cents, out, country_code):
+    formatter = CurrencyFormatter(country_code)
+    for number in cents.tolist():
+        out.write((formatter.format_minor_units(number) + '\n').encode('utf-8'))
+
+
+def main(size=1000000):
+    cents = numpy.random.default_rng(0).integers(-10 ** 11, 10 ** 11, size)
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, 'cents.bin')
+        cents.tofile(input_path)
+        for country_code in CASES:
+            outputs = []
+            for name in ['format_currency_buffer', 'per value write']:
+                output_path = os.path.join(directory, f'{country_code}-{len(outputs)}.txt')
+                start = time.perf_counter()
+                with open(input_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data, open(output_path, 'wb') as out:
+                    if name == 'format_currency_buffer':
+                        format_currency_buffer(data, out, country_code, dtype='int64', minor_units=True)
+                    else:
+                        scalar_write(numpy.frombuffer(data, dtype=numpy.int64), out, country_code)
+                elapsed = time.perf_counter() - start
+                outputs.append(output_path)
+                print(f'{country_code} {name:<24} {elapsed:7.3f} s  {size / elapsed / 1e6:6.2f} M amounts/s')
+            with open(outputs[0], 'rb') as first, open(outputs[1], 'rb') as second:
+                assert first.read() == second.read()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Compare the generic `format_currency` path, a reusable `CurrencyFormatter` and a function compiled by
+`compile_formatter` for the same currency and options, and time compiling every country up front.
+
+Run with `python benchmarks/bench_codegen.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import time
+import timeit
+
+from format_currency import CurrencyFormatter, format_currency
+from format_currency.codegen import compile_all_countries, compile_formatter
+
+CASES = [
+    ('US', {}),
+    ('IN', {}),
+    ('ID', {}),
+    ('CN', {'place_currency_symbol_at_end': True}),
+]
+
+
+def main(number=200000):
+    amount = 1234567.891
+    for country_code, kwargs in CASES:
+        formatter = CurrencyFormatter(country_code, **kwargs)
+        compiled = compile_formatter(country_code, **kwargs)
+        assert compiled(amount) == formatter.format(amount) == format_currency(amount, country_code, **kwargs)
+        for name, function in [
+            ('format_currency', lambda: format_currency(amount, country_code, **kwargs)),
+            ('CurrencyFormatter.format', lambda: formatter.format(amount)),
+            ('compile_formatter', lambda: compiled(amount)),
+        ]:
+            per_call = min(timeit.repeat(function, number=number, repeat=3)) / number
+            print(f'{country_code} {name:<26} {per_call * 1e9:8.0f} ns/call')
+
+    start = time.perf_counter()
+    compiled_countries = compile_all_countries(number_format_system='auto', smart_number_formatting=False)
+    print(f'compile_all_countries: {len(compiled_countries)} functions in {time.perf_counter() - start:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
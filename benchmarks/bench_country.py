@@ -0,0 +1,30 @@
+"""
+Measure the memory of the country registry: the size of one `Country` and the memory allocated to build the
+alpha-2, alpha-3, numeric and currency code indexes from the loaded data.
+
+Run with `python benchmarks/bench_country.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import sys
+import tracemalloc
+
+
+def main():
+    tracemalloc.start()
+    from format_currency import Country
+
+    Country.load_countries_data()
+    before = tracemalloc.get_traced_memory()[0]
+    index = Country.load_countries_index()
+    registry = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    countries = len(index['alpha2'])
+    country = Country.load_country('US')
+    #* count the attribute dict of classes without slots too, to compare with older versions
+    instance = sys.getsizeof(country) + (sys.getsizeof(country.__dict__) if hasattr(country, '__dict__') else 0)
+    print(f'{"Country instance":<24} {instance:8d} bytes')
+    print(f'{"registry":<24} {registry:8d} bytes, {registry / countries:.0f} bytes/country')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Compare the float path with the exact `Decimal`, `int` and integer minor-unit paths of `CurrencyFormatter`.
+
+Run with `python benchmarks/bench_decimal.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import timeit
+from decimal import Decimal
+
+from format_currency import CurrencyFormatter
+
+
+def main(number=200000):
+    for country_code in ('US', 'IN'):
+        formatter = CurrencyFormatter(country_code)
+        cases = [
+            ('float', lambda: formatter.format(1234567.89)),
+            ('int', lambda: formatter.format(1234567)),
+            ('Decimal', lambda: formatter.format(Decimal('1234567.89'))),
+            ('minor units', lambda: formatter.format_minor_units(123456789)),
+            ('Decimal builtin format', lambda: '{:,.2f}'.format(Decimal('1234567.89'))),
+        ]
+        for name, function in cases:
+            per_call = min(timeit.repeat(function, number=number, repeat=3)) / number
+            print(f'{country_code} {name:<24} {per_call * 1e9:8.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+"""
+Compare `format_currency` against a reused `CurrencyFormatter`.
+
+Run with `python benchmarks/bench_formatter.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import timeit
+
+from format_currency import CurrencyFormatter, format_currency
+
+CASES = [
+    ('international', {'country_code': 'US'}),
+    ('indian', {'country_code': 'IN'}),
+    ('chinese', {'country_code': 'CN'}),
+    ('smart', {'country_code': 'US', 'smart_number_formatting': True}),
+]
+
+
+def main(number=200000):
+    amount = 1234567.891
+    for name, options in CASES:
+        formatter = CurrencyFormatter(**options)
+        generic = min(timeit.repeat(lambda: format_currency(amount, **options), number=number, repeat=3)) / number
+        reused = min(timeit.repeat(lambda: formatter.format(amount), number=number, repeat=3)) / number
+        print(f'{name:<14} format_currency {generic * 1e9:8.0f} ns   CurrencyFormatter.format {reused * 1e9:8.0f} ns   x{generic / reused:.1f}')
+
+
+if __name__ == '__main__':
+    main()
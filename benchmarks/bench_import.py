@@ -0,0 +1,77 @@
+"""
+Import time budget, measured with `python -X importtime` in fresh interpreters.
+
+Reports the median cumulative import time of the package for a few entry points, and the modules that took the
+longest, leaving the interpreter startup out. Exits with status 1 when `import format_currency` takes longer than the budget, so it can guard cold starts
+in CI:
+
+    python benchmarks/bench_import.py --budget-ms 5
+
+Run with the package installed or `src` on `PYTHONPATH`.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+SCENARIOS = [
+    ('import format_currency', 'import format_currency'),
+    ('explicit separators', "import format_currency; format_currency.format_currency(1234.5, currency_symbol='$', thousands_separator=',')"),
+    ('country lookup', "import format_currency; format_currency.format_currency(1234.5, 'US')"),
+    ('parse_currency', "import format_currency; format_currency.parse_currency('$ 1,234.50')"),
+]
+
+
+def import_times(code):
+    """
+    Run `code` with `-X importtime`.
+
+    Returns:
+    - tuple of (float, list): Milliseconds spent in the imports `code` triggered, interpreter startup left out, and
+      (self microseconds, module) of each of those modules.
+    """
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC_PATH, environment.get('PYTHONPATH')]))
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=environment, check=True,
+                            capture_output=True, text=True).stderr
+    total, modules, started = 0, [], False
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative, module = line[len('import time:'):].split('|')
+        #* nested imports are indented, top level ones are what the interpreter or `code` imported directly
+        top_level = not module[1:].startswith(' ')
+        started = started or module.strip() == 'format_currency'
+        if started:
+            modules.append((int(self_time), module.strip()))
+            if top_level:
+                total += int(cumulative)
+    return total / 1000, modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure the import time of format_currency.')
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--budget-ms', type=float, default=None, help='Fail when `import format_currency` takes longer.')
+    parser.add_argument('--top', type=int, default=8, help='Show the modules with the most self time.')
+    args = parser.parse_args(argv)
+
+    medians = {}
+    for name, code in SCENARIOS:
+        samples = [import_times(code) for _ in range(args.repeat)]
+        medians[name] = statistics.median(total for total, modules in samples)
+        print(f'{name:<24} {medians[name]:8.2f} ms')
+        slowest = sorted(samples[-1][1], reverse=True)[:args.top]
+        print('    ' + ', '.join(f'{module} {self_time / 1000:.2f}' for self_time, module in slowest))
+
+    if args.budget_ms is not None and medians['import format_currency'] > args.budget_ms:
+        print(f"import format_currency took {medians['import format_currency']:.2f} ms, over the {args.budget_ms} ms budget")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
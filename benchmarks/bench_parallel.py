@@ -0,0 +1,35 @@
+"""
+Throughput of `format_currency_parallel` from 1 to N worker processes.
+
+Run with `python benchmarks/bench_parallel.py [size]` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import array
+import os
+import random
+import sys
+import time
+
+from format_currency import format_currency_parallel
+from format_currency.parallel import create_executor
+
+
+def main(size=2000000, chunk_size=100000):
+    random.seed(0)
+    numbers = array.array('d', (random.uniform(-1e9, 1e9) for _ in range(size)))
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+    baseline = None
+    for workers in worker_counts:
+        with create_executor(workers) as executor:
+            #* warm the pool so process start-up is not measured
+            format_currency_parallel(numbers[:workers * 10], 'IN', chunk_size=10, executor=executor)
+            started = time.perf_counter()
+            format_currency_parallel(numbers, 'IN', chunk_size=chunk_size, executor=executor)
+            elapsed = time.perf_counter() - started
+        baseline = baseline or elapsed
+        print(f'workers={workers:<3} {size / elapsed / 1e6:6.2f} M numbers/s  speedup x{baseline / elapsed:.2f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000000)
@@ -0,0 +1,40 @@
+"""
+Compare `CurrencyParser` with a one-shot `parse_currency` call and an ad-hoc regex parser.
+
+Run with `python benchmarks/bench_parse.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import re
+import timeit
+from decimal import Decimal
+
+from format_currency import CurrencyParser, format_currency_many, parse_currency
+
+
+def parse_ad_hoc(text):
+    #* the kind of parser this replaces, a fresh pattern per call and separators guessed from the text
+    match = re.search(r'(-?[\d.,\s]+)', text)
+    number = match.group(1).strip()
+    if re.search(r',\d{2}$', number):
+        number = number.replace('.', '').replace(' ', '').replace(',', '.')
+    else:
+        number = number.replace(',', '').replace(' ', '')
+    return Decimal(number)
+
+
+def main(size=100000):
+    texts = format_currency_many([index * 1.37 for index in range(size)], 'ID')
+    parser = CurrencyParser('ID')
+    cases = [
+        ('CurrencyParser.parse_many', lambda: parser.parse_many(texts)),
+        ('CurrencyParser.parse', lambda: [parser.parse(text) for text in texts]),
+        ('parse_currency', lambda: [parse_currency(text, 'ID') for text in texts]),
+        ('parse_currency, detected', lambda: [parse_currency(text) for text in texts]),
+        ('ad-hoc regex', lambda: [parse_ad_hoc(text) for text in texts]),
+    ]
+    for name, function in cases:
+        per_value = min(timeit.repeat(function, number=1, repeat=3)) / size
+        print(f'{name:<28} {per_value * 1e9:8.0f} ns/value')
+
+
+if __name__ == '__main__':
+    main()
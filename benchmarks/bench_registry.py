@@ -0,0 +1,55 @@
+"""
+Time registering a currency and reloading the countries data, against a cold start, and the formatting throughput
+of a thread while another one keeps reloading the data.
+
+Run with `python benchmarks/bench_registry.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import threading
+import time
+import timeit
+
+from format_currency import Country, format_currency, register_currency, reload_countries, unregister_currency
+
+
+def formatting_rate(seconds, reloading):
+    stop = threading.Event()
+    count = 0
+
+    def reload_loop():
+        while not stop.is_set():
+            reload_countries()
+
+    reloader = threading.Thread(target=reload_loop) if reloading else None
+    if reloader is not None:
+        reloader.start()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        format_currency(1234567.891, 'IN')
+        count += 1
+    stop.set()
+    if reloader is not None:
+        reloader.join()
+    return count / seconds
+
+
+def main(number=20):
+    def cold_start():
+        Country.clear_cache()
+        format_currency(1, 'US')
+
+    for name, function in [
+        ('cold start (clear_cache + format)', cold_start),
+        ('reload_countries', reload_countries),
+        ('register_currency', lambda: register_currency('BTC', '₿', decimal_places=8)),
+    ]:
+        per_call = min(timeit.repeat(function, number=number, repeat=3)) / number
+        print(f'{name:<36} {per_call * 1e3:8.2f} ms')
+    unregister_currency('BTC')
+
+    for reloading in (False, True):
+        label = 'format_currency, reloads running' if reloading else 'format_currency'
+        print(f'{label:<36} {formatting_rate(1.0, reloading) / 1e3:8.0f} k calls/s')
+
+
+if __name__ == '__main__':
+    main()
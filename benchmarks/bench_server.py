@@ -0,0 +1,105 @@
+"""
+Load generator for the formatting daemon: many concurrent clients, each sending one request at a time, report the
+p50/p99 latency and the throughput. Also times a fresh `python -c` process per format, the cost the daemon avoids.
+
+Run with `python benchmarks/bench_server.py` (with the package installed or `src` on `PYTHONPATH`). Pass `--path` to
+load a Unix socket, or `--host`/`--port` to load a daemon that is already running.
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+REQUESTS = [
+    b'USD 1234.5\n',
+    b'IN 12345678.905 -42\n',
+    b'IDR 1234567.891\n',
+    b'country_code=US&smart_number_formatting=1 98765432.1\n',
+    b'CNY 1 2 3 4 5 6 7 8 9 10\n',
+]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_daemon(args):
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC_PATH, environment.get('PYTHONPATH')]))
+    address = ['--unix', args.path] if args.path else ['--port', str(args.port)]
+    process = subprocess.Popen([sys.executable, '-m', 'format_currency', 'serve'] + address + ['--batch-delay', str(args.batch_delay)],
+                               env=environment, stderr=subprocess.PIPE)
+    #* the daemon reports its address once it listens
+    process.stderr.readline()
+    return process
+
+
+async def run_client(connect, deadline, latencies):
+    reader, writer = await connect()
+    request_random = random.Random(len(latencies))
+    while time.perf_counter() < deadline:
+        request = request_random.choice(REQUESTS)
+        start = time.perf_counter()
+        writer.write(request)
+        line = await reader.readline()
+        latencies.append(time.perf_counter() - start)
+        assert line.startswith(b'+'), line
+    writer.close()
+
+
+async def generate_load(args, clients):
+    if args.path:
+        connect = lambda: asyncio.open_unix_connection(args.path)
+    else:
+        connect = lambda: asyncio.open_connection(args.host, args.port)
+    latencies = []
+    deadline = time.perf_counter() + args.seconds
+    await asyncio.gather(*[run_client(connect, deadline, latencies) for _ in range(clients)])
+    return latencies
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None, help='Load a running daemon on this port.')
+    parser.add_argument('--path', default=None, help='Unix socket path, a daemon is started on it.')
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 16, 64])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--batch-delay', type=float, default=0.0, help='Milliseconds, passed to the started daemon.')
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.port is None or args.path:
+        if args.port is None:
+            args.port = free_port()
+        process = start_daemon(args)
+    try:
+        for clients in args.clients:
+            latencies = sorted(asyncio.run(generate_load(args, clients)))
+            print(f'{clients:4} clients  {len(latencies) / args.seconds:9.0f} requests/s  '
+                  f'p50 {percentile(latencies, 0.5) * 1e6:7.0f} us  p99 {percentile(latencies, 0.99) * 1e6:7.0f} us')
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    environment = dict(os.environ, PYTHONPATH=SRC_PATH)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', "import format_currency; print(format_currency.format_currency(1234.5, 'US'))"],
+                   env=environment, check=True, capture_output=True)
+    print(f'process per format       {(time.perf_counter() - start) * 1e3:9.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare smart number formatting through `CurrencyFormatter` with walking the units dict on a formatted string, and
+a unit per value with one shared unit for a whole series.
+
+Run with `python benchmarks/bench_smart.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import random
+import timeit
+
+from format_currency import CurrencyFormatter, format_currency_series
+from format_currency.format import smart_format_numbering_system_according_to_supplied_units
+from format_currency.smart_units import INTERNATIONAL_SMART_UNITS
+
+
+def main(number=200000):
+    for country_code in ('US', 'IN', 'CN'):
+        formatter = CurrencyFormatter(country_code, smart_number_formatting=True)
+        per_call = min(timeit.repeat(lambda: formatter.format(12345678.91), number=number, repeat=3)) / number
+        print(f'{country_code} {"CurrencyFormatter.format":<36} {per_call * 1e9:8.0f} ns')
+
+    #* the previous pipeline: format with commas, re-parse with float() and walk the units dict
+    legacy = lambda: '$ ' + ' '.join(smart_format_numbering_system_according_to_supplied_units('{:,.2f}'.format(12345678.91), INTERNATIONAL_SMART_UNITS))
+    per_call = min(timeit.repeat(legacy, number=number, repeat=3)) / number
+    print(f'US {"units dict walk on a string":<36} {per_call * 1e9:8.0f} ns')
+
+    random.seed(0)
+    series = [random.uniform(-1e9, 1e9) for _ in range(100000)]
+    for country_code in ('US', 'IN', 'CN'):
+        formatter = CurrencyFormatter(country_code, smart_number_formatting=True)
+        for name, function in [
+            ('format_many, unit per value', lambda: formatter.format_many(series)),
+            ('format_currency_series, max', lambda: format_currency_series(series, country_code)),
+            ('format_currency_series, median', lambda: format_currency_series(series, country_code, unit='median')),
+        ]:
+            per_item = min(timeit.repeat(function, number=1, repeat=3)) / len(series)
+            print(f'{country_code} {name:<36} {per_item * 1e9:8.0f} ns/item')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""
+Compare currency detection in log lines: the `SymbolIndex` automaton against scanning for every symbol in turn and
+against a regex alternation of all symbols.
+
+Run with `python benchmarks/bench_symbols.py` (with the package installed or `src` on `PYTHONPATH`).
+"""
+import re
+import timeit
+
+from format_currency.symbols import get_symbol_index, load_symbol_currencies
+
+LINES = [
+    '2024-01-01 12:00:00 INFO payment id=123456 user=alice amount=$ 1,234.50 status=ok',
+    '2024-01-01 12:00:01 INFO refund id=123457 user=bob amount=Rp 1.234.567,89 currency=IDR',
+    '2024-01-01 12:00:02 WARN retry id=123458 user=carol amount=12,34,567.89 ₹ attempt=2',
+    '2024-01-01 12:00:03 INFO transfer id=123459 from=dave to=erin note="no amount"',
+]
+
+
+def scan_each_symbol(line, symbols):
+    #* what a scan over the countries data does, one substring search per symbol
+    return sorted((line.find(symbol), symbol) for symbol in symbols if symbol in line)
+
+
+def main(number=20000):
+    symbol_index = get_symbol_index()
+    symbols = list(load_symbol_currencies())
+    alternation = re.compile('|'.join(re.escape(symbol) for symbol in sorted(symbols, key=len, reverse=True)))
+    cases = [
+        ('SymbolIndex.find', lambda: [symbol_index.find(line) for line in LINES]),
+        ('one search per symbol', lambda: [scan_each_symbol(line, symbols) for line in LINES]),
+        ('regex alternation', lambda: [alternation.findall(line) for line in LINES]),
+    ]
+    for name, function in cases:
+        per_line = min(timeit.repeat(function, number=number, repeat=3)) / number / len(LINES)
+        print(f'{name:<24} {per_line * 1e9:8.0f} ns/line')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+Warm country lookups and `format_currency` calls from an increasing number of threads.
+
+Warm reads take no lock, so the time per call should stay flat as threads are added (the GIL still serializes the
+work, so total throughput does not grow either). Run with `python benchmarks/bench_threads.py`.
+"""
+import threading
+import time
+
+from format_currency import Country, format_currency
+
+CODES = ['US', 'ID', 'IN', 'CN', 'DE', 'JP', 'BH', 'BR']
+
+
+def run(thread_count, function, calls_per_thread):
+    barrier = threading.Barrier(thread_count + 1)
+
+    def worker():
+        barrier.wait()
+        for index in range(calls_per_thread):
+            function(CODES[index % len(CODES)])
+
+    threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+    return (time.perf_counter() - started) / (thread_count * calls_per_thread)
+
+
+def main(calls_per_thread=50000):
+    format_currency(1, 'US')
+    for name, function in (('load_country', Country.load_country), ('format_currency', lambda code: format_currency(1234.5, code))):
+        for thread_count in (1, 2, 4, 8, 16):
+            per_call = run(thread_count, function, calls_per_thread)
+            print(f'{name:<16} threads={thread_count:<3} {per_call * 1e9:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    main()
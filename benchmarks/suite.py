@@ -0,0 +1,264 @@
+"""
+Benchmark suite and performance regression gate.
+
+Run the suite and save the results as JSON, then compare two result files, e.g. from two commits:
+
+    python benchmarks/suite.py run --output before.json
+    python benchmarks/suite.py run --output after.json
+    python benchmarks/suite.py compare before.json after.json --threshold 0.1
+
+`compare` exits with status 1 when a benchmark got slower by more than the threshold (a fraction, 0.1 is 10%).
+`gate` times the scalar `format_currency` calls of a git ref, e.g. the last release, and of the working tree in the
+same run, and fails the same way:
+
+    python benchmarks/suite.py gate main --threshold 0.1
+
+Also available as `hatch run bench:run`, `hatch run bench:compare` and `hatch run bench:gate`.
+"""
+import argparse
+import datetime
+import io
+import json
+import locale
+import os
+import platform
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+
+REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_PATH = os.path.join(REPO_PATH, 'src')
+
+BATCH_SIZES = [1, 10, 100, 1000, 10000, 100000, 1000000]
+
+# Imports the package in a fresh interpreter and formats once, printing the elapsed seconds
+COLD_START_SCRIPT = '''
+import time
+start = time.perf_counter()
+import format_currency
+format_currency.format_currency(1234567.891, 'US')
+print(time.perf_counter() - start)
+'''
+
+
+def cold_start_benchmark(repeat):
+    """Time a cold import plus the first lookup, each sample in a new interpreter"""
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC_PATH, environment.get('PYTHONPATH')]))
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', COLD_START_SCRIPT], env=environment, check=True,
+                                capture_output=True, text=True).stdout
+        samples.append(float(output))
+    return samples
+
+
+# Scalar `format_currency` calls, name -> (arguments after the amount, keyword arguments). They only use the original
+# API, so `gate` can time them on earlier commits too
+SCALAR_CASES = {
+    'format_currency.international': (('US',), {}),
+    'format_currency.indian': (('IN',), {}),
+    'format_currency.chinese': (('CN',), {}),
+    'format_currency.translated': (('ID',), {}),
+    'format_currency.none': (('US',), {'number_format_system': 'none'}),
+    'format_currency.smart.international': (('US',), {'smart_number_formatting': True}),
+    'format_currency.smart.indian': (('IN',), {'smart_number_formatting': True}),
+    'format_currency.smart.chinese': (('CN',), {'smart_number_formatting': True}),
+    'format_currency.use_current_locale': (('US',), {'use_current_locale': True}),
+    'format_currency.unknown_country_code': (('XX',), {}),
+    'format_currency.unknown_currency_code': ((), {'currency_code': 'XXX'}),
+}
+
+
+def scalar_benchmarks():
+    """The `SCALAR_CASES` of the `format_currency` found first on `sys.path`, name -> (function, 1)"""
+    from format_currency import format_currency
+
+    amount = 1234567.891
+    #* warm the country tables and the locale snapshot
+    format_currency(amount, 'US', use_current_locale=True)
+    return {
+        name: (lambda args=args, kwargs=kwargs: format_currency(amount, *args, **kwargs), 1)
+        for name, (args, kwargs) in SCALAR_CASES.items()
+    }
+
+
+def warm_benchmarks():
+    """Benchmarks of a warm process, name -> (function, number of items it formats)"""
+    from format_currency import CurrencyFormatter, compile_formatter, format_currency_many
+
+    amount = 1234567.891
+    benchmarks = scalar_benchmarks()
+
+    for country_code, name in [('US', 'international'), ('IN', 'indian'), ('ID', 'translated')]:
+        benchmarks[f'compile_formatter.{name}'] = (lambda compiled=compile_formatter(country_code): compiled(amount), 1)
+
+    formatter = CurrencyFormatter('US')
+    for size in BATCH_SIZES:
+        numbers = [index * 1.37 for index in range(size)]
+        benchmarks[f'format_currency_many.{size}'] = (lambda numbers=numbers: format_currency_many(numbers, 'US'), size)
+        benchmarks[f'CurrencyFormatter.format_many.{size}'] = (lambda numbers=numbers: formatter.format_many(numbers), size)
+    return benchmarks
+
+
+def measure(function, repeat):
+    """Seconds per call of each sample, sized by `timeit.Timer.autorange` to take at least 0.2 seconds"""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+
+
+def run(selected=None, repeat=5, cold_repeat=10):
+    """Run the benchmarks whose name contains one of `selected`, all of them by default"""
+    def wanted(name):
+        return not selected or any(pattern in name for pattern in selected)
+
+    results = {}
+    if wanted('cold_import.first_lookup'):
+        samples = cold_start_benchmark(cold_repeat)
+        results['cold_import.first_lookup'] = {'seconds': min(samples), 'per_item': min(samples), 'items': 1, 'samples': samples}
+
+    for name, (function, items) in warm_benchmarks().items():
+        if not wanted(name):
+            continue
+        samples = measure(function, repeat)
+        results[name] = {'seconds': min(samples), 'per_item': min(samples) / items, 'items': items, 'samples': samples}
+        print(f'{name:<44} {min(samples) / items * 1e9:12.0f} ns/item', file=sys.stderr)
+    return results
+
+
+def run_scalar(src_path, repeat):
+    """Time the `SCALAR_CASES` of the package in `src_path`, in a new interpreter"""
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = src_path
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), 'scalar', '--repeat', str(repeat)],
+                            env=environment, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def gate(ref, threshold, repeat=5):
+    """
+    Time the scalar `format_currency` calls of the git `ref` and of the working tree, and compare them.
+
+    Returns:
+    - tuple of (list, list): See `compare`, with the results of `ref` as before.
+    """
+    archive = subprocess.run(['git', 'archive', ref, 'src'], check=True, capture_output=True, cwd=REPO_PATH).stdout
+    with tempfile.TemporaryDirectory() as directory:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as f:
+            f.extractall(directory)
+        before = run_scalar(os.path.join(directory, 'src'), repeat)
+    after = run_scalar(SRC_PATH, repeat)
+    return compare({'benchmarks': before}, {'benchmarks': after}, threshold)
+
+
+def environment_metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], check=True, capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'date': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'locale': locale.setlocale(locale.LC_MONETARY),
+    }
+
+
+def compare(before, after, threshold):
+    """
+    Compare two result dicts, benchmark by benchmark.
+
+    Returns:
+    - tuple of (list, list): Rows of `(name, before, after, ratio)` for the benchmarks in both, and the names of
+      those whose time per item grew by more than `threshold`.
+    """
+    rows = []
+    regressions = []
+    for name, result in after['benchmarks'].items():
+        previous = before['benchmarks'].get(name, None)
+        if previous is None:
+            continue
+        ratio = result['per_item'] / previous['per_item']
+        rows.append((name, previous['per_item'], result['per_item'], ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='benchmarks/suite.py', description='Benchmark format_currency and compare results.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='Run the benchmarks.')
+    run_parser.add_argument('-o', '--output', help='Write the results as JSON to this file.')
+    run_parser.add_argument('-k', '--select', action='append', metavar='PATTERN', help='Only run benchmarks whose name contains PATTERN. Can be repeated.')
+    run_parser.add_argument('--repeat', type=int, default=5, help='Samples per benchmark, the fastest is kept (default: %(default)s).')
+    run_parser.add_argument('--cold-repeat', type=int, default=10, help='Interpreters started for the cold import benchmark (default: %(default)s).')
+
+    compare_parser = commands.add_parser('compare', help='Compare two result files, fail on regressions.')
+    compare_parser.add_argument('before', help='Baseline results.')
+    compare_parser.add_argument('after', help='New results.')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown as a fraction (default: %(default)s).')
+
+    gate_parser = commands.add_parser('gate', help='Compare scalar format_currency with a git ref, fail on regressions.')
+    gate_parser.add_argument('ref', help='The git ref to compare with, e.g. the last release.')
+    gate_parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown as a fraction (default: %(default)s).')
+    gate_parser.add_argument('--repeat', type=int, default=5, help='Samples per benchmark, the fastest is kept (default: %(default)s).')
+
+    #* used by `gate`, times the package on PYTHONPATH instead of the working tree
+    scalar_parser = commands.add_parser('scalar')
+    scalar_parser.add_argument('--repeat', type=int, default=5)
+    return parser
+
+
+def print_comparison(rows, regressions, threshold):
+    for name, previous, current, ratio in rows:
+        marker = '  REGRESSION' if name in regressions else ''
+        print(f'{name:<44} {previous * 1e9:12.0f} ns {current * 1e9:12.0f} ns {ratio:7.2f}x{marker}')
+    if regressions:
+        print(f'{len(regressions)} benchmark(s) slower by more than {threshold:.0%}', file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.command == 'run':
+        sys.path.insert(0, SRC_PATH)
+        results = {'metadata': environment_metadata(), 'benchmarks': run(args.select, args.repeat, args.cold_repeat)}
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+        else:
+            json.dump(results, sys.stdout, indent=2)
+        return 0
+    if args.command == 'scalar':
+        results = {}
+        for name, (function, items) in scalar_benchmarks().items():
+            results[name] = {'seconds': min(measure(function, args.repeat)), 'items': items}
+            results[name]['per_item'] = results[name]['seconds'] / items
+        json.dump(results, sys.stdout)
+        return 0
+    if args.command == 'gate':
+        rows, regressions = gate(args.ref, args.threshold, args.repeat)
+        return print_comparison(rows, regressions, args.threshold)
+
+    with open(args.before, encoding='utf-8') as f:
+        before = json.load(f)
+    with open(args.after, encoding='utf-8') as f:
+        after = json.load(f)
+    rows, regressions = compare(before, after, args.threshold)
+    return print_comparison(rows, regressions, args.threshold)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,5 +2,67 @@
 #
 # SPDX-License-Identifier: MIT
 
-from .country import *
-from .format import *
+#* public names are imported from their submodule on first access, so `import format_currency` stays cheap
+
+# Public name -> submodule defining it
+_lazy_names = {
+    'Country': 'country',
+    'CurrencyFormatter': 'format',
+    'format_currency': 'format',
+    'format_currency_many': 'format',
+    'format_currency_minor_units': 'format',
+    'format_currency_series': 'format',
+    'format_india_numbering_system': 'format',
+    'format_china_numbering_system': 'format',
+    'smart_format_india_numbering_system': 'format',
+    'smart_format_international_numbering_system': 'format',
+    'smart_format_chinese_numbering_system': 'format',
+    'smart_format_numbering_system_according_to_supplied_units': 'format',
+    'SmartUnitTable': 'smart_units',
+    'register_unit_table': 'smart_units',
+    'LocaleSnapshot': 'locale_snapshot',
+    'CurrencyParser': 'parse',
+    'ParsedCurrency': 'parse',
+    'parse_currency': 'parse',
+    'parse_currency_many': 'parse',
+    'SymbolIndex': 'symbols',
+    'SymbolMatch': 'symbols',
+    'detect_currency': 'symbols',
+    'find_currencies': 'symbols',
+    'register_currency': 'registry',
+    'reload_countries': 'registry',
+    'unregister_currency': 'registry',
+    'clear_format_cache': 'cache',
+    'disable_format_cache': 'cache',
+    'enable_format_cache': 'cache',
+    'format_cache_info': 'cache',
+    'compile_all_countries': 'codegen',
+    'compile_formatter': 'codegen',
+    'disable_instrumentation': 'instrumentation',
+    'enable_instrumentation': 'instrumentation',
+    'reset_stats': 'instrumentation',
+    'stats': 'instrumentation',
+    'format_currency_parallel': 'parallel',
+    'format_currency_column': 'dataframe',
+    'format_currency_buffer': 'buffers',
+    'format_currency_async': 'aio',
+    'format_currency_many_async': 'aio',
+    'preload': 'aio',
+}
+
+__all__ = list(_lazy_names)
+
+
+def __getattr__(name):
+    module_name = _lazy_names.get(name, None)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    #* `__import__` with a fromlist returns the submodule itself, without loading `importlib`
+    value = getattr(__import__(__name__ + '.' + module_name, None, None, [name]), name)
+    #* later lookups find it without calling this again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
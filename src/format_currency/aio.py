@@ -0,0 +1,85 @@
+"""asyncio friendly formatting, keeping data loading and large batches from blocking the event loop"""
+import asyncio
+import functools
+
+from . import cache as cache_module
+from . import country as country_module
+from .country import Country
+from .format import format_currency
+from .parallel import RESULT_SEPARATOR, format_chunk, iter_chunks
+
+
+def load_data(flags=False):
+    Country.load_countries_index()
+    if flags:
+        Country.load_flags_data()
+
+
+async def preload(flags=False, executor=None):
+    """
+    Loads the countries data in an executor, so the first format doesn't read and parse it on the event loop.
+
+    Parameters:
+    - flags (bool, optional): Also load the flags data. Defaults to False.
+    - executor (concurrent.futures.Executor, optional): Where to load the data. Defaults to the loop's default
+      executor.
+
+    Example:
+        >>> @app.on_event('startup')
+        ... async def startup():
+        ...     await preload()
+    """
+    if country_module.cached_countries_index is not None and (not flags or country_module.cached_flags_data is not None):
+        return
+    await asyncio.get_running_loop().run_in_executor(executor, load_data, flags)
+
+
+async def format_currency_async(number, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, **kwargs):
+    """
+    Formats a number as `format_currency` does, loading the countries data off the event loop on first use.
+
+    Accepts the same parameters as `format_currency`.
+    """
+    await preload()
+    #* formatters and results come from the same caches as `format_currency`
+    return format_currency(number, country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale, **kwargs)
+
+
+async def format_currency_many_async(numbers, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, chunk_size=1000, executor=None, **kwargs):
+    """
+    Formats a batch of numbers as currency strings without holding the event loop for the whole batch.
+
+    Accepts the same parameters as `format_currency_many`, plus:
+    - chunk_size (int, optional): Numbers formatted at a time. Defaults to 1000, about a millisecond of work.
+    - executor (concurrent.futures.Executor, optional): A thread or process pool (e.g. from
+      `format_currency.parallel.create_executor`) to format the chunks in. Defaults to None, formatting the chunks on
+      the event loop and yielding to other tasks between them.
+
+    Returns:
+    - list of str: The formatted currency strings, in input order.
+
+    Notes:
+    - Options are validated before any chunk is formatted, so invalid arguments raise right away.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    await preload()
+    formatter_args = (country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale)
+    formatter = cache_module.get_formatter(formatter_args, kwargs)
+
+    if executor is None:
+        result = []
+        for chunk in iter_chunks(numbers, chunk_size):
+            result.extend(formatter.format_many(chunk))
+            #* let other tasks run between chunks
+            await asyncio.sleep(0)
+        return result
+
+    loop = asyncio.get_running_loop()
+    #* the formatter and its options travel to process pool workers the same way as in `format_currency_parallel`
+    options = (formatter_args, tuple(sorted(kwargs.items())))
+    futures = [loop.run_in_executor(executor, functools.partial(format_chunk, options, chunk)) for chunk in iter_chunks(numbers, chunk_size)]
+    result = []
+    for formatted in await asyncio.gather(*futures):
+        result.extend(formatted.split(RESULT_SEPARATOR))
+    return result
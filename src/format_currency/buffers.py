@@ -0,0 +1,106 @@
+"""Bulk formatting of binary columns, such as memory-mapped int64 or float64 files, straight into UTF-8 bytes"""
+
+from . import vectorized
+from .format import CurrencyFormatter
+
+# Values read, formatted and written at a time
+BLOCK_SIZE = vectorized.CHUNK_SIZE * 16
+
+
+def buffer_array(numbers, dtype):
+    """View a buffer as a one-dimensional NumPy array without copying it"""
+    np = vectorized.load_numpy()
+    if hasattr(numbers, '__array_interface__') and dtype is None:
+        return np.asarray(numbers).ravel()
+    view = memoryview(numbers)
+    if dtype is None:
+        if view.format in ('B', 'b', 'c'):
+            raise TypeError('Untyped buffers such as bytes or mmap need a dtype, e.g. dtype="int64" or dtype="float64"')
+        dtype = view.format
+    return np.frombuffer(view.cast('B'), dtype=np.dtype(dtype))
+
+
+def iter_python_blocks(numbers, dtype):
+    """Blocks of Python numbers, for when NumPy is not installed"""
+    view = memoryview(numbers)
+    if dtype is not None or view.format in ('B', 'b', 'c'):
+        if dtype is None:
+            raise TypeError('Untyped buffers such as bytes or mmap need a dtype, e.g. dtype="int64" or dtype="float64"')
+        typecode = {'int64': 'q', 'float64': 'd'}.get(str(dtype), str(dtype))
+        view = view.cast('B').cast(typecode)
+    for begin in range(0, len(view), BLOCK_SIZE):
+        yield view[begin:begin + BLOCK_SIZE].tolist()
+
+
+def iter_formatted_bytes(formatter, numbers, dtype, minor_units, delimiter):
+    """Yield the formatted output in pieces of UTF-8 bytes"""
+    scalar = formatter.format_minor_units if minor_units else formatter.format
+    np = vectorized.load_numpy()
+    if np is None:
+        for block in iter_python_blocks(numbers, dtype):
+            yield ''.join([scalar(number) + delimiter for number in block]).encode('utf-8')
+        return
+
+    values = buffer_array(numbers, dtype)
+    if minor_units and values.dtype.kind not in 'iu':
+        raise TypeError(f'Minor units must be integers, got an array of {values.dtype}')
+    for begin in range(0, len(values), BLOCK_SIZE):
+        block = values[begin:begin + BLOCK_SIZE]
+        if formatter._smart:
+            split = None
+        elif minor_units:
+            split = vectorized.split_minor_units(block, formatter.decimal_places, formatter.minor_unit_places)
+        else:
+            split = vectorized.split_numbers(block, formatter.decimal_places)
+        if split is None:
+            #* smart formatting and unsupported dtypes go through the scalar path
+            yield ''.join([scalar(number) + delimiter for number in block.tolist()]).encode('utf-8')
+            continue
+        yield from vectorized.iter_utf8_chunks(split, block, formatter.decimal_places, formatter.grouping, formatter.thousands_separator,
+                                               formatter.decimal_separator, formatter._prefix, formatter._suffix, delimiter, scalar)
+
+
+def format_currency_buffer(numbers, out=None, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, dtype=None, minor_units=False, delimiter='\n', **kwargs):
+    """
+    Formats a binary column of amounts into delimited UTF-8 bytes, without a Python object per amount.
+
+    Accepts the same formatting parameters as `format_currency_many`, plus:
+    - numbers: Any buffer, e.g. a NumPy array, `array.array`, `memoryview`, `bytes` or `mmap.mmap`, holding int64 or
+      float64 values in native byte order.
+    - out (optional): A `bytearray` to append to, or a binary file or writable `mmap.mmap` to write to at its
+      current position. Defaults to None, returning the bytes.
+    - dtype (str, optional): The type of the values, e.g. `'int64'` or `'float64'`. Needed for untyped buffers
+      such as `bytes` and `mmap`, typed buffers default to their own type.
+    - minor_units (bool, optional): The values are integer minor units (e.g. cents), as in
+      `format_currency_minor_units`. Defaults to False.
+    - delimiter (str, optional): Written after every amount. Defaults to a newline.
+
+    Returns:
+    - bytes when `out` is None, otherwise the number of bytes written.
+
+    Example:
+        >>> with open('cents.bin', 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as cents:
+        ...     with open('statement.txt', 'wb') as out:
+        ...         format_currency_buffer(cents, out, currency_code='USD', dtype='int64', minor_units=True)
+
+    Notes:
+    - The output is identical to `format_currency` (or `format_currency_minor_units`) on each value, encoded as
+      UTF-8 and joined with the delimiter.
+    - With NumPy installed the digits, separators and symbol are laid out in arrays and encoded in bulk. Smart
+      formatting, and everything without NumPy, goes through the scalar formatter.
+    """
+    formatter = CurrencyFormatter(country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale, **kwargs)
+    pieces = iter_formatted_bytes(formatter, numbers, dtype, minor_units, delimiter)
+    if out is None:
+        return b''.join(pieces)
+
+    written = 0
+    if isinstance(out, bytearray):
+        for piece in pieces:
+            out += piece
+            written += len(piece)
+    else:
+        for piece in pieces:
+            out.write(piece)
+            written += len(piece)
+    return written
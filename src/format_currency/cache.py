@@ -0,0 +1,181 @@
+"""Memoization of formatters, and optionally of formatted results for workloads repeating the same amounts"""
+import collections
+import threading
+
+from . import country as country_module
+from . import format as format_module
+from . import smart_units
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LRUCache():
+    """
+    Bounded, thread safe mapping that evicts the least recently used entry when full.
+
+    Parameters:
+    - maxsize (int): The maximum number of entries, must be positive.
+    """
+    def __init__(self, maxsize):
+        super().__init__()
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be positive. Got {maxsize}.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._entries.get(key, default)
+            if value is default:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+
+# The caches in use while enabled, None while disabled
+result_cache = None
+formatter_cache = None
+
+# Formatters of the `format_currency*` functions while `enable_format_cache` is off, so calls repeating the same
+# options resolve them once. A plain dict cleared when full, its operations are atomic so lookups take no lock
+resolved_formatters = {}
+MAX_RESOLVED_FORMATTERS = 128
+
+
+def options_key(options, kwargs):
+    """
+    Normalized key of the formatting options.
+
+    `options` are the positional parameters of `format_currency` after the number. Includes the versions of the smart
+    unit tables and of the countries data, and with `use_current_locale` the LC_MONETARY locale name, so results are
+    not reused after a table or currency is registered, or `locale.setlocale` switches locale.
+    """
+    #* an explicit `locale_snapshot` is part of the kwargs already
+    locale_name = None
+    if options[5] and kwargs.get('locale_snapshot', None) is None:
+        import locale
+        locale_name = locale.setlocale(locale.LC_MONETARY)
+    return (options, tuple(sorted(kwargs.items())) if kwargs else (), locale_name, smart_units.unit_tables_version, country_module.countries_data_version)
+
+
+def get_formatter(options, kwargs):
+    """The cached formatter of these options, created on a miss"""
+    cache = formatter_cache
+    if cache is None:
+        return resolved_formatter(options, kwargs)
+    try:
+        key = options_key(options, kwargs)
+        formatter = cache.get(key, None)
+    except TypeError:
+        #* unhashable options, e.g. a list as `decimal_places`, let the formatter raise or handle them
+        return format_module.CurrencyFormatter(*options, **kwargs)
+    if formatter is None:
+        formatter = format_module.CurrencyFormatter(*options, **kwargs)
+        cache.put(key, formatter)
+    return formatter
+
+
+def resolved_formatter(options, kwargs):
+    """The formatter of these options from `resolved_formatters`, created on a miss"""
+    try:
+        key = options_key(options, kwargs)
+        formatter = resolved_formatters.get(key, None)
+    except TypeError:
+        return format_module.CurrencyFormatter(*options, **kwargs)
+    if formatter is None:
+        formatter = format_module.CurrencyFormatter(*options, **kwargs)
+        if len(resolved_formatters) >= MAX_RESOLVED_FORMATTERS:
+            resolved_formatters.clear()
+        resolved_formatters[key] = formatter
+    return formatter
+
+
+def cached_format(number, options, kwargs):
+    """`format_currency` through the result cache, used in its place while the cache is enabled"""
+    cache = result_cache
+    if not number or cache is None:
+        #* zero isn't worth caching, and -0.0 equals 0.0 while it formats differently
+        return get_formatter(options, kwargs).format(number)
+    try:
+        key = (type(number), number, options_key(options, kwargs))
+        formatted = cache.get(key, None)
+    except TypeError:
+        return get_formatter(options, kwargs).format(number)
+    if formatted is None:
+        formatted = get_formatter(options, kwargs).format(number)
+        cache.put(key, formatted)
+    return formatted
+
+
+def enable_format_cache(maxsize=4096, formatters_maxsize=256):
+    """
+    Memoize formatted results of `format_currency`, and formatters of all `format_currency*` functions.
+
+    Parameters:
+    - maxsize (int, optional): The number of formatted results to keep, 0 to only cache formatters. Defaults to 4096.
+    - formatters_maxsize (int, optional): The number of formatters to keep. Defaults to 256.
+
+    Notes:
+    - Results are keyed by the type and value of the number and all options, so `1`, `1.0` and `Decimal('1')` are
+      cached separately. Enabling again replaces the caches with empty ones.
+    - Results of `use_current_locale` are keyed by the current LC_MONETARY locale, and results of smart formatting
+      by the version of the registered unit tables, so a cached result is never stale.
+    """
+    global result_cache, formatter_cache
+
+    formatter_cache = LRUCache(formatters_maxsize)
+    result_cache = LRUCache(maxsize) if maxsize else None
+    format_module.cached_format = cached_format
+
+
+def disable_format_cache():
+    """Stop caching and drop the caches"""
+    global result_cache, formatter_cache
+
+    format_module.cached_format = None
+    result_cache = None
+    formatter_cache = None
+
+
+def clear_format_cache():
+    """Drop every cached result and formatter and reset the counters, the caches stay enabled"""
+    resolved_formatters.clear()
+    for cache in (result_cache, formatter_cache):
+        if cache is not None:
+            cache.clear()
+
+
+def format_cache_info():
+    """
+    Hits, misses and sizes of the caches.
+
+    Returns:
+    - dict: `{'results': CacheInfo, 'formatters': CacheInfo}`, a `CacheInfo` is None when that cache is disabled.
+    """
+    return {
+        'results': result_cache.info() if result_cache is not None else None,
+        'formatters': formatter_cache.info() if formatter_cache is not None else None,
+    }
@@ -0,0 +1,204 @@
+"""
+Command line interface, streaming CSV or JSON Lines through `CurrencyFormatter`.
+
+Example:
+    python -m format_currency --column amount --currency-column currency < export.csv > formatted.csv
+
+`python -m format_currency serve` runs the formatting daemon instead, see `format_currency.server`.
+"""
+import argparse
+import csv
+import json
+import sys
+from decimal import Decimal, InvalidOperation
+
+from .format import CurrencyFormatter
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m format_currency',
+        description='Format columns of a CSV or JSON Lines stream as currency strings, one row at a time.',
+    )
+    parser.add_argument('input', nargs='?', default='-', help='Input file, defaults to stdin.')
+    parser.add_argument('-o', '--output', default='-', help='Output file, defaults to stdout.')
+    parser.add_argument('-f', '--format', choices=['csv', 'jsonl'], default=None,
+                        help='Input and output format. Guessed from the input file extension, defaults to csv.')
+    parser.add_argument('-c', '--column', action='append', required=True, dest='columns',
+                        help='Column to format, can be given more than once.')
+    parser.add_argument('--suffix', default='',
+                        help='Write formatted values to a new column named after the source column plus this suffix, instead of replacing it.')
+    parser.add_argument('--delimiter', default=',', help='CSV delimiter.')
+
+    currency = parser.add_mutually_exclusive_group()
+    currency.add_argument('--country-code', help='Country code used for every row.')
+    currency.add_argument('--currency-code', help='Currency code used for every row.')
+    currency.add_argument('--country-column', help='Column holding the country code of each row.')
+    currency.add_argument('--currency-column', help='Column holding the currency code of each row.')
+
+    parser.add_argument('--decimal-places', type=int, default=None)
+    parser.add_argument('--number-format-system', default='auto',
+                        choices=['auto', 'international', 'global', 'indian', 'chinese', 'none'])
+    parser.add_argument('--smart-number-formatting', action='store_true')
+    parser.add_argument('--place-currency-symbol-at-end', action='store_true')
+    parser.add_argument('--use-current-locale', action='store_true')
+    return parser
+
+
+class ColumnFormatter():
+    """Formats values of one row, keeping one resolved `CurrencyFormatter` per distinct code"""
+    def __init__(self, args):
+        super().__init__()
+        self.country_code = args.country_code
+        self.currency_code = args.currency_code
+        self.country_column = args.country_column
+        self.currency_column = args.currency_column
+        self.use_current_locale = args.use_current_locale
+        self.options = {
+            'number_format_system': args.number_format_system,
+            'smart_number_formatting': args.smart_number_formatting,
+            'place_currency_symbol_at_end': args.place_currency_symbol_at_end,
+        }
+        if args.decimal_places is not None:
+            self.options['decimal_places'] = args.decimal_places
+        self.formatters = {}
+
+    def formatter(self, code):
+        formatter = self.formatters.get(code, None)
+        if formatter is None:
+            if self.country_column:
+                formatter = CurrencyFormatter(country_code=code, use_current_locale=self.use_current_locale, **self.options)
+                if formatter.country is None:
+                    raise ValueError(f"unknown country code '{code}'")
+            elif self.currency_column:
+                formatter = CurrencyFormatter(currency_code=code, use_current_locale=self.use_current_locale, **self.options)
+                if formatter.country is None:
+                    raise ValueError(f"unknown currency code '{code}'")
+            else:
+                formatter = CurrencyFormatter(country_code=self.country_code, currency_code=self.currency_code,
+                                              use_current_locale=self.use_current_locale, **self.options)
+            self.formatters[code] = formatter
+        return formatter
+
+    def format(self, value, code):
+        """Format a CSV cell or JSON value, empty values are passed through"""
+        if value is None or value == '':
+            return value
+        if isinstance(value, str):
+            try:
+                value = Decimal(value.strip())
+            except InvalidOperation:
+                raise ValueError(f"invalid amount '{value}'") from None
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"invalid amount '{value}'")
+        return self.formatter(code).format(value)
+
+
+def format_csv(input_file, output_file, args, column_formatter):
+    reader = csv.reader(input_file, delimiter=args.delimiter)
+    writer = csv.writer(output_file, delimiter=args.delimiter, lineterminator='\n')
+
+    header = next(reader, None)
+    if header is None:
+        return
+    missing = [column for column in args.columns if column not in header]
+    if missing:
+        raise ValueError(f'column(s) {missing} not found in header')
+    code_column = args.country_column or args.currency_column
+    if code_column and code_column not in header:
+        raise ValueError(f"column '{code_column}' not found in header")
+
+    source_indexes = [header.index(column) for column in args.columns]
+    code_index = header.index(code_column) if code_column else None
+    if args.suffix:
+        target_indexes = list(range(len(header), len(header) + len(source_indexes)))
+        header = header + [column + args.suffix for column in args.columns]
+    else:
+        target_indexes = source_indexes
+    writer.writerow(header)
+
+    for line_number, row in enumerate(reader, start=2):
+        code = None
+        if code_index is not None:
+            if code_index >= len(row):
+                raise ValueError(f"line {line_number}: column '{code_column}' is missing")
+            code = row[code_index]
+        formatted = []
+        for index in source_indexes:
+            try:
+                formatted.append(column_formatter.format(row[index] if index < len(row) else '', code))
+            except ValueError as e:
+                raise ValueError(f'line {line_number}: {e}') from None
+        if args.suffix:
+            row = row + formatted
+        else:
+            for index, value in zip(target_indexes, formatted):
+                row[index] = value
+        writer.writerow(row)
+
+
+def format_jsonl(input_file, output_file, args, column_formatter):
+    code_column = args.country_column or args.currency_column
+    for line_number, line in enumerate(input_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f'line {line_number}: {e}') from None
+        if not isinstance(row, dict):
+            raise ValueError(f'line {line_number}: expected a JSON object, got {type(row).__name__}')
+        code = row.get(code_column, None) if code_column else None
+        for column in args.columns:
+            try:
+                value = column_formatter.format(row.get(column, None), code)
+            except ValueError as e:
+                raise ValueError(f'line {line_number}: {e}') from None
+            row[column + args.suffix] = value
+        output_file.write(json.dumps(row, ensure_ascii=False))
+        output_file.write('\n')
+
+
+def main(argv=None, stdin=None, stdout=None):
+    """Run the command line interface, returns the process exit code"""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['serve']:
+        from . import server
+
+        return server.main(argv[1:])
+    args = build_parser().parse_args(argv)
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+
+    file_format = args.format
+    if file_format is None:
+        file_format = 'jsonl' if args.input.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+    if args.use_current_locale:
+        import locale
+
+        #* the process starts in the C locale, which has no monetary separators at all
+        try:
+            locale.setlocale(locale.LC_MONETARY, '')
+        except locale.Error as e:
+            sys.stderr.write(f'format_currency: error: {e}\n')
+            return 1
+
+    input_file = stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    output_file = stdout if args.output == '-' else open(args.output, 'w', newline='', encoding='utf-8')
+    try:
+        column_formatter = ColumnFormatter(args)
+        if file_format == 'csv':
+            format_csv(input_file, output_file, args, column_formatter)
+        else:
+            format_jsonl(input_file, output_file, args, column_formatter)
+    except (ValueError, TypeError) as e:
+        sys.stderr.write(f'format_currency: error: {e}\n')
+        return 1
+    finally:
+        if input_file is not stdin:
+            input_file.close()
+        if output_file is not stdout:
+            output_file.close()
+    return 0
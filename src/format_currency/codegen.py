@@ -0,0 +1,180 @@
+"""
+Code generation of formatting functions specialized for one currency and set of options.
+
+The options are resolved once by `CurrencyFormatter`, then only the operations the resolved path needs are written
+out as Python source, with the symbol, separators and precision as constants, and compiled into a plain function.
+"""
+import itertools
+import linecache
+import threading
+
+from .cache import options_key
+from .country import Country
+from .format import CurrencyFormatter
+
+# Compiled functions keyed by the normalized options, cleared when full like the parser cache
+cached_compiled_formatters = {}
+MAX_COMPILED_FORMATTERS = 1024
+compiled_formatters_lock = threading.Lock()
+# Numbers the generated sources, so each gets its own file name in `linecache`
+source_counter = itertools.count()
+
+FUNCTION_TEMPLATE = '''\
+def {name}(number):
+    """{doc}"""
+{body}
+'''
+
+
+def generate_native_body(formatter):
+    """Body of the format spec path, which groups by thousands natively"""
+    prefix, suffix = formatter._prefix, formatter._suffix
+    int_spec = formatter._int_template[2:-1]
+    spec = formatter._template[2:-1]
+    if formatter._translation is None:
+        return '\n'.join([
+            '    if type(number) is int:',
+            f'        return {prefix!r} + format(number, {int_spec!r}) + {formatter._zero_fraction + suffix!r}',
+            f'    return {prefix!r} + format(number, {spec!r}) + {suffix!r}',
+        ])
+
+    #* `str.replace` is cheaper than `str.translate` on short strings, ints and floats can group with '_' for it
+    grouped = ',' in spec
+    int_number = f"format(number, '_').replace('_', {formatter.thousands_separator!r})" if grouped else 'format(number)'
+    float_spec = spec.replace(',', '_')
+    float_number = f"format(number, {float_spec!r}).replace('.', {formatter.decimal_separator!r})"
+    if grouped:
+        float_number += f".replace('_', {formatter.thousands_separator!r})"
+    lines = [
+        '    if type(number) is int:',
+        f'        return {prefix!r} + {int_number} + {formatter._zero_fraction + suffix!r}',
+    ]
+    if '_' not in formatter.decimal_separator:
+        lines += [
+            '    if type(number) is float:',
+            f'        return {prefix!r} + {float_number} + {suffix!r}',
+        ]
+    lines.append(f'    return {prefix!r} + format(number, {spec!r}).translate(TRANSLATION) + {suffix!r}')
+    return '\n'.join(lines)
+
+
+def generate_grouped_body(formatter):
+    """Body of the digit grouping path, for numbering systems the format spec can't group"""
+    prefix, suffix = formatter._prefix, formatter._suffix
+    decimal_places = formatter.decimal_places
+    spec = formatter._template[2:-1]
+    lines = [
+        '    if type(number) is int:',
+        '        digits = str(number)',
+        "        if digits[0] == '-':",
+        f"            return {prefix + '-'!r} + group(digits[1:]) + {formatter._zero_fraction + suffix!r}",
+        f'        return {prefix!r} + group(digits) + {formatter._zero_fraction + suffix!r}',
+        f'    formatted_number = format(number, {spec!r})',
+    ]
+    if decimal_places > 0:
+        lines += [
+            f'    digits = formatted_number[:{-decimal_places - 1}]',
+            f'    fraction = {formatter.decimal_separator!r} + formatted_number[{-decimal_places}:] + {suffix!r}',
+        ]
+    else:
+        lines += [
+            '    digits = formatted_number',
+            f'    fraction = {suffix!r}',
+        ]
+    lines += [
+        "    if digits[:1] == '-':",
+        '        if digits[1:].isdigit():',
+        f"            return {prefix + '-'!r} + group(digits[1:]) + fraction",
+        '    elif digits.isdigit():',
+        f'        return {prefix!r} + group(digits) + fraction',
+        '    #* nan and infinity',
+        f'    return {prefix!r} + formatted_number + {suffix!r}',
+    ]
+    return '\n'.join(lines)
+
+
+def generate_smart_body(formatter):
+    """Body of the smart formatting path, which calls back into the formatter for the unit arithmetic"""
+    return f'    return {formatter._prefix!r} + format_number(number) + {formatter._suffix!r}'
+
+
+def generate_source(formatter, name='format_currency_specialized'):
+    """
+    Python source of a function formatting one number exactly like `formatter.format`.
+
+    Returns:
+    - tuple of (str, dict): The source, and the globals it refers to.
+    """
+    namespace = {}
+    if formatter._smart:
+        body = generate_smart_body(formatter)
+        namespace['format_number'] = formatter._format_number
+    elif formatter._digit_grouping is None:
+        body = generate_native_body(formatter)
+        namespace['TRANSLATION'] = formatter._translation
+    else:
+        body = generate_grouped_body(formatter)
+        namespace['group'] = formatter._digit_grouping.group
+
+    path = 'smart ' + formatter.numbering_system if formatter._smart else formatter.numbering_system
+    doc = f'Format a number as {formatter.currency_code or "currency"}, {path} numbering system, generated'
+    return FUNCTION_TEMPLATE.format(name=name, doc=doc, body=body), namespace
+
+
+def compile_source(source, namespace, name):
+    """Compile generated source into a function, registering the source so tracebacks can show it"""
+    filename = f'<format_currency.codegen {name} #{next(source_counter)}>'
+    #* lets tracebacks and `inspect.getsource` show the generated code
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+    function = namespace[name]
+    function.__source__ = source
+    return function
+
+
+def compile_formatter(country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, **kwargs):
+    """
+    Generates and compiles a formatting function specialized for one currency and set of options.
+
+    Accepts the same parameters as `format_currency`, except the number. The returned function takes a number and
+    returns the same string as `format_currency` with these options, without re-evaluating them on each call.
+
+    Returns:
+    - function: `function(number) -> str`, with its generated source in `__source__`.
+
+    Example:
+        >>> format_usd = compile_formatter(currency_code='USD')
+        >>> format_usd(1234567.891)
+        '$ 1,234,567.89'
+
+    Notes:
+    - Compiled functions are cached by their options. With `use_current_locale` the locale conventions are compiled
+      in as constants, and the cache is keyed by the LC_MONETARY locale name.
+    """
+    options = (country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale)
+    key = options_key(options, kwargs)
+    function = cached_compiled_formatters.get(key, None)
+    if function is not None:
+        return function
+
+    formatter = CurrencyFormatter(*options, **kwargs)
+    name = 'format_' + (formatter.currency_code or '').lower()
+    if not name.isidentifier() or name == 'format_':
+        name = 'format_currency_specialized'
+    function = compile_source(*generate_source(formatter, name), name)
+    with compiled_formatters_lock:
+        if len(cached_compiled_formatters) >= MAX_COMPILED_FORMATTERS:
+            cached_compiled_formatters.clear()
+        return cached_compiled_formatters.setdefault(key, function)
+
+
+def compile_all_countries(**kwargs):
+    """
+    Compile a specialized formatting function for every country, e.g. at application start.
+
+    Accepts the same keyword arguments as `compile_formatter`.
+
+    Returns:
+    - dict: ISO alpha-2 country code -> compiled function.
+    """
+    return {alpha2: compile_formatter(alpha2, **kwargs) for alpha2 in Country.load_countries_index()['alpha2']}
@@ -1,100 +1,308 @@
-import os, json
+import os, threading
 
 cached_countries_data = None
+cached_countries_index = None
+cached_flags_data = None
 cached_countries_data_dict = {}
+cached_countries_data_by_alpha3_dict = {}
+cached_countries_data_by_numeric_dict = {}
 cached_countries_data_by_currency_code_dict = {}
+# Currencies registered at runtime, currency code -> overlay record, see `format_currency.registry`
+currency_overlays = {}
+# Bumped each time the countries index is replaced, so caches built from the countries data can tell they are stale
+countries_data_version = 0
+
+# Upper bound for each raw-code lookup cache, so a stream of garbage codes can't grow it forever
+MAX_CACHED_LOOKUPS = 4096
+MISSING = object()
+
+# Guards the one-time loads below. Readers only take it while the data is still missing, so warm lookups are lock-free
+countries_data_lock = threading.RLock()
 
 class Country():
-    """Country Data"""
-    def __init__(self, name, alpha2, alpha3, currency_code, currency_name, currency_symbol, currency_decimal_separator, currency_thousands_separator, currency_decimal_place=2, flag_base64=None):
+    """
+    Country Data, an immutable record.
+
+    Countries loaded from the data are canonical, every index returns the same instance for a country. Instances are
+    hashable and compare equal when their fields are equal, so they can be used as cache keys.
+    """
+    __slots__ = ('name', 'alpha2', 'alpha3', 'numeric', 'currency_code', 'currency_name', 'currency_symbol',
+                 'currency_decimal_place', 'currency_decimal_separator', 'currency_thousands_separator', '_flag_base64')
+
+    def __init__(self, name, alpha2, alpha3, currency_code, currency_name, currency_symbol, currency_decimal_separator, currency_thousands_separator, currency_decimal_place=2, flag_base64=None, numeric=None):
         super().__init__()
-        self.name = name
-        self.alpha2 = alpha2
-        self.alpha3 = alpha3
-        self.currency_code = currency_code
-        self.currency_name = currency_name
-        self.currency_symbol = currency_symbol
-        self.currency_decimal_place = currency_decimal_place
-        self.currency_decimal_separator = currency_decimal_separator
-        self.currency_thousands_separator = currency_thousands_separator
-        self.flag_base64 = flag_base64
+        set_field = object.__setattr__
+        set_field(self, 'name', name)
+        set_field(self, 'alpha2', alpha2)
+        set_field(self, 'alpha3', alpha3)
+        set_field(self, 'numeric', numeric)
+        set_field(self, 'currency_code', currency_code)
+        set_field(self, 'currency_name', currency_name)
+        set_field(self, 'currency_symbol', currency_symbol)
+        set_field(self, 'currency_decimal_place', currency_decimal_place)
+        set_field(self, 'currency_decimal_separator', currency_decimal_separator)
+        set_field(self, 'currency_thousands_separator', currency_thousands_separator)
+        set_field(self, '_flag_base64', flag_base64)
+
+    def key(self):
+        """The fields as a tuple, in constructor order. The flag is left out, it only depends on `alpha2`"""
+        return (self.name, self.alpha2, self.alpha3, self.currency_code, self.currency_name, self.currency_symbol,
+                self.currency_decimal_separator, self.currency_thousands_separator, self.currency_decimal_place,
+                self.numeric)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Country is immutable, can't set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Country is immutable, can't delete '{name}'")
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Country):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return f'Country(alpha2={self.alpha2!r}, currency_code={self.currency_code!r})'
+
+    def __reduce__(self):
+        #* unpickled countries, e.g. in `format_currency_parallel` workers, resolve to the canonical instance
+        return (canonical_country, self.key())
+
+    @property
+    def flag_base64(self):
+        """Base64 encoded PNG flag, loaded from `data/flags.json` on first access"""
+        if self._flag_base64 is None:
+            #* the flag is a lazily loaded cache, not part of the record
+            object.__setattr__(self, '_flag_base64', self.load_flags_data().get(self.alpha2, None))
+        return self._flag_base64
+
+    @staticmethod
+    def load_data_file(filename):
+        """Load a json file from the data directory"""
+        #* imported here, processes that never touch the countries data don't pay for it
+        import json
+
+        data_json_path = os.path.join(os.path.dirname(__file__), 'data', filename)
+        with open(data_json_path, encoding='utf-8') as f:
+            return json.load(f)
 
     @classmethod
     def load_countries_data(cls):
-        """Load countries data from json"""
+        """Load countries monetary data from json, flags are kept separately in `data/flags.json`"""
         global cached_countries_data
 
         if cached_countries_data is not None:
             return cached_countries_data
 
-        data_json_path = os.path.join(os.path.dirname(__file__), 'data', 'countries.json')
-        data = None
-        try:
-            with open(data_json_path) as f:
-                data = json.load(f)
-        except UnicodeDecodeError as e:
-            with open(data_json_path, encoding = 'utf-8') as f:
-                data = json.load(f)
+        with countries_data_lock:
+            if cached_countries_data is None:
+                cached_countries_data = cls.load_data_file('countries.json')
+            return cached_countries_data
+
+    @classmethod
+    def load_flags_data(cls):
+        """Load base64 flags, keyed by ISO alpha-2 code, from json"""
+        global cached_flags_data
+
+        if cached_flags_data is not None:
+            return cached_flags_data
+
+        with countries_data_lock:
+            if cached_flags_data is None:
+                cached_flags_data = cls.load_data_file('flags.json')
+            return cached_flags_data
+
+    @classmethod
+    def from_data(cls, country_data):
+        """Build a country from one record of the countries data"""
+        currency_data = country_data.get('currency') or {}
+        return cls(
+                    name=country_data.get('name', ''),
+                    alpha2=country_data.get('isoAlpha2', ''),
+                    alpha3=country_data.get('isoAlpha3', ''),
+                    numeric=country_data.get('isoNumeric', None),
+                    currency_code=currency_data.get('code', ''),
+                    currency_name=currency_data.get('name', ''),
+                    currency_symbol=currency_data.get('symbol', ''),
+                    currency_decimal_separator=currency_data.get('decimal', '.'),
+                    currency_thousands_separator=currency_data.get('thousands', ','),
+                    currency_decimal_place=currency_data.get('decimalPlaces', 2),
+                   )
 
-        cached_countries_data = data
-        return data
+    @classmethod
+    def build_countries_index(cls, countries_data, overlays):
+        """
+        Build the alpha-2, alpha-3, numeric and currency code indexes of the countries data with overlays applied.
+
+        Parameters:
+        - countries_data (list): Country records, in the format of `data/countries.json`.
+        - overlays (dict): Currency code -> overlay record, with the fields of a `currency` record to replace and
+          optionally a `country` alpha-2 code that uses the currency.
+
+        Returns:
+        - dict: Index name -> code -> country. Built without touching any shared state.
+        """
+        adopted = {overlay['country']: currency_code for currency_code, overlay in overlays.items() if overlay.get('country')}
+        index = {'alpha2': {}, 'alpha3': {}, 'numeric': {}, 'currency_code': {}}
+
+        def add(country):
+            for index_name, code in (('alpha2', country.alpha2), ('alpha3', country.alpha3), ('numeric', country.numeric)):
+                if code:
+                    index[index_name].setdefault(code, country)
+            #* several countries share a currency, the first one in the data wins
+            if country.currency_code:
+                index['currency_code'].setdefault(country.currency_code, country)
+
+        for country_data in countries_data:
+            currency_data = country_data.get('currency') or {}
+            #* a country adopting a registered currency drops its own
+            currency_code = adopted.get(country_data.get('isoAlpha2', ''), currency_data.get('code', ''))
+            overlay = overlays.get(currency_code, None)
+            if overlay is not None:
+                base = currency_data if currency_code == currency_data.get('code', '') else {}
+                country_data = dict(country_data, currency=dict(base, code=currency_code, **overlay['currency']))
+            add(cls.from_data(country_data))
+
+        for currency_code, overlay in overlays.items():
+            if currency_code not in index['currency_code']:
+                #* a currency no country uses, e.g. an internal or crypto currency
+                add(cls.from_data({'name': overlay['currency'].get('name', currency_code), 'currency': dict(overlay['currency'], code=currency_code)}))
+        return index
+
+    @classmethod
+    def load_countries_index(cls):
+        """Build the alpha-2, alpha-3, numeric and currency code indexes, once"""
+        global cached_countries_index
+
+        if cached_countries_index is not None:
+            return cached_countries_index
+
+        with countries_data_lock:
+            if cached_countries_index is not None:
+                return cached_countries_index
+
+            index = cls.build_countries_index(cls.load_countries_data(), currency_overlays)
+            #* publish only the fully built index
+            cached_countries_index = index
+            return index
+
+    @classmethod
+    def load_all_countries(cls):
+        """Every country of the index, followed by the registered currencies no country uses"""
+        index = cls.load_countries_index()
+        return list(index['alpha2'].values()) + [country for country in index['currency_code'].values() if not country.alpha2]
+
+    @classmethod
+    def swap_countries_index(cls, countries_data, overlays, index):
+        """
+        Atomically replace the countries data, overlays and index with ones built by `build_countries_index`.
+
+        Lookups running meanwhile see either the previous or the new index, never a mix of both.
+        """
+        global cached_countries_data, cached_countries_index, currency_overlays, countries_data_version
+
+        with countries_data_lock:
+            cached_countries_data = countries_data
+            currency_overlays = overlays
+            cached_countries_index = index
+            countries_data_version += 1
+            cls.clear_lookup_caches()
+
+    @classmethod
+    def clear_lookup_caches(cls):
+        cached_countries_data_dict.clear()
+        cached_countries_data_by_alpha3_dict.clear()
+        cached_countries_data_by_numeric_dict.clear()
+        cached_countries_data_by_currency_code_dict.clear()
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all loaded data and lookup caches, the next lookup loads them again. Registered currencies are kept"""
+        global cached_countries_data, cached_countries_index, cached_flags_data, countries_data_version
+
+        with countries_data_lock:
+            cached_countries_index = None
+            cached_countries_data = None
+            cached_flags_data = None
+            countries_data_version += 1
+            cls.clear_lookup_caches()
+
+    @classmethod
+    def lookup_index(cls, cache, index_name, code, normalized_code):
+        """
+        Find a country in one of the indexes and remember the result for the raw `code` in `cache`.
+
+        Both hits and misses are cached, so repeated lookups of unknown codes cost a single dict lookup.
+        """
+        index = cls.load_countries_index()
+        country = index[index_name].get(normalized_code, None)
+        if len(cache) >= MAX_CACHED_LOOKUPS:
+            cache.clear()
+        cache[code] = country
+        if index is not cached_countries_index:
+            #* the index was swapped meanwhile, and the caches cleared maybe before this result was stored
+            cache.pop(code, None)
+        return country
+
+    @staticmethod
+    def normalize_code(code):
+        return code.strip().upper()
+
+    @staticmethod
+    def normalize_numeric_code(code):
+        """The int of a numeric code given as int or digit string, None for anything else, e.g. `840.9` or `True`"""
+        if type(code) is int:
+            return code
+        if isinstance(code, str):
+            code = code.strip()
+            if code.isascii() and code.isdigit():
+                return int(code)
+        return None
 
     @classmethod
     def load_country(cls, country_code):
-        """Find country by it's ISO code"""
-        global cached_countries_data_dict
-        cached = cached_countries_data_dict.get(country_code, None)
-        if cached is not None:
+        """Find country by it's ISO alpha-2 code"""
+        cached = cached_countries_data_dict.get(country_code, MISSING)
+        if cached is not MISSING:
             return cached
+        return cls.lookup_index(cached_countries_data_dict, 'alpha2', country_code, cls.normalize_code(country_code))
+
+    @classmethod
+    def load_country_by_alpha3(cls, alpha3):
+        """Find country by it's ISO alpha-3 code"""
+        cached = cached_countries_data_by_alpha3_dict.get(alpha3, MISSING)
+        if cached is not MISSING:
+            return cached
+        return cls.lookup_index(cached_countries_data_by_alpha3_dict, 'alpha3', alpha3, cls.normalize_code(alpha3))
+
+    @classmethod
+    def load_country_by_numeric(cls, numeric):
+        """Find country by it's ISO numeric code, given as int or digit string"""
+        normalized_code = cls.normalize_numeric_code(numeric)
+        if normalized_code is None:
+            #* checked before the cache, `840.0` and `True` would find the entries of `840` and `1`
+            return None
+        cached = cached_countries_data_by_numeric_dict.get(numeric, MISSING)
+        if cached is not MISSING:
+            return cached
+        return cls.lookup_index(cached_countries_data_by_numeric_dict, 'numeric', numeric, normalized_code)
 
-        data = cls.load_countries_data()
-
-        for country_data in data:
-            if country_data.get('isoAlpha2', None) == country_code.upper():
-                currency_data = country_data.get('currency', {})
-
-                country = cls(
-                            name=country_data.get('name', ''),
-                            alpha2=country_data.get('isoAlpha2', ''),
-                            alpha3=country_data.get('isoAlpha3', ''),
-                            flag_base64=country_data.get('flag', None),
-                            currency_code=currency_data.get('code', ''),
-                            currency_name=currency_data.get('name', ''),
-                            currency_symbol=currency_data.get('symbol', ''),
-                            currency_decimal_separator=currency_data.get('decimal', '.'),
-                            currency_thousands_separator=currency_data.get('thousands', ','),
-                            currency_decimal_place=currency_data.get('decimalPlaces', 2),
-                           )
-                cached_countries_data_dict[country_code] = country
-                return country
-        
     @classmethod
     def load_country_by_currency_code(cls, currency_code):
         """Find country by it's currency code"""
-        global cached_countries_data_by_currency_code_dict
-        cached = cached_countries_data_by_currency_code_dict.get(currency_code, None)
-        if cached is not None:
+        cached = cached_countries_data_by_currency_code_dict.get(currency_code, MISSING)
+        if cached is not MISSING:
             return cached
+        return cls.lookup_index(cached_countries_data_by_currency_code_dict, 'currency_code', currency_code, cls.normalize_code(currency_code))
+
 
-        data = cls.load_countries_data()
-
-        for country_data in data:
-            currency_data = country_data.get('currency')
-            if currency_data and currency_data.get('code', None) == currency_code.upper():
-                currency_data = country_data.get('currency', {})
-
-                country = cls(
-                            name=country_data.get('name', ''),
-                            alpha2=country_data.get('isoAlpha2', ''),
-                            alpha3=country_data.get('isoAlpha3', ''),
-                            flag_base64=country_data.get('flag', None),
-                            currency_code=currency_data.get('code', ''),
-                            currency_name=currency_data.get('name', ''),
-                            currency_symbol=currency_data.get('symbol', ''),
-                            currency_decimal_separator=currency_data.get('decimal', '.'),
-                            currency_thousands_separator=currency_data.get('thousands', ','),
-                            currency_decimal_place=currency_data.get('decimalPlaces', 2),
-                           )
-                cached_countries_data_by_currency_code_dict[currency_code] = country
-                return country
-        
\ No newline at end of file
+def canonical_country(*key):
+    """The loaded country with these fields, or a new `Country` when the data has none"""
+    country = Country(*key[:9], numeric=key[9])
+    loaded = Country.load_countries_index()['alpha2'].get(country.alpha2, None)
+    return loaded if loaded == country else country
@@ -0,0 +1,217 @@
+"""
+Formatting of pandas Series and pyarrow arrays, optionally with a currency per row.
+
+pandas and pyarrow are optional, they are only used when such objects are passed in. NumPy is needed for the
+grouping, it comes with both.
+"""
+from . import vectorized
+from .format import CurrencyFormatter
+
+
+def require_numpy():
+    numpy = vectorized.load_numpy()
+    if numpy is None:
+        raise ImportError('format_currency_column needs NumPy, install it with `pip install numpy`')
+    return numpy
+
+
+def column_kind(column):
+    """'pandas', 'arrow' or None, from the module the column type comes from"""
+    module = type(column).__module__
+    if module.startswith('pandas'):
+        return 'pandas'
+    if module.startswith('pyarrow'):
+        return 'arrow'
+    return None
+
+
+def column_values(values, kind):
+    """
+    The non-null values of a column and their row positions.
+
+    Returns:
+    - tuple of (ndarray, ndarray, int): The values as a NumPy array, their positions, and the number of rows.
+    """
+    numpy = require_numpy()
+    if kind == 'pandas':
+        valid = values.notna().to_numpy()
+        return values[valid].to_numpy(), numpy.flatnonzero(valid), len(values)
+    if kind == 'arrow':
+        if hasattr(values, 'combine_chunks'):
+            values = values.combine_chunks()
+        valid = values.is_valid().to_numpy(zero_copy_only=False)
+        #* without nulls integer and float arrays convert without a copy, decimals become `Decimal` objects
+        return values.drop_null().to_numpy(zero_copy_only=False), numpy.flatnonzero(valid), len(values)
+    if vectorized.is_array_like(values):
+        values = numpy.asarray(values)
+    else:
+        values = list(values)
+        #* plain floats can take the vectorized path, anything else stays exact as objects
+        values = numpy.array(values, dtype=numpy.float64 if all(type(value) is float for value in values) else object)
+    return values, numpy.arange(len(values)), len(values)
+
+
+def column_groups(codes, rows):
+    """
+    Factorize a column of currency or country codes.
+
+    Returns:
+    - tuple of (ndarray, list): The group of every row, and the code of every group. Null codes form a group of
+      their own, with code None.
+    """
+    numpy = require_numpy()
+    kind = column_kind(codes)
+    if kind == 'pandas':
+        import pandas
+
+        groups, uniques = pandas.factorize(codes, use_na_sentinel=True)
+        uniques = list(uniques)
+    elif kind == 'arrow':
+        if hasattr(codes, 'combine_chunks'):
+            codes = codes.combine_chunks()
+        encoded = codes.dictionary_encode()
+        groups = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        uniques = encoded.dictionary.to_pylist()
+    else:
+        index = {}
+        groups = numpy.fromiter((index.setdefault(code, len(index)) for code in codes), dtype=numpy.intp)
+        uniques = list(index)
+        if None in index:
+            #* keep nulls on the same sentinel as the other kinds
+            null_group = index[None]
+            groups = numpy.where(groups == null_group, -1, groups)
+            uniques[null_group] = None
+
+    if len(groups) != rows:
+        raise ValueError(f'The codes column has {len(groups)} rows, the values column has {rows}.')
+    #* shift so the null group is group 0
+    return numpy.asarray(groups, dtype=numpy.intp) + 1, [None] + uniques
+
+
+def format_currency_column(values, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, categorical=False, **kwargs):
+    """
+    Formats a whole column of amounts, e.g. a pandas Series or a pyarrow array, in bulk.
+
+    Accepts the same parameters as `format_currency_many`, plus:
+    - country_code, currency_code: Either a code for every row, or a column of codes (Series, pyarrow array or
+      sequence) with one code per row. Rows are grouped by code, and each group is formatted in bulk with one
+      resolved formatter.
+    - categorical (bool, optional): Format each distinct amount of a group once, and return a categorical column.
+      Worth it when amounts repeat, such as catalog prices. Defaults to False.
+
+    Returns:
+    - A column of the same kind as `values`: a pandas Series with the same index and name (`string` dtype, or
+      `category` when `categorical`), a pyarrow `StringArray` (`DictionaryArray` when `categorical`), or a list of
+      str for other inputs.
+
+    Example:
+        >>> df['formatted'] = format_currency_column(df['amount'], currency_code=df['currency'])
+
+    Notes:
+    - Null amounts (None, NaN, NA) stay null in pandas and pyarrow results. Null codes format like no code was given.
+    """
+    numpy = require_numpy()
+    if not isinstance(country_code, (str, type(None))) and not isinstance(currency_code, (str, type(None))):
+        raise ValueError('Only one of country_code and currency_code can be a column')
+
+    kind = column_kind(values)
+    numbers, positions, rows = column_values(values, kind)
+
+    codes_column = None
+    if not isinstance(currency_code, (str, type(None))):
+        codes_column, code_option = currency_code, 'currency_code'
+    elif not isinstance(country_code, (str, type(None))):
+        codes_column, code_option = country_code, 'country_code'
+    options = dict(country_code=country_code, currency_code=currency_code, currency_symbol=currency_symbol,
+                   decimal_separator=decimal_separator, thousands_separator=thousands_separator,
+                   use_current_locale=use_current_locale, **kwargs)
+
+    if codes_column is None:
+        group_codes = [None]
+        order = numpy.arange(len(numbers))
+        bounds = [0, len(numbers)]
+    else:
+        groups, group_codes = column_groups(codes_column, rows)
+        groups = groups[positions]
+        #* rows sorted by group, so each group is a contiguous slice of `order`
+        order = numpy.argsort(groups, kind='stable')
+        bounds = numpy.searchsorted(groups[order], numpy.arange(len(group_codes) + 1))
+
+    if categorical:
+        codes = numpy.full(rows, -1, dtype=numpy.intp)
+        categories = {}
+    else:
+        result = numpy.full(rows, None, dtype=object)
+
+    for group, code in enumerate(group_codes):
+        start, end = bounds[group], bounds[group + 1]
+        if start == end:
+            continue
+        if codes_column is not None:
+            options[code_option] = code
+        formatter = CurrencyFormatter(**options)
+        selection = order[start:end]
+        group_numbers = numbers[selection]
+        if categorical:
+            unique_numbers, inverse = unique_inverse(group_numbers)
+            category_codes = numpy.fromiter((categories.setdefault(formatted, len(categories)) for formatted in formatter.format_many(unique_numbers)), dtype=numpy.intp, count=len(unique_numbers))
+            codes[positions[selection]] = category_codes[inverse]
+        else:
+            result[positions[selection]] = formatter.format_many(group_numbers)
+
+    if categorical:
+        return categorical_column(codes, list(categories), values, kind)
+    return string_column(result, values, kind)
+
+
+def unique_inverse(numbers):
+    """Distinct numbers, and the index of each number among them"""
+    numpy = require_numpy()
+    if numbers.dtype.kind in 'iub':
+        return numpy.unique(numbers, return_inverse=True)
+    if numbers.dtype.kind == 'f':
+        #* compare bit patterns, -0.0 equals 0.0 but formats differently
+        _, first, inverse = numpy.unique(numbers.view(f'u{numbers.itemsize}'), return_index=True, return_inverse=True)
+        return numbers[first], inverse
+    #* object arrays may mix types that don't sort together, such as `Decimal` and float. Types are kept apart as
+    #* they format differently, and zeros by their sign
+    index = {}
+    distinct = []
+    inverse = numpy.empty(len(numbers), dtype=numpy.intp)
+    for position, number in enumerate(numbers):
+        key = (type(number), number) if number else (type(number), repr(number))
+        unique_position = index.get(key, None)
+        if unique_position is None:
+            unique_position = index[key] = len(distinct)
+            distinct.append(number)
+        inverse[position] = unique_position
+    unique_numbers = numpy.empty(len(distinct), dtype=object)
+    unique_numbers[:] = distinct
+    return unique_numbers, inverse
+
+
+def string_column(result, values, kind):
+    if kind == 'pandas':
+        import pandas
+
+        return pandas.Series(result, index=values.index, name=values.name, dtype='string')
+    if kind == 'arrow':
+        import pyarrow
+
+        return pyarrow.array(result, type=pyarrow.string())
+    return result.tolist()
+
+
+def categorical_column(codes, categories, values, kind):
+    if kind == 'pandas':
+        import pandas
+
+        return pandas.Series(pandas.Categorical.from_codes(codes, categories), index=values.index, name=values.name)
+    if kind == 'arrow':
+        import pyarrow
+
+        indices = pyarrow.array(codes, type=pyarrow.int32(), mask=codes < 0)
+        return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(categories, type=pyarrow.string()))
+    numpy = require_numpy()
+    strings = numpy.array(categories + [None], dtype=object)
+    return strings[codes].tolist()
@@ -1,13 +1,21 @@
-import locale
+import math
 
+from . import cache as cache_module
+from . import vectorized
 from .country import Country
+from .grouping import NUMBERING_SYSTEM_GROUPING, get_digit_grouping
+from .locale_snapshot import LocaleSnapshot
+from .smart_units import SmartUnitTable, get_unit_table
+
+# Set by `enable_format_cache` while result caching is enabled, see `format_currency.cache`
+cached_format = None
 
 def format_currency(number, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, **kwargs):
     """
     Formats a given number as a currency string according to various parameters and optional locale settings.
     
     Parameters:
-    - number (float): The numerical value to be formatted.
+    - number (float, int or Decimal): The numerical value to be formatted. `int` and `Decimal` are formatted exactly.
     - country_code (str, optional): The country code to determine currency formatting rules. Defaults to None.
     - currency_code (str, optional): The currency code to determine currency formatting rules. Defaults to None.
     - currency_symbol (str, optional): The symbol to be used for the currency. Defaults to None.
@@ -26,6 +34,8 @@ def format_currency(number, country_code=None, currency_code=None, currency_symb
         - `auto` i.e. "Auto Format" (based on the country i.e. from `country_code` or `currency_code`)
         - `none` i.e. "No Formatting" (no comma will be provided only symbol will be there)
     - smart_number_formatting (bool): If True then converts 1123456.789 to "1.12 million"/"11.23 lakhs"/"1.12 百万" depending on kwarg `number_format_system`. Precision after decimal depends on kwarg `decimal_places`. Defaults to False.
+    - smart_units (str or SmartUnitTable): Units for smart number formatting, a table registered with `register_unit_table` or a table itself. Defaults to the table of the numbering system.
+    - locale_snapshot (LocaleSnapshot): Use these locale conventions instead of the process locale, implies `use_current_locale`.
     
     Returns:
     - str: The formatted currency string.
@@ -36,134 +46,460 @@ def format_currency(number, country_code=None, currency_code=None, currency_symb
     Notes:
     - If no formatting options are provided, auto-formatting is determined based on the country or currency code.
     - Supports special numbering systems for India and China if the country code is 'IN', 'BD', 'NP', 'PK', or 'CN' respectively.
+    - With `use_current_locale` the locale's monetary separators and, for `number_format_system='auto'`, its monetary
+      digit grouping are used. The locale conventions are cached until `locale.setlocale` changes LC_MONETARY.
+    - The resolved formatter is reused by later calls with the same options. Results can be memoized too, with
+      `enable_format_cache`.
     """
-    allowed_kwargs = ['place_currency_symbol_at_end', 'decimal_places', 'number_format_system', 'smart_number_formatting']
-    __unexpected_args_provided = []
-    for kwarg in kwargs:
-        if kwarg not in allowed_kwargs:
-            __unexpected_args_provided.append(kwarg)
-    if len(__unexpected_args_provided) > 0:
-        raise TypeError(f"Unexpected keyword argument(s) '{__unexpected_args_provided}'\nAllowed kwargs are {allowed_kwargs}.")
-    
-    # Get the value(s) of kwargs
-    place_currency_symbol_at_end = kwargs.get('place_currency_symbol_at_end', False)
-    number_format_system = kwargs.get('number_format_system', 'auto').lower() #* to accept upper-case too
-    smart_number_formatting = kwargs.get('smart_number_formatting', False)
+    if cached_format is not None:
+        return cached_format(number, (country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale), kwargs)
+    #* formatters are reused across calls with the same options, see `cache.get_formatter`
+    return cache_module.get_formatter((country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale), kwargs).format(number)
 
-    autoformat = True
-    indian_numbering_system = False
-    china_numbering_system = False
 
-    if currency_symbol or decimal_separator or thousands_separator:
-        autoformat = False
+def format_currency_many(numbers, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, **kwargs):
+    """
+    Formats a batch of numbers as currency strings.
 
-    if autoformat:
-        country = None
-        currency_symbol = ''
-        decimal_separator = '.'
-        thousands_separator = ','
+    Accepts the same parameters as `format_currency`, with `numbers` being any iterable, an `array.array` or a NumPy
+    array. Validation, country lookup and grouping setup happen once per batch, and arrays are formatted in vectorized
+    form when NumPy is installed.
+
+    Returns:
+    - list of str: The formatted currency strings, identical to calling `format_currency` on each number.
+    """
+    return cache_module.get_formatter((country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale), kwargs).format_many(numbers)
+
+
+def format_currency_minor_units(minor_units, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, **kwargs):
+    """
+    Formats an integer amount of minor units (e.g. cents from a ledger) as a currency string, exactly.
+
+    Accepts the same parameters as `format_currency`. `minor_units` is interpreted with the currency's decimal places
+    (e.g. 2 for USD, 0 for JPY, 3 for BHD), or with `decimal_places` when no country or currency is given.
+
+    Example:
+        >>> format_currency_minor_units(123456789, currency_code='USD')
+        '$ 1,234,567.89'
+    """
+    return cache_module.get_formatter((country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale), kwargs).format_minor_units(minor_units)
+
+
+
+def format_currency_series(numbers, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, unit='max', **kwargs):
+    """
+    Smart formats a series of numbers with one unit for the whole series, e.g. the labels of a chart axis.
+
+    Accepts the same parameters as `format_currency_many`, with smart number formatting on, plus:
+    - unit (str or callable, optional): How the shared unit is picked, see `CurrencyFormatter.format_series`.
+      Defaults to `max`, the unit of the largest absolute amount.
+
+    Example:
+        >>> format_currency_series([250000, 1500000, 12000000], 'US')
+        ['$ 0.25 Million', '$ 1.50 Million', '$ 12.00 Million']
+
+    Returns:
+    - list of str: The formatted currency strings, in input order.
+    """
+    kwargs.setdefault('smart_number_formatting', True)
+    return cache_module.get_formatter((country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale), kwargs).format_series(numbers, unit)
+
+class CurrencyFormatter():
+    """
+    Reusable currency formatter.
+
+    Resolves the country, separators, precision and numbering system once, so that each call to `format` only does
+    the work that depends on the number itself. Accepts the same parameters as `format_currency` and produces the
+    same output.
+
+    Example:
+        >>> formatter = CurrencyFormatter('ID')
+        >>> formatter.format(1234567.89)
+        'Rp 1.234.567,89'
+
+    Notes:
+    - With `use_current_locale=True` the locale conventions are captured when the formatter is created.
+    """
+    allowed_kwargs = ['place_currency_symbol_at_end', 'decimal_places', 'number_format_system', 'smart_number_formatting', 'smart_units', 'locale_snapshot']
+
+    def __init__(self, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, **kwargs):
+        super().__init__()
+        __unexpected_args_provided = []
+        for kwarg in kwargs:
+            if kwarg not in self.allowed_kwargs:
+                __unexpected_args_provided.append(kwarg)
+        if len(__unexpected_args_provided) > 0:
+            raise TypeError(f"Unexpected keyword argument(s) '{__unexpected_args_provided}'\nAllowed kwargs are {self.allowed_kwargs}.")
+
+        # Get the value(s) of kwargs
+        place_currency_symbol_at_end = kwargs.get('place_currency_symbol_at_end', False)
+        number_format_system = kwargs.get('number_format_system', 'auto').lower() #* to accept upper-case too
+        smart_number_formatting = kwargs.get('smart_number_formatting', False)
+        smart_units = kwargs.get('smart_units', None)
         decimal_places = kwargs.get('decimal_places', 2)
+        locale_snapshot = kwargs.get('locale_snapshot', None)
+        if locale_snapshot is not None:
+            use_current_locale = True
 
-        if country_code:
-            country = Country.load_country(country_code)
-        if currency_code:
-            country = Country.load_country_by_currency_code(currency_code)
+        autoformat = True
+        country = None
 
-        if country:
-            if country.currency_symbol:
-                currency_symbol = country.currency_symbol
+        if currency_symbol or decimal_separator or thousands_separator:
+            autoformat = False
+
+        if autoformat:
+            currency_symbol = ''
+            decimal_separator = '.'
+            thousands_separator = ','
+
+            if country_code:
+                country = Country.load_country(country_code)
+            if currency_code:
+                country = Country.load_country_by_currency_code(currency_code)
+
+            if country:
+                if country.currency_symbol:
+                    currency_symbol = country.currency_symbol
+                else:
+                    currency_symbol = country.currency_code
+
+                country_code = country.alpha2
+                currency_code = country.currency_code
+                decimal_separator = country.currency_decimal_separator
+                thousands_separator = country.currency_thousands_separator
+                decimal_places = country.currency_decimal_place if "decimal_places" not in kwargs else decimal_places
+        else:
+            currency_symbol = currency_symbol or ''
+            decimal_separator = '.' if decimal_separator is None else decimal_separator
+            thousands_separator = ',' if thousands_separator is None else thousands_separator
+
+        if use_current_locale:
+            if locale_snapshot is None:
+                locale_snapshot = LocaleSnapshot.current()
+            thousands_separator = locale_snapshot.thousands_separator
+            decimal_separator = locale_snapshot.decimal_separator
+
+        self.country = country
+        self.country_code = country_code
+        self.currency_code = currency_code
+        self.currency_symbol = currency_symbol
+        self.decimal_separator = decimal_separator
+        self.thousands_separator = thousands_separator
+        self.decimal_places = decimal_places
+        self.number_format_system = number_format_system
+        self.smart_number_formatting = smart_number_formatting
+        self.place_currency_symbol_at_end = place_currency_symbol_at_end
+        self.use_current_locale = use_current_locale
+        self.locale_snapshot = locale_snapshot
+
+        #* minor units follow the currency's own decimal places, whatever precision is displayed
+        self.minor_unit_places = country.currency_decimal_place if country else decimal_places
+
+        self.numbering_system, self._smart = self._resolve_numbering_system(country_code, number_format_system, smart_number_formatting, use_current_locale)
+        self.grouping = NUMBERING_SYSTEM_GROUPING[self.numbering_system]
+        if locale_snapshot is not None and number_format_system == 'auto':
+            #* the locale's own monetary grouping, e.g. (3, 2) for en_IN
+            self.grouping = locale_snapshot.grouping
+        self._digit_grouping = None
+        self._scale = 10 ** decimal_places
+        self._zero_fraction = decimal_separator + '0' * decimal_places if decimal_places > 0 else ''
+
+        if self._smart:
+            #* smart formatting always groups digits by the numbering system, then appends the unit
+            self._template = '{:.' + str(decimal_places) + 'f}'
+            self._plain_zero_fraction = '.' + '0' * decimal_places if decimal_places > 0 else ''
+            smart_grouping = NUMBERING_SYSTEM_GROUPING[self.numbering_system]
+            if smart_units is None:
+                smart_units = self.numbering_system
+            self._smart_units = smart_units if isinstance(smart_units, SmartUnitTable) else get_unit_table(smart_units)
+            #* units only apply to numbers long enough to show a thousands separator
+            self._smart_min_digits = smart_grouping[0]
+            self._smart_grouping = smart_grouping
+            self._digit_grouping = get_digit_grouping(smart_grouping, thousands_separator)
+            self._format_number = self._format_smart
+        elif self.grouping == (3,) or self.grouping == ():
+            #* grouping natively supported by the format spec, only the separators may need swapping
+            comma = ',' if self.grouping else ''
+            self._template = '{:' + comma + '.' + str(decimal_places) + 'f}'
+            self._int_template = '{:' + comma + '}'
+            translation = {'.': decimal_separator, ',': thousands_separator}
+            self._translation = str.maketrans(translation) if translation != {'.': '.', ',': ','} else None
+            #* `str.replace` is cheaper than `str.translate` on short strings, floats can group with '_' for it
+            self._float_template = None
+            if self._translation is not None and '_' not in decimal_separator:
+                self._float_template = '{:' + ('_' if comma else '') + '.' + str(decimal_places) + 'f}'
+            self._format_number = self._format_native
+        else:
+            self._template = '{:.' + str(decimal_places) + 'f}'
+            self._digit_grouping = get_digit_grouping(self.grouping, thousands_separator)
+            self._format_number = self._format_grouped
+
+        # Same result as `f'{currency_symbol} {formatted_number}'.strip()`, computed once
+        currency_symbol = str(currency_symbol)
+        self._prefix = ''
+        self._suffix = ''
+        if currency_symbol.strip():
+            if place_currency_symbol_at_end:
+                self._suffix = ' ' + currency_symbol.rstrip()
             else:
-                currency_symbol = country.currency_code
-
-            country_code = country.alpha2
-            currency_code = country.currency_code
-            decimal_separator = country.currency_decimal_separator
-            thousands_separator = country.currency_thousands_separator
-            decimal_places = country.currency_decimal_place if "decimal_places" not in kwargs else decimal_places
-
-    if country_code in ('IN', 'BD', 'NP', 'PK'):
-        indian_numbering_system = True
- 
-    if country_code == 'CN':
-        china_numbering_system = True
- 
-    if use_current_locale:
-        localeconv = locale.localeconv()
-        thousands_separator = localeconv.get('mon_thousands_sep', thousands_separator)
-        decimal_separator = localeconv.get('mon_decimal_point', decimal_separator)
-
-    formatting_precision = f'.0{decimal_places}f'
-    formatting = '{:,' + formatting_precision + '}'
-
-    # return formatting
-    formatted_number = formatting.format(number)
-    
-    if number_format_system == 'international' or number_format_system == 'global':
-        formatted_number = smart_format_international_numbering_system(formatted_number) if smart_number_formatting else formatted_number
-    elif number_format_system == 'indian':
-        formatted_number = format_india_numbering_system(formatted_number, smart_number_formatting)
-    elif number_format_system == 'chinese':
-        formatted_number = format_china_numbering_system(formatted_number, smart_number_formatting)
-    elif number_format_system == 'auto':
-        if indian_numbering_system:
-            if not use_current_locale:
-                formatted_number = format_india_numbering_system(formatted_number, smart_number_formatting)
-        elif china_numbering_system:
-            if not use_current_locale:
-                formatted_number = format_china_numbering_system(formatted_number, smart_number_formatting)
-        elif smart_number_formatting:
-            #* smart formatting in international number system asked
-            formatted_number = smart_format_international_numbering_system(formatted_number)
-
-    elif number_format_system == 'none':
-        formatted_number = formatted_number.replace(',', '')
-    else:
+                self._prefix = currency_symbol.lstrip() + ' '
+
+    @staticmethod
+    def _resolve_numbering_system(country_code, number_format_system, smart_number_formatting, use_current_locale):
+        """Resolve `number_format_system` to one of `NUMBERING_SYSTEM_GROUPING` and whether smart formatting applies"""
+        if number_format_system == 'international' or number_format_system == 'global':
+            return 'international', smart_number_formatting
+        elif number_format_system in ('indian', 'chinese'):
+            return number_format_system, smart_number_formatting
+        elif number_format_system == 'none':
+            return 'none', False
+        elif number_format_system == 'auto':
+            if country_code in ('IN', 'BD', 'NP', 'PK'):
+                if not use_current_locale:
+                    return 'indian', smart_number_formatting
+                return 'international', False
+            elif country_code == 'CN':
+                if not use_current_locale:
+                    return 'chinese', smart_number_formatting
+                return 'international', False
+            #* smart formatting in international number system if asked
+            return 'international', smart_number_formatting
         raise ValueError(f"Invalid number_format_system '{number_format_system}'. Supported values are 'international', 'indian', 'chinese', 'auto', 'none'.")
 
-    formatted_number = formatted_number.replace('.', '_')
-    formatted_number = formatted_number.replace(',', thousands_separator)
-    formatted_number = formatted_number.replace('_', decimal_separator)
-    if place_currency_symbol_at_end:
-        return f'{formatted_number} {currency_symbol}'.strip()
-    return f'{currency_symbol} {formatted_number}'.strip()
+    def format(self, number):
+        """Format a single number using the resolved settings. `int` and `Decimal` are formatted exactly, without float conversion"""
+        return self._prefix + self._format_number(number) + self._suffix
+
+    def _format_native(self, number):
+        if type(number) is int:
+            formatted_number = self._int_template.format(number)
+            if self._translation is not None:
+                formatted_number = formatted_number.replace(',', self.thousands_separator)
+            return formatted_number + self._zero_fraction
+        if type(number) is float and self._float_template is not None:
+            return self._float_template.format(number).replace('.', self.decimal_separator).replace('_', self.thousands_separator)
+        #* `Decimal` formatting is exact, rounding with the decimal context (half to even by default)
+        formatted_number = self._template.format(number)
+        if self._translation is not None:
+            formatted_number = formatted_number.translate(self._translation)
+        return formatted_number
 
+    def _format_grouped(self, number):
+        if type(number) is int:
+            digits = str(number)
+            if digits[0] == '-':
+                return '-' + self._digit_grouping.group(digits[1:]) + self._zero_fraction
+            return self._digit_grouping.group(digits) + self._zero_fraction
+        return self._group_number_string(self._template.format(number))
+
+    def _group_number_string(self, formatted_number):
+        """Group the digits of a plain `'-1234.56'` style number string and swap in the separators"""
+        if self.decimal_places > 0:
+            digits = formatted_number[:-self.decimal_places - 1]
+            fraction = self.decimal_separator + formatted_number[-self.decimal_places:]
+        else:
+            digits = formatted_number
+            fraction = ''
+        if not digits.lstrip('-').isdigit():
+            #* nan and infinity
+            return formatted_number
+
+        if digits[0] == '-':
+            return '-' + self._digit_grouping.group(digits[1:]) + fraction
+        return self._digit_grouping.group(digits) + fraction
+
+    def _format_smart(self, number):
+        if type(number) is int:
+            return self._smart_format_number_string(str(number) + self._plain_zero_fraction)
+        return self._smart_format_number_string(self._template.format(number))
+
+    def _smart_format_number_string(self, formatted_number):
+        """Smart format a plain `'-1234.56'` style number string"""
+        digits = formatted_number[:-self.decimal_places - 1] if self.decimal_places > 0 else formatted_number
+        digits = digits.lstrip('-')
+        if len(digits) <= self._smart_min_digits or not digits.isdigit():
+            return self._group_number_string(formatted_number)
+
+        split = self._smart_units.split(float(formatted_number))
+        if split is None:
+            return self._group_number_string(formatted_number)
+
+        scaled, unit = split
+        formatted_number = self._group_number_string(self._template.format(round(scaled, self.decimal_places)))
+        if unit:
+            return formatted_number + ' ' + unit
+        return formatted_number
 
-def format_india_numbering_system(number_str, smart_format = False):
+    def format_minor_units(self, minor_units):
+        """
+        Format an integer amount of minor units, e.g. cents, using integer arithmetic only.
+
+        Parameters:
+        - minor_units (int): The amount in the currency's minor unit, as given by the country's decimal places
+          (`minor_unit_places`). Rounded half to even when fewer decimal places are displayed.
+
+        Returns:
+        - str: The formatted currency string.
+        """
+        shift = self.decimal_places - self.minor_unit_places
+        if shift >= 0:
+            units = minor_units * 10 ** shift
+        else:
+            units = round_half_even_division(minor_units, 10 ** -shift)
+
+        integer, fraction = divmod(abs(units), self._scale)
+        if self._smart:
+            formatted_number = str(integer)
+            if self.decimal_places > 0:
+                formatted_number += '.' + str(fraction).zfill(self.decimal_places)
+            formatted_number = self._smart_format_number_string('-' + formatted_number if minor_units < 0 else formatted_number)
+        else:
+            if self._digit_grouping is None:
+                formatted_number = self._int_template.format(integer)
+                if self._translation is not None:
+                    formatted_number = formatted_number.replace(',', self.thousands_separator)
+            else:
+                formatted_number = self._digit_grouping.group(str(integer))
+            if self.decimal_places > 0:
+                formatted_number += self.decimal_separator + str(fraction).zfill(self.decimal_places)
+            if minor_units < 0:
+                formatted_number = '-' + formatted_number
+        return self._prefix + formatted_number + self._suffix
+
+    def format_many(self, numbers):
+        """
+        Format a batch of numbers using the resolved settings.
+
+        Parameters:
+        - numbers: Any iterable of numbers, an `array.array`, or a NumPy array.
+
+        Returns:
+        - list of str: The formatted currency strings, in input order.
+
+        Notes:
+        - Arrays are formatted in vectorized form when NumPy is installed, otherwise each number is formatted with `format`.
+        - Smart number formatting always goes through `format`.
+        """
+        if not self._smart and vectorized.is_array_like(numbers):
+            result = vectorized.format_array(numbers, self.decimal_places, self.grouping, self.thousands_separator,
+                                             self.decimal_separator, self._prefix, self._suffix, self.format)
+            if result is not None:
+                return result
+        return list(map(self.format, numbers))
+
+    def format_series(self, numbers, unit='max'):
+        """
+        Smart format a series of numbers with one shared unit, instead of a unit per number.
+
+        Parameters:
+        - numbers: Any iterable of numbers, an `array.array`, or a NumPy array.
+        - unit (str or callable, optional): How the shared unit is picked from the absolute values. Defaults to `max`.
+            - `max`, `median` or `min` uses the unit of that amount
+            - a unit name of the unit table, e.g. `'Million'` or `'Crore'`, uses that unit
+            - a callable is given the list of absolute values and returns the amount to use the unit of
+
+        Returns:
+        - list of str: The formatted currency strings, in input order.
+
+        Notes:
+        - Every number is divided by the unit and shown with `decimal_places`, negative numbers included. The base
+          unit is not shown.
+        - nan and infinity are left out when picking the unit, and shown without it.
+        - Without smart formatting (e.g. `number_format_system='none'`) this is the same as `format_many`.
+        """
+        if not self._smart:
+            return self.format_many(numbers)
+
+        np = vectorized.load_numpy() if vectorized.is_array_like(numbers) else None
+        if np is not None:
+            values = np.asarray(numbers).ravel()
+            if values.dtype.kind not in 'iuf':
+                np = None
+        if np is not None:
+            magnitudes = np.abs(values[np.isfinite(values)]).astype(np.float64).tolist()
+        else:
+            values = numbers if isinstance(numbers, (list, tuple)) else list(numbers)
+            magnitudes = [abs(value) for value in map(float, values) if math.isfinite(value)]
+
+        index = self._smart_units.series_unit(magnitudes, unit, self.decimal_places)
+        multiplier = self._smart_units.multipliers[index]
+        unit_name = self._smart_units.units[index]
+        suffix = (' ' + unit_name if index > 0 and unit_name else '') + self._suffix
+
+        def format_scaled(scaled):
+            if not math.isfinite(scaled):
+                return self._prefix + self._template.format(scaled) + self._suffix
+            return self._prefix + self._group_number_string(self._template.format(scaled)) + suffix
+
+        if np is not None:
+            result = vectorized.format_array(values / multiplier, self.decimal_places, self._smart_grouping, self.thousands_separator,
+                                             self.decimal_separator, self._prefix, suffix, format_scaled)
+            if result is not None:
+                return result
+            values = values.tolist()
+
+        from decimal import Decimal
+
+        #* `Decimal` amounts stay exact, ints divide to the nearest float as in the array path
+        return [format_scaled(Decimal(number) / multiplier if isinstance(number, Decimal) else number / multiplier) for number in values]
+
+
+def round_half_even_division(dividend, divisor):
+    """Integer division of `dividend` by a positive `divisor`, rounding the magnitude half to even"""
+    quotient, remainder = divmod(abs(dividend), divisor)
+    if remainder * 2 > divisor or (remainder * 2 == divisor and quotient % 2 == 1):
+        quotient += 1
+    return -quotient if dividend < 0 else quotient
+
+
+INTERNATIONAL_DIGIT_GROUPING = get_digit_grouping(NUMBERING_SYSTEM_GROUPING['international'], ',')
+INDIAN_DIGIT_GROUPING = get_digit_grouping(NUMBERING_SYSTEM_GROUPING['indian'], ',')
+CHINESE_DIGIT_GROUPING = get_digit_grouping(NUMBERING_SYSTEM_GROUPING['chinese'], ',')
+
+
+def regroup_number_string(number_str, digit_grouping):
+    """Regroup the integer part of a `'{:,}'` style number string"""
     is_negative = number_str.startswith('-')
 
     if is_negative:
         number_str = number_str[1:]
 
-    number_str = number_str.replace(',', '')
-    s, *d = number_str.partition(".")
-    r = ",".join([s[x-2:x] for x in range(-3, -len(s), -2)][::-1] + [s[-3:]])
-    result = "".join([r] + d)
+    integer, point, fraction = number_str.replace(',', '').partition('.')
+    result = digit_grouping.group(integer) + point + fraction
 
     if is_negative:
         return '-' + result
+    return result
 
-    if smart_format:
+
+def format_india_numbering_system(number_str, smart_format = False):
+    result = regroup_number_string(number_str, INDIAN_DIGIT_GROUPING)
+
+    if smart_format and not result.startswith('-'):
         return smart_format_india_numbering_system(result)
     return result
 
 
 def format_china_numbering_system(number_str, smart_format = False):
-    is_negative = number_str.startswith('-')
+    result = regroup_number_string(number_str, CHINESE_DIGIT_GROUPING)
 
-    if is_negative:
-        number_str = number_str[1:]
+    if smart_format and not result.startswith('-'):
+        return smart_format_chinese_numbering_system(result)
+    return result
 
-    number_str = number_str.replace(',', '')
-    s, *d = number_str.partition(".")
-    r = ",".join([s[x-4:x] for x in range(-4, -len(s), -4)][::-1] + [s[-4:]])
-    result = "".join([r] + d)
+def smart_format_number_string(formatted_number, unit_table, digit_grouping):
+    """
+    Smart format a `'{:,}'` style number string with a unit table, e.g. '12,345,678.90' to '1.23 Crore'.
 
-    if is_negative:
-        return '-' + result
+    Numbers without commas are returned as they are, negative numbers always use the base unit.
+    """
+    if ',' not in formatted_number:
+        return formatted_number
 
-    if smart_format:
-        return smart_format_chinese_numbering_system(result)
-    return result
+    decimal_places = len(formatted_number.partition('.')[2])
+    value = float(formatted_number.replace(',', ''))
+    scaled, unit = unit_table.split(value) if value >= 0 else (value, unit_table.units[0])
+    return regroup_number_string(f"{round(scaled, decimal_places):,.{decimal_places}f}", digit_grouping) + ' ' + unit
 
 def smart_format_numbering_system_according_to_supplied_units(formatted_number, units_dict: dict):
     """
@@ -217,28 +553,12 @@ def smart_format_india_numbering_system(formatted_number) -> str:
     - str: The formatted number string in the Indian numbering system.
 
     Notes:
-    - Uses the `smart_format_numbering_system_according_to_supplied_units` function with predefined units for Indian numbering.
+    - Uses the registered `indian` unit table, see `register_unit_table`.
     - Example:
         >>> smart_format_india_numbering_system('12345678.90')
         '1.23 crore'
     """
-    smartly_formatted_number = smart_format_numbering_system_according_to_supplied_units(
-        formatted_number,
-        units_dict={
-            'only': 1,
-            'hazaar': 1000,
-            'lakhs': 100,
-            'crore': 100,
-            'sau crore': 100,
-            'hazaar crore': 10,
-            'lakh crore': 100,
-            'crore crore': 100,
-        }
-    )
-
-    if ',' not in formatted_number:
-        return ''.join(smartly_formatted_number)
-    return format_india_numbering_system(smartly_formatted_number[0]) + ' ' + smartly_formatted_number[1]
+    return smart_format_number_string(formatted_number, get_unit_table('indian'), INDIAN_DIGIT_GROUPING)
 
 def smart_format_international_numbering_system(formatted_number) -> str:
     """
@@ -251,27 +571,12 @@ def smart_format_international_numbering_system(formatted_number) -> str:
     - str: The formatted number string in the international numbering system.
 
     Notes:
-    - Uses the `smart_format_numbering_system_according_to_supplied_units` function with predefined units for international numbering.
+    - Uses the registered `international` unit table, see `register_unit_table`.
     - Example:
         >>> smart_format_international_numbering_system('12345678.90')
         '12.35 million'
     """
-    smartly_formatted_number = smart_format_numbering_system_according_to_supplied_units(
-        formatted_number,
-        units_dict = {
-            'only': 1,
-            'Thousands': 1000,
-            'Million': 1000,
-            'Billion': 1000,
-            'Trillion': 1000,
-            'Quadrillion': 1000,
-            'Quintillion': 1000,
-        }
-    )
-
-    if ',' not in formatted_number:
-        return ''.join(smartly_formatted_number)
-    return ' '.join(smartly_formatted_number)
+    return smart_format_number_string(formatted_number, get_unit_table('international'), INTERNATIONAL_DIGIT_GROUPING)
 
 def smart_format_chinese_numbering_system(formatted_number) -> str:
     """
@@ -284,22 +589,9 @@ def smart_format_chinese_numbering_system(formatted_number) -> str:
     - str: The formatted number string in the Chinese numbering system.
 
     Notes:
-    - Uses the `smart_format_numbering_system_according_to_supplied_units` function with predefined units for Chinese numbering.
+    - Uses the registered `chinese` unit table, see `register_unit_table`.
     - Example:
         >>> smart_format_chinese_numbering_system('12345678.90')
         '1.23 千万'
     """
-    smartly_formatted_number = smart_format_numbering_system_according_to_supplied_units(
-        formatted_number,
-        units_dict = {
-            'only': 1,
-            '万': 10000,
-            '亿': 10000,
-            '千亿': 1000,
-            '万亿': 10,
-            }
-        )
-
-    if ',' not in formatted_number:
-        return ''.join(smartly_formatted_number)
-    return format_china_numbering_system(smartly_formatted_number[0]) + ' ' + smartly_formatted_number[1]
+    return smart_format_number_string(formatted_number, get_unit_table('chinese'), CHINESE_DIGIT_GROUPING)
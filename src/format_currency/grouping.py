@@ -0,0 +1,92 @@
+"""Table-driven digit grouping"""
+import itertools
+import operator
+
+#: Digit group sizes, from the right, for each numbering system. The last size repeats.
+NUMBERING_SYSTEM_GROUPING = {
+    'international': (3,),
+    'indian': (3, 2),
+    'chinese': (4,),
+    'none': (),
+}
+
+
+def group_sizes(grouping):
+    """Yield digit group sizes from the least significant group, repeating the last one. A size of 0 takes all remaining digits"""
+    return itertools.chain(grouping, itertools.repeat(grouping[-1]))
+
+
+def group_bounds(grouping, length):
+    """
+    Slice bounds, from the left, of the digit groups in a number of `length` digits.
+
+    Example:
+        >>> group_bounds((3, 2), 7)
+        [(0, 2), (2, 4), (4, 7)]
+    """
+    if not grouping:
+        return [(0, length)]
+
+    bounds = []
+    end = length
+    for size in group_sizes(grouping):
+        start = max(end - size, 0) if size else 0
+        bounds.append((start, end))
+        if start == 0:
+            break
+        end = start
+    return bounds[::-1]
+
+
+class DigitGrouping():
+    """
+    Inserts a separator between digit groups in one pass.
+
+    The slices for each number length are computed once and kept in a table, so grouping a number costs a single
+    `itemgetter` call and a `join`.
+
+    Parameters:
+    - grouping (tuple): Digit group sizes from the right, the last size repeats, e.g. `(3,)`, `(3, 2)` or `(4,)`.
+      An empty tuple disables grouping, and a final size of 0 stops grouping after the previous groups.
+    - separator (str): The thousands separator.
+
+    Example:
+        >>> DigitGrouping((3, 2), ',').group('1234567')
+        '12,34,567'
+    """
+    def __init__(self, grouping, separator):
+        super().__init__()
+        self.grouping = tuple(grouping)
+        self.separator = separator
+        self._splitters = {}
+
+    def _splitter(self, length):
+        bounds = group_bounds(self.grouping, length)
+        if len(bounds) == 1:
+            splitter = None
+        else:
+            splitter = operator.itemgetter(*[slice(start, end) for start, end in bounds])
+        self._splitters[length] = splitter
+        return splitter
+
+    def group(self, digits):
+        """Group a string of digits, without sign or decimal part"""
+        try:
+            splitter = self._splitters[len(digits)]
+        except KeyError:
+            splitter = self._splitter(len(digits))
+        if splitter is None:
+            return digits
+        return self.separator.join(splitter(digits))
+
+
+cached_digit_groupings = {}
+
+
+def get_digit_grouping(grouping, separator):
+    """Shared `DigitGrouping` for a grouping and separator, so every formatter reuses the same slice tables"""
+    key = (tuple(grouping), separator)
+    digit_grouping = cached_digit_groupings.get(key, None)
+    if digit_grouping is None:
+        digit_grouping = cached_digit_groupings.setdefault(key, DigitGrouping(grouping, separator))
+    return digit_grouping
@@ -0,0 +1,208 @@
+"""
+Opt-in instrumentation of the hot paths.
+
+While disabled nothing is wrapped, so formatting runs the exact same code as without this module. Enabling swaps
+instrumented versions of the `Country` lookups and `CurrencyFormatter` methods in, disabling swaps the originals back.
+"""
+import collections
+import threading
+import time
+
+from . import cache as cache_module
+from . import country as country_module
+from .country import Country, MISSING
+from .format import CurrencyFormatter
+
+StatsEvent = collections.namedtuple('StatsEvent', ['kind', 'name', 'seconds'])
+
+# Raw-code caches of each `Country` lookup, checked before the lookup runs to tell hits from misses
+LOOKUP_CACHES = {
+    'load_country': ('alpha2', country_module.cached_countries_data_dict),
+    'load_country_by_alpha3': ('alpha3', country_module.cached_countries_data_by_alpha3_dict),
+    'load_country_by_numeric': ('numeric', country_module.cached_countries_data_by_numeric_dict),
+    'load_country_by_currency_code': ('currency_code', country_module.cached_countries_data_by_currency_code_dict),
+}
+FORMATTER_METHODS = ('format', 'format_many', 'format_minor_units')
+
+stats_lock = threading.Lock()
+counters = collections.Counter()
+durations = collections.Counter()
+# (kind, name) -> Counter of latency bucket -> count, buckets are powers of two in nanoseconds
+histograms = collections.defaultdict(collections.Counter)
+callbacks = []
+# Original attributes of the wrapped classes, present only while enabled
+originals = {}
+record_latency = False
+
+
+def record(kind, name, seconds=None, count=1):
+    with stats_lock:
+        counters[kind, name] += count
+        if seconds is not None:
+            durations[kind, name] += seconds
+            if record_latency:
+                histograms[kind, name][1 << int(seconds * 1e9).bit_length()] += 1
+    for callback in callbacks:
+        callback(StatsEvent(kind, name, seconds))
+
+
+def format_path(formatter):
+    """Name of the code path a formatter takes, e.g. `auto:indian` or `international:international.smart`"""
+    path = formatter.number_format_system + ':' + formatter.numbering_system
+    if formatter._smart:
+        return path + '.smart'
+    return path
+
+
+def instrument_lookup(method_name, index_name, cache):
+    lookup = originals[Country, method_name].__func__
+
+    def instrumented_lookup(cls, code):
+        cached = cache.get(code, MISSING)
+        if cached is MISSING:
+            outcome = 'misses'
+        elif cached is None:
+            outcome = 'negative_hits'
+        else:
+            outcome = 'hits'
+        start = time.perf_counter()
+        result = lookup(cls, code)
+        record('lookup', index_name + '.' + outcome, time.perf_counter() - start)
+        return result
+
+    return classmethod(instrumented_lookup)
+
+
+def instrument_data_file():
+    load_data_file = originals[Country, 'load_data_file'].__func__
+
+    def instrumented_load_data_file(filename):
+        start = time.perf_counter()
+        result = load_data_file(filename)
+        record('data_load', filename, time.perf_counter() - start)
+        return result
+
+    return staticmethod(instrumented_load_data_file)
+
+
+def instrument_formatter_init():
+    init = originals[CurrencyFormatter, '__init__']
+
+    def instrumented_init(self, *args, **kwargs):
+        start = time.perf_counter()
+        init(self, *args, **kwargs)
+        record('formatter', format_path(self), time.perf_counter() - start)
+
+    return instrumented_init
+
+
+def instrument_formatter_method(method_name):
+    method = originals[CurrencyFormatter, method_name]
+
+    def instrumented_method(self, numbers):
+        start = time.perf_counter()
+        result = method(self, numbers)
+        record(method_name, format_path(self), time.perf_counter() - start, len(result) if method_name == 'format_many' else 1)
+        return result
+
+    return instrumented_method
+
+
+def enable_instrumentation(latency=False, callback=None):
+    """
+    Start counting calls per code path, country lookup cache outcomes and data loading time.
+
+    Parameters:
+    - latency (bool, optional): Also record latency histograms. Defaults to False.
+    - callback (callable, optional): Called with a `StatsEvent(kind, name, seconds)` for every recorded event, e.g.
+      to export to a metrics system. Defaults to None.
+
+    Notes:
+    - Counting only happens in the current process, `format_currency_parallel` workers are not counted.
+    - Enabling drops the caches of `enable_format_cache`, so formatters are created and counted again. Amounts
+      served from its result cache afterwards are not counted as `format` calls.
+    """
+    global record_latency
+
+    with stats_lock:
+        record_latency = latency
+        if callback is not None and callback not in callbacks:
+            callbacks.append(callback)
+        if originals:
+            return
+
+        for method_name in list(LOOKUP_CACHES) + ['load_data_file']:
+            originals[Country, method_name] = Country.__dict__[method_name]
+        for method_name in ('__init__',) + FORMATTER_METHODS:
+            originals[CurrencyFormatter, method_name] = CurrencyFormatter.__dict__[method_name]
+
+        for method_name, (index_name, cache) in LOOKUP_CACHES.items():
+            setattr(Country, method_name, instrument_lookup(method_name, index_name, cache))
+        Country.load_data_file = instrument_data_file()
+        CurrencyFormatter.__init__ = instrument_formatter_init()
+        for method_name in FORMATTER_METHODS:
+            setattr(CurrencyFormatter, method_name, instrument_formatter_method(method_name))
+        #* formatters reused by `format_currency` are resolved again, so their creation and lookups are counted
+        cache_module.clear_format_cache()
+
+
+def disable_instrumentation():
+    """Put the original methods back and drop the callbacks. Collected stats are kept until `reset_stats`"""
+    with stats_lock:
+        for (cls, method_name), original in originals.items():
+            setattr(cls, method_name, original)
+        originals.clear()
+        callbacks.clear()
+
+
+def instrumentation_enabled():
+    return bool(originals)
+
+
+def reset_stats():
+    """Forget everything recorded so far"""
+    with stats_lock:
+        counters.clear()
+        durations.clear()
+        histograms.clear()
+
+
+def stats():
+    """
+    Snapshot of the recorded stats.
+
+    Returns:
+    - dict: With the keys
+        - `enabled`: Whether instrumentation is on.
+        - `calls`: `{'format' | 'format_many' | 'format_minor_units' | 'formatter': {path: count}}`, where the path is
+          the requested and resolved numbering system, e.g. `auto:indian`, with `.smart` appended for smart
+          formatting. `format_many` counts numbers, which also count as `format` calls unless they were formatted in
+          vectorized form. `formatter` counts formatters created.
+        - `lookups`: `{'alpha2' | 'alpha3' | 'numeric' | 'currency_code': {'hits', 'negative_hits', 'misses'}}`.
+        - `data_loads`: `{filename: {'count', 'seconds'}}`.
+        - `seconds`: Time spent per kind and name, e.g. `seconds['lookup']['alpha2.misses']`.
+        - `latency`: `{kind: {name: {bucket: count}}}`, buckets are the upper bounds in nanoseconds. Only filled when
+          enabled with `latency=True`.
+    """
+    with stats_lock:
+        snapshot = {
+            'enabled': instrumentation_enabled(),
+            'calls': {},
+            'lookups': {index_name: {'hits': 0, 'negative_hits': 0, 'misses': 0} for index_name, _ in LOOKUP_CACHES.values()},
+            'data_loads': {},
+            'seconds': {},
+            'latency': {},
+        }
+        for (kind, name), count in counters.items():
+            if kind == 'lookup':
+                index_name, outcome = name.split('.')
+                snapshot['lookups'][index_name][outcome] = count
+            elif kind == 'data_load':
+                snapshot['data_loads'][name] = {'count': count, 'seconds': durations[kind, name]}
+            else:
+                snapshot['calls'].setdefault(kind, {})[name] = count
+        for (kind, name), seconds in durations.items():
+            snapshot['seconds'].setdefault(kind, {})[name] = seconds
+        for (kind, name), histogram in histograms.items():
+            snapshot['latency'].setdefault(kind, {})[name] = dict(sorted(histogram.items()))
+        return snapshot
@@ -0,0 +1,117 @@
+"""Monetary conventions captured from the C locale. `locale` is imported on first capture"""
+import threading
+
+# Snapshots keyed by the LC_MONETARY locale name they were captured under
+cached_locale_snapshots = {}
+locale_snapshots_lock = threading.Lock()
+
+
+def grouping_from_localeconv(mon_grouping):
+    """
+    Convert a `localeconv()` grouping list into digit group sizes as used by `DigitGrouping`.
+
+    A trailing 0 repeats the previous size, `CHAR_MAX` stops grouping. That is kept as a final size of 0.
+
+    Example:
+        >>> grouping_from_localeconv([3, 2, 0])
+        (3, 2)
+    """
+    import locale
+
+    sizes = []
+    for size in mon_grouping:
+        if size == 0:
+            break
+        if size == locale.CHAR_MAX:
+            if sizes:
+                sizes.append(0)
+            break
+        sizes.append(size)
+    return tuple(sizes)
+
+
+class LocaleSnapshot():
+    """
+    Immutable copy of the monetary separators and grouping of a locale.
+
+    Capturing once avoids calling `locale.localeconv()` on every format, and a snapshot can be passed explicitly
+    (`format_currency(..., locale_snapshot=snapshot)`) so threads can use different conventions without touching the
+    process-wide locale.
+
+    Parameters:
+    - thousands_separator (str): Monetary thousands separator (`mon_thousands_sep`).
+    - decimal_separator (str): Monetary decimal separator (`mon_decimal_point`).
+    - grouping (tuple): Digit group sizes from the right, the last size repeats (converted from `mon_grouping`).
+    - name (str, optional): Name of the locale the snapshot was captured from.
+    """
+    __slots__ = ('thousands_separator', 'decimal_separator', 'grouping', 'name')
+
+    def __init__(self, thousands_separator, decimal_separator, grouping=(3,), name=None):
+        object.__setattr__(self, 'thousands_separator', thousands_separator)
+        object.__setattr__(self, 'decimal_separator', decimal_separator)
+        object.__setattr__(self, 'grouping', tuple(grouping))
+        object.__setattr__(self, 'name', name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __repr__(self):
+        return (f'{type(self).__name__}(thousands_separator={self.thousands_separator!r}, '
+                f'decimal_separator={self.decimal_separator!r}, grouping={self.grouping!r}, name={self.name!r})')
+
+    def __eq__(self, other):
+        if not isinstance(other, LocaleSnapshot):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __reduce__(self):
+        #* `__setattr__` refuses the default unpickling, e.g. in `format_currency_parallel` workers
+        return (LocaleSnapshot, (self.thousands_separator, self.decimal_separator, self.grouping, self.name))
+
+    def key(self):
+        return (self.thousands_separator, self.decimal_separator, self.grouping)
+
+    @classmethod
+    def from_localeconv(cls, localeconv, name=None):
+        """Build a snapshot from a `locale.localeconv()` dict"""
+        return cls(
+            thousands_separator=localeconv.get('mon_thousands_sep', ','),
+            decimal_separator=localeconv.get('mon_decimal_point', '.'),
+            grouping=grouping_from_localeconv(localeconv.get('mon_grouping', [3, 0])),
+            name=name,
+        )
+
+    @classmethod
+    def capture(cls):
+        """Capture the conventions of the current process locale, always calling `locale.localeconv()`"""
+        import locale
+
+        return cls.from_localeconv(locale.localeconv(), name=locale.setlocale(locale.LC_MONETARY))
+
+    @classmethod
+    def current(cls):
+        """
+        Snapshot of the current process locale.
+
+        Snapshots are cached by the LC_MONETARY locale name, so `locale.localeconv()` only runs again after
+        `locale.setlocale` switches to a locale that was not seen before.
+        """
+        import locale
+
+        name = locale.setlocale(locale.LC_MONETARY)
+        snapshot = cached_locale_snapshots.get(name, None)
+        if snapshot is None:
+            with locale_snapshots_lock:
+                snapshot = cached_locale_snapshots.get(name, None)
+                if snapshot is None:
+                    snapshot = cls.from_localeconv(locale.localeconv(), name=name)
+                    cached_locale_snapshots[name] = snapshot
+        return snapshot
+
+    @staticmethod
+    def clear_cache():
+        """Forget cached snapshots, e.g. after locale data on disk changed"""
+        cached_locale_snapshots.clear()
@@ -0,0 +1,97 @@
+"""Bulk formatting across a process pool"""
+import array
+import itertools
+import os
+
+from . import cache as cache_module
+from .country import Country
+from .format import CurrencyFormatter
+
+# Formatted strings never contain NUL, so each chunk travels back as a single string
+RESULT_SEPARATOR = '\x00'
+
+
+def init_worker():
+    """Process pool initializer, loads the country tables once per worker"""
+    Country.load_countries_index()
+
+
+def format_chunk(options, chunk):
+    formatter_args, formatter_kwargs = options
+    #* the worker's formatters are kept like those of `format_currency`: bounded, and keyed by the data versions too
+    formatter = cache_module.get_formatter(formatter_args, dict(formatter_kwargs))
+    return RESULT_SEPARATOR.join(formatter.format_many(chunk))
+
+
+def iter_chunks(numbers, chunk_size):
+    """
+    Split `numbers` into chunks that are cheap to send to a worker.
+
+    NumPy arrays and `array.array` are sliced, so they are pickled as raw buffers. Other iterables are batched, and
+    batches of plain floats are packed into `array.array('d')`. Other batches, such as ints and `Decimal`, stay lists
+    to keep them exact.
+    """
+    if isinstance(numbers, array.array) or hasattr(numbers, '__array_interface__'):
+        for start in range(0, len(numbers), chunk_size):
+            yield numbers[start:start + chunk_size]
+        return
+
+    iterator = iter(numbers)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if all(type(number) is float for number in chunk):
+            chunk = array.array('d', chunk)
+        yield chunk
+
+
+def create_executor(workers=None):
+    """Start a process pool whose workers load the country tables once, for reuse across batches"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+
+
+def format_currency_parallel(numbers, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None, use_current_locale=False, workers=None, chunk_size=100000, executor=None, **kwargs):
+    """
+    Formats a large batch of numbers as currency strings in a process pool.
+
+    Accepts the same parameters as `format_currency_many`, plus:
+    - workers (int, optional): Number of worker processes. Defaults to `os.cpu_count()`. With 1 worker and no
+      `executor` the batch is formatted in the calling process.
+    - chunk_size (int, optional): Numbers sent to a worker at a time. Defaults to 100000.
+    - executor (concurrent.futures.ProcessPoolExecutor, optional): Reuse a pool, e.g. from `create_executor`,
+      instead of starting one per call.
+
+    Returns:
+    - list of str: The formatted currency strings, in input order.
+
+    Notes:
+    - Options are validated in the calling process, so invalid arguments raise before any work is sent.
+    - Each worker resolves the formatter once per distinct set of options.
+    - With `use_current_locale=True` each worker reads its own locale settings.
+    """
+    formatter_args = (country_code, currency_code, currency_symbol, decimal_separator, thousands_separator, use_current_locale)
+    formatter = CurrencyFormatter(*formatter_args, **kwargs)
+
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if executor is None and workers <= 1:
+        return formatter.format_many(numbers)
+
+    options = (formatter_args, tuple(sorted(kwargs.items())))
+    own_executor = executor is None
+    if own_executor:
+        executor = create_executor(workers)
+    try:
+        result = []
+        chunks = iter_chunks(numbers, chunk_size)
+        for formatted in executor.map(format_chunk, itertools.repeat(options), chunks):
+            result.extend(formatted.split(RESULT_SEPARATOR))
+        return result
+    finally:
+        if own_executor:
+            executor.shutdown()
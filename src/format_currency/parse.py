@@ -0,0 +1,227 @@
+"""Parse formatted currency strings back into amounts"""
+import collections
+import functools
+import re
+import threading
+from decimal import Decimal
+
+from . import country as country_module
+from .country import Country
+from . import smart_units
+from .format import CurrencyFormatter
+from .symbols import DEFAULT_CURRENCY_PREFERENCE, currency_ranks
+
+ParsedCurrency = collections.namedtuple('ParsedCurrency', ['amount', 'currency_code'])
+
+# Symbol or currency code -> country, for detecting the currency of a string. Built once from the countries index
+cached_symbol_index = None
+symbol_index_lock = threading.Lock()
+
+# Parsers used by `parse_currency`, keyed by their arguments. Cleared when full, like the country lookup caches
+cached_currency_parsers = {}
+# The countries data version the caches above were built from
+cached_countries_data_version = 0
+MAX_CACHED_PARSERS = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_grammar(currency_symbol, thousands_separator, decimal_separator, _unit_tables_version=0):
+    """
+    Compile the pattern of the strings `format_currency` produces for one set of conventions.
+
+    The symbol may lead or trail the number, digits may be grouped in any numbering system, and a unit of any
+    registered smart unit table may follow the number. Groups are sign, integer digits, fraction digits and unit.
+    `_unit_tables_version` is not read, it only keys the `lru_cache`, so tables registered later are picked up.
+    """
+    number = r'(-?)([0-9]+'
+    if thousands_separator:
+        number += r'(?:' + re.escape(thousands_separator) + r'[0-9]+)*'
+    number += r')(?:' + re.escape(decimal_separator) + r'([0-9]+))?'
+    units = '|'.join(re.escape(unit) for unit in sorted(smart_units.unit_multipliers, key=len, reverse=True))
+    pattern = number + r'(?: (' + units + r'))?'
+
+    symbol = currency_symbol.strip()
+    if symbol:
+        pattern = r'(?:' + re.escape(symbol) + r' )?' + pattern + r'(?: ' + re.escape(symbol) + r')?'
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def number_conventions(country):
+    return (country.currency_thousands_separator, country.currency_decimal_separator, country.currency_decimal_place)
+
+
+def load_symbol_index():
+    """
+    Map each currency symbol and currency code to the countries using it.
+
+    Only the first country of each distinct combination of separators and decimal places is kept, so every candidate
+    stands for a different way of writing the number.
+    """
+    global cached_symbol_index
+
+    discard_stale_caches()
+    symbol_index = cached_symbol_index
+    if symbol_index is not None:
+        return symbol_index
+
+    with symbol_index_lock:
+        if cached_symbol_index is None:
+            ranks = currency_ranks(DEFAULT_CURRENCY_PREFERENCE)
+            countries = sorted(Country.load_all_countries(), key=lambda country: ranks.get(country.currency_code, len(ranks)))
+            #* the formatter falls back to the currency code when a country has no symbol, symbols are tried first
+            keyed_countries = [((country.currency_symbol or '').strip(), country) for country in countries]
+            keyed_countries += [(country.currency_code, country) for country in countries]
+            index = {}
+            for symbol, country in keyed_countries:
+                if not symbol:
+                    continue
+                candidates = index.setdefault(symbol, [])
+                if all(number_conventions(other) != number_conventions(country) for other in candidates):
+                    candidates.append(country)
+            cached_symbol_index = {symbol: tuple(candidates) for symbol, candidates in index.items()}
+        return cached_symbol_index
+
+
+def parse_currency(text, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None):
+    """
+    Parses a currency string, such as one produced by `format_currency`, into an exact amount.
+
+    Parameters:
+    - text (str): The currency string, e.g. 'Rp 1.234.567,89', '12,34,567.89 ₹' or '$ 1.23 Million'.
+    - country_code (str, optional): The country code whose formatting rules the string follows. Defaults to None.
+    - currency_code (str, optional): The currency code whose formatting rules the string follows. Defaults to None.
+    - currency_symbol (str, optional): The symbol used in the string. Defaults to None.
+    - decimal_separator (str, optional): The decimal separator used in the string. Defaults to None.
+    - thousands_separator (str, optional): The thousands separator used in the string. Defaults to None.
+
+    Returns:
+    - ParsedCurrency: A `(amount, currency_code)` named tuple. `amount` is a `Decimal`, `currency_code` is None
+      when the currency is unknown.
+
+    Notes:
+    - Without `country_code`, `currency_code` or `currency_symbol` the currency is detected from the symbol in the
+      string. A symbol shared by several countries resolves to the first of them whose separators and decimal places
+      match the string, ranked by `DEFAULT_CURRENCY_PREFERENCE` and then in countries data order.
+    - Smart formatting units ('Million', 'crore', '万', ...) are multiplied out, so the amount is as precise as the
+      displayed digits.
+    - Raises `ValueError` when the string doesn't follow the formatting rules.
+    """
+    return get_currency_parser(country_code, currency_code, currency_symbol, decimal_separator, thousands_separator).parse(text)
+
+
+def discard_stale_caches():
+    """Drop the symbol index and parsers once the countries data changed, e.g. after `register_currency`"""
+    global cached_symbol_index, cached_countries_data_version
+
+    version = country_module.countries_data_version
+    if cached_countries_data_version != version:
+        with symbol_index_lock:
+            cached_symbol_index = None
+            cached_currency_parsers.clear()
+            cached_countries_data_version = version
+
+
+def get_currency_parser(*args):
+    """A shared `CurrencyParser` for the given arguments, built on first use"""
+    discard_stale_caches()
+    parser = cached_currency_parsers.get(args, None)
+    if parser is None:
+        if len(cached_currency_parsers) >= MAX_CACHED_PARSERS:
+            cached_currency_parsers.clear()
+        parser = cached_currency_parsers[args] = CurrencyParser(*args)
+    return parser
+
+
+def parse_currency_many(texts, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None):
+    """
+    Parses a batch of currency strings that follow the same formatting rules.
+
+    Accepts the same parameters as `parse_currency`, except that `texts` is an iterable of strings. The rules and
+    their pattern are resolved once for the whole batch.
+
+    Returns:
+    - list of ParsedCurrency: The parsed amounts, in input order.
+    """
+    return CurrencyParser(country_code, currency_code, currency_symbol, decimal_separator, thousands_separator).parse_many(texts)
+
+
+class CurrencyParser():
+    """
+    Reusable currency string parser, the reverse of `CurrencyFormatter`.
+
+    Resolves the country, symbol and separators once and compiles their pattern, so that each call to `parse` is a
+    single match. Accepts the same parameters as `parse_currency`.
+
+    Example:
+        >>> parser = CurrencyParser('ID')
+        >>> parser.parse('Rp 1.234.567,89')
+        ParsedCurrency(amount=Decimal('1234567.89'), currency_code='IDR')
+    """
+    def __init__(self, country_code=None, currency_code=None, currency_symbol=None, decimal_separator=None, thousands_separator=None):
+        super().__init__()
+        #* same resolution rules as formatting, so both directions agree on symbol and separators
+        formatter = CurrencyFormatter(country_code, currency_code, currency_symbol, decimal_separator, thousands_separator)
+        self.detect_currency = country_code is None and currency_code is None and currency_symbol is None
+        self.currency_code = formatter.currency_code
+        self.currency_symbol = formatter.currency_symbol
+        self.decimal_separator = formatter.decimal_separator
+        self.thousands_separator = formatter.thousands_separator
+        self.separators_given = decimal_separator is not None or thousands_separator is not None
+        self._unit_tables_version = smart_units.unit_tables_version
+        self._grammar = compile_grammar(str(self.currency_symbol), self.thousands_separator, self.decimal_separator, self._unit_tables_version)
+
+    def parse(self, text):
+        """Parse a single currency string using the resolved rules, see `parse_currency`"""
+        text = text.strip()
+        if self.detect_currency:
+            symbol, countries = self._detect_symbol(text)
+            fallback = None
+            for country in countries:
+                if self.separators_given:
+                    thousands_separator, decimal_separator = self.thousands_separator, self.decimal_separator
+                else:
+                    thousands_separator, decimal_separator = country.currency_thousands_separator, country.currency_decimal_separator
+                match = compile_grammar(symbol, thousands_separator, decimal_separator, smart_units.unit_tables_version).fullmatch(text)
+                if match is None:
+                    continue
+                #* '€ 1,00' reads as 100 or 1.00, prefer the country whose decimal places fit the string
+                if len(match.group(3) or '') == country.currency_decimal_place:
+                    return ParsedCurrency(self._amount(match, thousands_separator), country.currency_code)
+                if fallback is None:
+                    fallback = ParsedCurrency(self._amount(match, thousands_separator), country.currency_code)
+            if fallback is not None:
+                return fallback
+
+        if self._unit_tables_version != smart_units.unit_tables_version:
+            #* smart unit tables were registered since the pattern was compiled
+            self._unit_tables_version = smart_units.unit_tables_version
+            self._grammar = compile_grammar(str(self.currency_symbol), self.thousands_separator, self.decimal_separator, self._unit_tables_version)
+        match = self._grammar.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Could not parse a currency amount from {text!r}")
+        return ParsedCurrency(self._amount(match, self.thousands_separator), self.currency_code)
+
+    @staticmethod
+    def _amount(match, thousands_separator):
+        sign, integer, fraction, unit = match.groups()
+        if thousands_separator:
+            integer = integer.replace(thousands_separator, '')
+        amount = Decimal(sign + integer + '.' + fraction if fraction else sign + integer)
+        if unit:
+            amount *= smart_units.unit_multipliers[unit.casefold()]
+        return amount
+
+    def parse_many(self, texts):
+        """Parse a batch of currency strings, returns a list of `ParsedCurrency` in input order"""
+        return list(map(self.parse, texts))
+
+    @staticmethod
+    def _detect_symbol(text):
+        """The symbol leading or trailing `text` and its candidate countries"""
+        symbol_index = load_symbol_index()
+        symbol, _, _ = text.partition(' ')
+        countries = symbol_index.get(symbol, None)
+        if countries is None:
+            _, _, symbol = text.rpartition(' ')
+            countries = symbol_index.get(symbol, ())
+        return symbol, countries
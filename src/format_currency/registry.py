@@ -0,0 +1,137 @@
+"""
+Runtime updates of the countries data: reloading the data file and registering custom currencies.
+
+Every update builds a complete new index first, then swaps it in at once. Formatting running meanwhile keeps using
+the previous index, and caches built from the countries data are rebuilt on their next use.
+"""
+import json
+import threading
+
+from . import country as country_module
+from .country import Country
+
+# Serializes updates, so one update never swaps out another's overlays. Lookups never take it
+registry_lock = threading.RLock()
+
+# `register_currency` parameters -> field of a `currency` record of the countries data
+CURRENCY_FIELDS = {
+    'currency_symbol': 'symbol',
+    'currency_name': 'name',
+    'decimal_places': 'decimalPlaces',
+    'decimal_separator': 'decimal',
+    'thousands_separator': 'thousands',
+}
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def currency_overlay(currency_code, country_code=None, **fields):
+    """An overlay record from `register_currency` parameters, leaving out the ones not given"""
+    unexpected = [field for field in fields if field not in CURRENCY_FIELDS]
+    if unexpected:
+        raise TypeError(f"Unexpected currency field(s) '{unexpected}'\nAllowed fields are {list(CURRENCY_FIELDS)}.")
+    if not isinstance(currency_code, str) or not currency_code.strip():
+        raise ValueError(f"Invalid currency code '{currency_code}'.")
+    decimal_places = fields.get('decimal_places', None)
+    if decimal_places is not None and (not isinstance(decimal_places, int) or decimal_places < 0):
+        raise ValueError(f"Invalid decimal places '{decimal_places}', must be a non-negative int.")
+
+    overlay = {'currency': {CURRENCY_FIELDS[field]: value for field, value in fields.items() if value is not None}}
+    if country_code:
+        overlay['country'] = Country.normalize_code(country_code)
+    return Country.normalize_code(currency_code), overlay
+
+
+def update_registry(countries_data=None, overlays=None):
+    """Build the index of the new data and overlays, defaulting to the current ones, and swap it in"""
+    with registry_lock:
+        if countries_data is None:
+            countries_data = Country.load_countries_data()
+        if overlays is None:
+            overlays = dict(country_module.currency_overlays)
+        index = Country.build_countries_index(countries_data, overlays)
+        Country.swap_countries_index(countries_data, overlays, index)
+        return country_module.countries_data_version
+
+
+def register_currency(currency_code, currency_symbol=None, decimal_places=None, decimal_separator=None, thousands_separator=None, currency_name=None, country_code=None):
+    """
+    Registers a currency, or changes a known one, without editing the countries data.
+
+    Parameters:
+    - currency_code (str): The currency code, e.g. `'BTC'`. A code from the countries data changes that currency
+      for every country using it, e.g. after a redenomination.
+    - currency_symbol, decimal_places, decimal_separator, thousands_separator, currency_name (optional): The fields
+      to set. Fields not given keep their value from the countries data, or default to no symbol, 2 decimal places,
+      '.' and ','.
+    - country_code (str, optional): ISO alpha-2 code of a country that now uses this currency. Defaults to None.
+
+    Returns:
+    - int: The new version of the countries data.
+
+    Example:
+        >>> register_currency('BTC', '₿', decimal_places=8)
+        1
+        >>> format_currency(0.5, currency_code='BTC')
+        '₿ 0.50000000'
+
+    Notes:
+    - Registering the same code again replaces its previous registration.
+    - Registrations apply to this process. Process pool workers of `format_currency_parallel` have to register
+      them too, e.g. in the pool initializer.
+    """
+    code, overlay = currency_overlay(currency_code, country_code, currency_symbol=currency_symbol, decimal_places=decimal_places,
+                                     decimal_separator=decimal_separator, thousands_separator=thousands_separator, currency_name=currency_name)
+    with registry_lock:
+        overlays = dict(country_module.currency_overlays)
+        overlays[code] = overlay
+        return update_registry(overlays=overlays)
+
+
+def unregister_currency(currency_code):
+    """
+    Removes a currency registered with `register_currency`, the countries data applies again.
+
+    Returns:
+    - int: The new version of the countries data.
+    """
+    code = Country.normalize_code(currency_code)
+    with registry_lock:
+        overlays = dict(country_module.currency_overlays)
+        if overlays.pop(code, None) is None:
+            raise ValueError(f"Currency '{currency_code}' is not registered.")
+        return update_registry(overlays=overlays)
+
+
+def reload_countries(path=None, currencies=None):
+    """
+    Reloads the countries data, e.g. after the data file was updated, and swaps it in atomically.
+
+    Parameters:
+    - path (str, optional): A JSON file in the format of `data/countries.json`. Defaults to the packaged data.
+    - currencies (dict or str, optional): Currencies to register in the same swap, replacing all registered ones:
+      currency code -> `register_currency` keyword arguments, or the path of a JSON file of that mapping.
+      Defaults to None, keeping the registered currencies.
+
+    Returns:
+    - int: The new version of the countries data.
+
+    Example:
+        >>> threading.Thread(target=reload_countries, args=('/etc/app/countries.json',)).start()
+
+    Notes:
+    - The file is read and the index built before anything is swapped, so it can run in a background thread while
+      formatting goes on. A file that fails to load raises and leaves the current data in place.
+    - `CurrencyFormatter` instances created before keep the conventions they resolved. The result and formatter
+      caches, compiled formatters, parsers and symbol indexes are rebuilt on their next use.
+    """
+    countries_data = Country.load_data_file('countries.json') if path is None else load_json(path)
+    overlays = None
+    if currencies is not None:
+        if isinstance(currencies, str):
+            currencies = load_json(currencies)
+        overlays = dict(currency_overlay(currency_code, **fields) for currency_code, fields in currencies.items())
+    return update_registry(countries_data, overlays)
@@ -0,0 +1,335 @@
+"""
+Local formatting daemon, for consumers in other runtimes or short-lived processes.
+
+Run with `python -m format_currency serve`, then send one request per line over TCP or a Unix socket:
+
+    USD 1234.5 -42
+    country_code=IN&smart_number_formatting=1 12345678.9
+
+A request is the formatting options followed by the amounts, separated by spaces. The options are either a bare code
+(two letters for a country, otherwise a currency) or `format_currency` keyword arguments as a URL query string. Every
+request gets one response line, in request order: `+` and the formatted amounts separated by tabs, or `-` and an error
+message. Requests arriving together, from any connection, are formatted in one batch per set of options.
+"""
+import argparse
+import asyncio
+import sys
+import urllib.parse
+from decimal import Decimal, InvalidOperation
+
+from . import country as country_module
+from . import smart_units
+from .country import Country
+from .format import CurrencyFormatter
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8642
+# Amounts formatted per batch at most, the rest waits for the next batch
+MAX_BATCH_AMOUNTS = 65536
+# Requests over this length are refused, so a client can't make the server buffer without bound
+MAX_REQUEST_BYTES = 1 << 20
+# Requests of a connection waiting for their response at most, reading pauses beyond it
+MAX_PIPELINED_REQUESTS = 4096
+# Integer and decimal digits of an amount at most, so a short request like `USD 1e30000000` can't make a huge response
+MAX_AMOUNT_DIGITS = 100
+
+# Options of `format_currency`, by how their query string values are converted
+POSITIONAL_OPTIONS = ('country_code', 'currency_code', 'currency_symbol', 'decimal_separator', 'thousands_separator', 'use_current_locale')
+FLAG_OPTIONS = ('use_current_locale', 'place_currency_symbol_at_end', 'smart_number_formatting')
+INT_OPTIONS = ('decimal_places',)
+TEXT_OPTIONS = ('number_format_system', 'smart_units')
+# Options a request can carry, the others take Python objects, e.g. `locale_snapshot`
+SUPPORTED_OPTIONS = POSITIONAL_OPTIONS + FLAG_OPTIONS + INT_OPTIONS + TEXT_OPTIONS
+
+# Resolved formatters keyed by the options text of the requests, cleared when full or when the data changes
+cached_formatters = {}
+cached_formatters_version = None
+MAX_CACHED_FORMATTERS = 1024
+
+
+def parse_options(text):
+    """
+    `CurrencyFormatter` arguments from the options of a request.
+
+    `smart_units` is the name of a registered unit table. Options taking Python objects, such as `locale_snapshot`,
+    are refused.
+
+    Returns:
+    - tuple of (tuple, dict): The positional arguments and the keyword arguments.
+    """
+    if '=' not in text:
+        code = urllib.parse.unquote(text)
+        return ((code, None) if len(code) == 2 else (None, code)), {}
+
+    options = {}
+    try:
+        pairs = urllib.parse.parse_qsl(text, keep_blank_values=True, strict_parsing=True)
+    except ValueError:
+        raise ValueError(f"invalid options '{text}'") from None
+    for name, value in pairs:
+        if name not in SUPPORTED_OPTIONS:
+            raise ValueError(f"unsupported option '{name}'")
+        if name in FLAG_OPTIONS:
+            value = value.lower() in ('1', 'true', 'yes')
+        elif name in INT_OPTIONS:
+            try:
+                value = int(value)
+            except ValueError:
+                raise ValueError(f"invalid {name} '{value}'") from None
+            if not 0 <= value <= MAX_AMOUNT_DIGITS:
+                raise ValueError(f"{name} '{value}' out of range")
+        options[name] = value
+    args = tuple(options.pop(name, None) for name in POSITIONAL_OPTIONS)
+    return args[:5] + (bool(args[5]),), options
+
+
+def get_formatter(options_text):
+    """The resolved formatter of a request's options, kept warm across requests and connections"""
+    global cached_formatters_version
+
+    version = (country_module.countries_data_version, smart_units.unit_tables_version)
+    if cached_formatters_version != version or len(cached_formatters) >= MAX_CACHED_FORMATTERS:
+        #* currencies or unit tables were registered since, resolve again
+        cached_formatters.clear()
+        cached_formatters_version = version
+    formatter = cached_formatters.get(options_text, None)
+    if formatter is None:
+        args, kwargs = parse_options(options_text)
+        formatter = cached_formatters[options_text] = CurrencyFormatter(*args, **kwargs)
+    return formatter
+
+
+def parse_request(line):
+    """
+    Split a request line into its options and amounts.
+
+    Returns:
+    - tuple of (str, list of Decimal), or None for an empty line.
+    """
+    fields = line.split()
+    if not fields:
+        return None
+    amounts = []
+    for field in fields[1:]:
+        try:
+            amount = Decimal(field)
+        except InvalidOperation:
+            raise ValueError(f"invalid amount '{field}'") from None
+        if amount.is_finite() and amount.adjusted() >= MAX_AMOUNT_DIGITS:
+            raise ValueError(f"amount '{field}' out of range")
+        amounts.append(amount)
+    return fields[0], amounts
+
+
+def encode_request(amounts, country_code=None, currency_code=None, **kwargs):
+    """
+    Request line for the daemon, for Python clients.
+
+    Example:
+        >>> encode_request([1234.5, -42], currency_code='USD')
+        b'currency_code=USD 1234.5 -42\\n'
+    """
+    options = dict(country_code=country_code, currency_code=currency_code, **kwargs)
+    options = {name: int(value) if isinstance(value, bool) else value for name, value in options.items() if value is not None}
+    return (urllib.parse.urlencode(options) + ' ' + ' '.join(map(str, amounts)) + '\n').encode('utf-8')
+
+
+def decode_response(line):
+    """
+    The formatted amounts of a response line.
+
+    Returns:
+    - list of str. Raises `ValueError` with the server's message for an error response.
+    """
+    text = line.decode('utf-8').rstrip('\n')
+    if text.startswith('-'):
+        raise ValueError(text[1:])
+    return text[1:].split('\t') if len(text) > 1 else []
+
+
+class RequestBatcher():
+    """
+    Collects the requests of all connections and formats them in batches, one `format_many` call per set of options.
+
+    A batch is formatted once the event loop has handled the input that is ready, so requests arriving together are
+    merged without waiting for more.
+
+    Parameters:
+    - batch_delay (float, optional): Seconds to wait for more requests before formatting a batch. Defaults to 0.
+    - max_batch_amounts (int, optional): Amounts formatted per batch at most. Defaults to `MAX_BATCH_AMOUNTS`.
+    """
+    def __init__(self, batch_delay=0.0, max_batch_amounts=MAX_BATCH_AMOUNTS):
+        super().__init__()
+        self.batch_delay = batch_delay
+        self.max_batch_amounts = max_batch_amounts
+        self.pending = []
+        self.scheduled = False
+        self.batches = 0
+        self.requests = 0
+
+    def submit(self, options_text, amounts):
+        """Queue a request, returns a future of its formatted amounts"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((options_text, amounts, future))
+        if not self.scheduled:
+            self.scheduled = True
+            if self.batch_delay > 0:
+                loop.call_later(self.batch_delay, self.flush)
+            else:
+                loop.call_soon(self.flush)
+        return future
+
+    def flush(self):
+        """Format the queued requests, grouped by their options"""
+        size, amount_count = 0, 0
+        for _, amounts, _ in self.pending:
+            if size and amount_count + len(amounts) > self.max_batch_amounts:
+                break
+            size += 1
+            amount_count += len(amounts)
+        batch = self.pending[:size]
+        del self.pending[:size]
+        self.scheduled = False
+        if self.pending:
+            #* the rest goes in the next batch, after the loop had a chance to write responses
+            self.scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+        groups = {}
+        for options_text, amounts, future in batch:
+            groups.setdefault(options_text, []).append((amounts, future))
+        for options_text, requests in groups.items():
+            try:
+                formatter = get_formatter(options_text)
+                formatted = formatter.format_many([amount for amounts, _ in requests for amount in amounts])
+            except Exception as e:
+                #* only the requests with these options fail, any exception left here would leave the whole batch waiting
+                message = str(e).splitlines()[0] if str(e) else type(e).__name__
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(ValueError(message))
+                continue
+            start = 0
+            for amounts, future in requests:
+                if not future.done():
+                    future.set_result(formatted[start:start + len(amounts)])
+                start += len(amounts)
+        self.batches += 1
+        self.requests += len(batch)
+
+
+async def write_responses(writer, responses):
+    """Write the response of each request as it is formatted, in request order"""
+    while True:
+        future = await responses.get()
+        if future is None:
+            break
+        try:
+            line = '+' + '\t'.join(await future)
+        except ValueError as e:
+            line = '-' + str(e)
+        writer.write((line + '\n').encode('utf-8'))
+        if responses.empty():
+            await writer.drain()
+
+
+async def handle_connection(reader, writer, batcher):
+    responses = asyncio.Queue(MAX_PIPELINED_REQUESTS)
+    writing = asyncio.ensure_future(write_responses(writer, responses))
+    loop = asyncio.get_running_loop()
+    try:
+        while not writing.done():
+            try:
+                line = await reader.readline()
+            except ValueError:
+                #* over the stream limit
+                error = loop.create_future()
+                error.set_exception(ValueError(f'request longer than {MAX_REQUEST_BYTES} bytes'))
+                await responses.put(error)
+                break
+            if not line:
+                break
+            try:
+                request = parse_request(line.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError) as e:
+                future = loop.create_future()
+                future.set_exception(ValueError(str(e)))
+            else:
+                if request is None:
+                    continue
+                future = batcher.submit(*request)
+            await responses.put(future)
+        await responses.put(None)
+        await writing
+    except (ConnectionError, asyncio.CancelledError):
+        #* the client went away, or the server is shutting down
+        pass
+    finally:
+        writing.cancel()
+        writer.close()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, batch_delay=0.0, max_batch_amounts=MAX_BATCH_AMOUNTS):
+    """
+    Starts the formatting daemon on a localhost TCP port or a Unix socket.
+
+    Parameters:
+    - host (str, optional): The address to listen on. Defaults to `127.0.0.1`.
+    - port (int, optional): The TCP port, 0 picks a free one. Defaults to `DEFAULT_PORT`.
+    - path (str, optional): A Unix socket path to listen on instead of TCP. Defaults to None.
+    - batch_delay, max_batch_amounts (optional): See `RequestBatcher`.
+
+    Returns:
+    - asyncio.Server: The listening server, with its `RequestBatcher` as `batcher`.
+
+    Notes:
+    - The countries data is loaded before the server starts listening.
+    """
+    Country.load_countries_index()
+    batcher = RequestBatcher(batch_delay, max_batch_amounts)
+
+    async def on_connection(reader, writer):
+        await handle_connection(reader, writer, batcher)
+
+    if path is not None:
+        server = await asyncio.start_unix_server(on_connection, path, limit=MAX_REQUEST_BYTES)
+    else:
+        server = await asyncio.start_server(on_connection, host, port, limit=MAX_REQUEST_BYTES)
+    server.batcher = batcher
+    return server
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m format_currency serve',
+        description='Serve currency formatting over localhost TCP or a Unix socket, one request per line.',
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f'Address to listen on, defaults to {DEFAULT_HOST}.')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'TCP port, defaults to {DEFAULT_PORT}.')
+    parser.add_argument('--unix', dest='path', default=None, help='Listen on this Unix socket path instead of TCP.')
+    parser.add_argument('--batch-delay', type=float, default=0.0,
+                        help='Milliseconds to wait for more requests before formatting a batch, defaults to 0.')
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH_AMOUNTS, help='Amounts formatted per batch at most.')
+    return parser
+
+
+async def serve(args):
+    server = await start_server(args.host, args.port, args.path, args.batch_delay / 1000, args.max_batch)
+    address = args.path or '{}:{}'.format(*server.sockets[0].getsockname()[:2])
+    sys.stderr.write(f'format_currency: serving on {address}\n')
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Run the daemon until interrupted, returns the process exit code"""
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        sys.stderr.write(f'format_currency: error: {e}\n')
+        return 1
+    return 0
@@ -0,0 +1,205 @@
+"""Unit tables for smart number formatting, such as '1.23 Million' or '1.23 Crore'"""
+import bisect
+import threading
+
+# Smart formatting units, each value multiplies the previous unit
+INTERNATIONAL_SMART_UNITS = {
+    'only': 1,
+    'Thousands': 1000,
+    'Million': 1000,
+    'Billion': 1000,
+    'Trillion': 1000,
+    'Quadrillion': 1000,
+    'Quintillion': 1000,
+}
+INDIAN_SMART_UNITS = {
+    'only': 1,
+    'hazaar': 1000,
+    'lakhs': 100,
+    'crore': 100,
+    'sau crore': 100,
+    'hazaar crore': 10,
+    'lakh crore': 100,
+    'crore crore': 100,
+}
+CHINESE_SMART_UNITS = {
+    'only': 1,
+    '万': 10000,
+    '亿': 10000,
+    '千亿': 1000,
+    '万亿': 10,
+}
+
+NEGATIVE_MODES = ('magnitude', 'base_unit', 'ignore')
+# Amounts a series can pick its shared unit by
+SERIES_POLICIES = ('max', 'median', 'min')
+
+# Registered unit tables by name, the built in ones are named after their numbering system
+unit_tables = {}
+# Every registered unit name, case-folded, with the amount it stands for as an int. Used to parse smart formatted strings,
+# the latest registration of a name wins
+unit_multipliers = {}
+# Bumped on each registration, so caches built from the tables can tell they are stale
+unit_tables_version = 0
+unit_tables_lock = threading.Lock()
+
+
+class SmartUnitTable():
+    """
+    Units of a smart formatting scheme, with their thresholds precomputed.
+
+    Parameters:
+    - units (dict): Unit name -> value multiplying the previous unit, in increasing order. The first unit is the base
+      unit, its value must be 1.
+
+        Example:
+        units = {
+            '': 1,
+            'K': 1000,  # Value to multiply to jump from '' to 'K'
+            'M': 1000,
+            'B': 1000,
+        }
+
+    - negative (str, optional): How negative amounts are formatted. Defaults to `magnitude`.
+        - `magnitude` picks the unit from the absolute amount, e.g. "-1.23 M"
+        - `base_unit` always uses the base unit, e.g. "-1,234,567.00 Only"
+        - `ignore` leaves negative amounts without a unit
+
+    Notes:
+    - The unit is found by bisecting the thresholds, then the amount is divided unit by unit, so the result is the
+      same as dividing step by step until the next unit is out of reach.
+    """
+    def __init__(self, units, negative='magnitude'):
+        super().__init__()
+        units = dict(units)
+        if not units or list(units.values())[0] != 1:
+            raise ValueError(f"The first unit of a smart unit table is the base unit, its value must be 1. Got {units}.")
+        if negative not in NEGATIVE_MODES:
+            raise ValueError(f"Invalid negative mode '{negative}'. Supported values are {NEGATIVE_MODES}.")
+
+        self.units = tuple(units)
+        self.steps = tuple(units.values())
+        self.negative = negative
+
+        thresholds = []
+        threshold = 1
+        for step in self.steps:
+            threshold *= step
+            thresholds.append(threshold)
+        self.multipliers = tuple(thresholds)
+        self._thresholds = [float(threshold) for threshold in thresholds]
+        #* the steps to divide by to reach each unit
+        self._divisors = [self.steps[1:index + 1] for index in range(len(self.steps))]
+
+    def split(self, value):
+        """
+        Split a float amount into its unit.
+
+        Returns:
+        - tuple of (float, str): The amount scaled to the unit, and the unit name. None when the amount is negative
+          and the table ignores negative amounts.
+        """
+        if value < 0:
+            if self.negative == 'ignore':
+                return None
+            if self.negative == 'magnitude':
+                scaled, unit = self.split(-value)
+                return -scaled, unit
+
+        index = bisect.bisect_right(self._thresholds, value) - 1
+        if index <= 0:
+            return value, self.units[0]
+
+        steps = self.steps
+        scaled = value
+        for step in self._divisors[index]:
+            scaled /= step
+        #* rounding may carry the amount onto the next unit, continue as dividing step by step would
+        while index + 1 < len(steps) and scaled >= steps[index + 1]:
+            index += 1
+            scaled /= steps[index]
+        return scaled, self.units[index]
+
+    def unit_index(self, value):
+        """Index of the unit for a non-negative float amount"""
+        return max(bisect.bisect_right(self._thresholds, value) - 1, 0)
+
+    def series_unit(self, magnitudes, policy='max', decimal_places=None):
+        """
+        Pick one unit for a whole series of amounts, e.g. the labels of a chart axis.
+
+        Parameters:
+        - magnitudes (list of float): The absolute values of the finite amounts of the series.
+        - policy (str or callable, optional): How the unit is picked. Defaults to `max`.
+            - `max`, `median` or `min` uses the unit of that amount
+            - a unit name of the table, e.g. `'Million'`, uses that unit
+            - a callable is given `magnitudes` and returns the amount to use the unit of
+        - decimal_places (int, optional): The amount is rounded to these decimal places before its unit is picked,
+          as smart formatting does for a single amount, so 999999.999 shown with 2 places is in millions. Defaults
+          to None, not rounding.
+
+        Returns:
+        - int: The index of the unit in `units` and `multipliers`.
+        """
+        if callable(policy):
+            amount = float(policy(magnitudes))
+        elif policy in SERIES_POLICIES:
+            if not magnitudes:
+                return 0
+            if policy == 'median':
+                import statistics
+
+                amount = statistics.median(magnitudes)
+            else:
+                amount = max(magnitudes) if policy == 'max' else min(magnitudes)
+        else:
+            for index, unit in enumerate(self.units):
+                if unit == policy or unit.casefold() == str(policy).casefold():
+                    return index
+            raise ValueError(f"Invalid series unit '{policy}'. Use one of {list(SERIES_POLICIES)}, a unit of {list(self.units)}, or a callable.")
+        if decimal_places is not None:
+            amount = round(amount, decimal_places)
+        return self.unit_index(amount)
+
+
+def register_unit_table(name, units, negative='magnitude'):
+    """
+    Registers a unit table for smart number formatting, to use with `smart_units=name`.
+
+    Parameters:
+    - name (str): The name of the table. Registering an existing name replaces that table.
+    - units (dict or SmartUnitTable): The units, see `SmartUnitTable`.
+    - negative (str, optional): How negative amounts are formatted, see `SmartUnitTable`. Defaults to `magnitude`.
+
+    Returns:
+    - SmartUnitTable: The registered table.
+
+    Example:
+        >>> units = register_unit_table('de', {'': 1, 'Tsd.': 1000, 'Mio.': 1000, 'Mrd.': 1000})
+        >>> format_currency(1234567.89, 'DE', smart_number_formatting=True, smart_units='de')
+        '€ 1,23 Mio.'
+    """
+    global unit_tables_version
+
+    unit_table = units if isinstance(units, SmartUnitTable) else SmartUnitTable(units, negative)
+    with unit_tables_lock:
+        unit_tables[name] = unit_table
+        for unit, multiplier in zip(unit_table.units, unit_table.multipliers):
+            if unit:
+                unit_multipliers[unit.casefold()] = multiplier
+        unit_tables_version += 1
+    return unit_table
+
+
+def get_unit_table(name):
+    """Find a registered unit table by name"""
+    unit_table = unit_tables.get(name, None)
+    if unit_table is None:
+        raise ValueError(f"Unknown smart unit table '{name}'. Registered tables are {list(unit_tables)}.")
+    return unit_table
+
+
+#* unit names are shown capitalized, as smart formatting always did
+register_unit_table('international', {unit.capitalize(): value for unit, value in INTERNATIONAL_SMART_UNITS.items()}, negative='base_unit')
+register_unit_table('indian', {unit.capitalize(): value for unit, value in INDIAN_SMART_UNITS.items()}, negative='ignore')
+register_unit_table('chinese', {unit.capitalize(): value for unit, value in CHINESE_SMART_UNITS.items()}, negative='ignore')
@@ -0,0 +1,219 @@
+"""Find currency symbols and ISO currency codes in free text"""
+import collections
+import re
+import threading
+
+from . import country as country_module
+from .country import Country
+
+SymbolMatch = collections.namedtuple('SymbolMatch', ['start', 'end', 'symbol', 'currency_codes'])
+
+# Shared symbols resolve to the first of these currencies, then to the rest in countries data order
+DEFAULT_CURRENCY_PREFERENCE = ('USD', 'EUR', 'JPY', 'GBP', 'CNY', 'AUD', 'CAD', 'CHF', 'HKD', 'SGD', 'SEK', 'KRW', 'NOK', 'NZD', 'INR', 'MXN')
+
+# Symbol indexes keyed by their preference tuple, and the countries data version they were built from
+cached_symbol_indexes = {}
+cached_countries_data_version = 0
+symbol_indexes_lock = threading.Lock()
+
+
+def rank_currency_codes(currency_codes, preference=DEFAULT_CURRENCY_PREFERENCE):
+    """
+    Order currency codes by `preference`, codes not in it keep their order after the preferred ones.
+
+    Example:
+        >>> rank_currency_codes(['XCD', 'AUD', 'USD'], ('USD',))
+        ('USD', 'XCD', 'AUD')
+    """
+    ranks = currency_ranks(preference)
+    return tuple(sorted(currency_codes, key=lambda currency_code: ranks.get(currency_code, len(ranks))))
+
+
+def currency_ranks(preference=DEFAULT_CURRENCY_PREFERENCE):
+    """Rank of each preferred currency code, lower ranks first. Codes missing from it rank after all of them"""
+    return {currency_code: rank for rank, currency_code in enumerate(preference)}
+
+
+def load_symbol_currencies():
+    """Map every currency symbol and ISO currency code in the countries data to the currency codes using it"""
+    symbol_currencies = {}
+    countries = Country.load_all_countries()
+    for country in countries:
+        symbol = (country.currency_symbol or '').strip()
+        if symbol:
+            currency_codes = symbol_currencies.setdefault(symbol, [])
+            if country.currency_code and country.currency_code not in currency_codes:
+                currency_codes.append(country.currency_code)
+    for country in countries:
+        if country.currency_code:
+            currency_codes = symbol_currencies.setdefault(country.currency_code, [])
+            if country.currency_code not in currency_codes:
+                currency_codes.append(country.currency_code)
+    return symbol_currencies
+
+
+class SymbolIndex():
+    """
+    Aho-Corasick automaton over currency symbols, finding every symbol in a string in a single pass.
+
+    The automaton is compiled into a table of transitions, so scanning costs one dict lookup per character no matter
+    how many symbols there are. Runs of characters that can't start a symbol are skipped in one regex search.
+
+    Parameters:
+    - symbol_currencies (dict): Symbol -> currency codes using it. Defaults to every symbol and ISO currency code in
+      the countries data.
+    - preference (iterable of str, optional): Currency codes to rank first for shared symbols, in order. Defaults to
+      `DEFAULT_CURRENCY_PREFERENCE`.
+
+    Example:
+        >>> SymbolIndex().find('paid R$ 12,00 and $5')
+        [SymbolMatch(start=5, end=7, symbol='R$', currency_codes=('BRL',)), SymbolMatch(start=18, end=19, symbol='$', currency_codes=('USD', ...))]
+
+    Notes:
+    - Symbols starting or ending with a letter or digit, such as ISO codes or 'kr', only match as whole words, so
+      'USD' is not found in 'USDT' and 'R' is not found in 'Rate'.
+    """
+    def __init__(self, symbol_currencies=None, preference=DEFAULT_CURRENCY_PREFERENCE):
+        super().__init__()
+        if symbol_currencies is None:
+            symbol_currencies = load_symbol_currencies()
+        self.preference = tuple(preference)
+        self.symbol_currencies = {symbol: rank_currency_codes(currency_codes, self.preference) for symbol, currency_codes in symbol_currencies.items() if symbol}
+        self._build()
+
+    def _build(self):
+        #* trie of the symbols, state 0 is the root
+        goto = [{}]
+        outputs = [()]
+        for symbol in self.symbol_currencies:
+            state = 0
+            for char in symbol:
+                next_state = goto[state].get(char, None)
+                if next_state is None:
+                    next_state = goto[state][char] = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] = (symbol,)
+
+        #* breadth first, so the fallback of a state is complete before its children need it
+        fail = [0] * len(goto)
+        transitions = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            #* complete the transitions with the fallback's, so scanning never has to follow failure links
+            transitions[state] = dict(transitions[fail[state]])
+            for char, next_state in goto[state].items():
+                fail[next_state] = transitions[fail[state]].get(char, 0)
+                transitions[state][char] = next_state
+                queue.append(next_state)
+
+        self._transitions = transitions
+        #* from the root, jump straight to the next character that can start a symbol
+        self._root_search = re.compile('[' + ''.join(re.escape(char) for char in goto[0]) + ']').search if goto[0] else None
+        #* symbols ending at each state, with whether they need a word boundary before and after
+        self._outputs = [tuple((symbol, len(symbol), symbol[0].isalnum(), symbol[-1].isalnum()) for symbol in symbols) for symbols in outputs]
+
+    def find(self, text, overlapping=False):
+        """
+        Find currency symbols in `text`.
+
+        Parameters:
+        - text (str): The text to scan.
+        - overlapping (bool, optional): Return every match, including symbols inside longer ones such as '$' in
+          'R$'. Defaults to False, returning the leftmost longest matches that don't overlap.
+
+        Returns:
+        - list of SymbolMatch: `(start, end, symbol, currency_codes)` in order of position, candidate currency codes
+          ranked by preference.
+        """
+        transitions = self._transitions
+        outputs = self._outputs
+        root_search = self._root_search
+        matches = []
+        state = 0
+        end = 0
+        text_length = len(text)
+        while end < text_length:
+            if not state:
+                root_match = root_search(text, end) if root_search is not None else None
+                if root_match is None:
+                    break
+                end = root_match.start()
+            state = transitions[state].get(text[end], 0)
+            end += 1
+            if not state:
+                continue
+            for symbol, length, word_start, word_end in outputs[state]:
+                start = end - length
+                if word_start and start > 0 and text[start - 1].isalnum():
+                    continue
+                if word_end and end < text_length and text[end].isalnum():
+                    continue
+                matches.append((start, -length, symbol))
+
+        matches.sort()
+        result = []
+        covered = 0
+        for start, length, symbol in matches:
+            if not overlapping:
+                if start < covered:
+                    continue
+                covered = start - length
+            result.append(SymbolMatch(start, start - length, symbol, self.symbol_currencies[symbol]))
+        return result
+
+    def detect(self, text):
+        """The most preferred currency code of the first symbol in `text`, None if there is none"""
+        matches = self.find(text)
+        if not matches:
+            return None
+        return matches[0].currency_codes[0]
+
+
+def get_symbol_index(preference=DEFAULT_CURRENCY_PREFERENCE):
+    """The shared `SymbolIndex` of the countries data for a preference, built on first use"""
+    global cached_countries_data_version
+
+    preference = tuple(preference)
+    if cached_countries_data_version != country_module.countries_data_version:
+        #* currencies were registered or reloaded since, rebuild from the current data
+        with symbol_indexes_lock:
+            cached_symbol_indexes.clear()
+            cached_countries_data_version = country_module.countries_data_version
+    symbol_index = cached_symbol_indexes.get(preference, None)
+    if symbol_index is not None:
+        return symbol_index
+
+    with symbol_indexes_lock:
+        if preference not in cached_symbol_indexes:
+            cached_symbol_indexes[preference] = SymbolIndex(preference=preference)
+        return cached_symbol_indexes[preference]
+
+
+def find_currencies(text, preference=DEFAULT_CURRENCY_PREFERENCE, overlapping=False):
+    """
+    Finds every currency symbol and ISO currency code in a string, in a single pass.
+
+    Parameters:
+    - text (str): The text to scan, e.g. a log line.
+    - preference (iterable of str, optional): Currency codes to rank first for shared symbols such as '$', 'kr' or
+      '£'. Defaults to `DEFAULT_CURRENCY_PREFERENCE`.
+    - overlapping (bool, optional): Also return symbols inside longer ones. Defaults to False.
+
+    Returns:
+    - list of SymbolMatch: `(start, end, symbol, currency_codes)` for each symbol found, in order of position.
+    """
+    return get_symbol_index(preference).find(text, overlapping)
+
+
+def detect_currency(text, preference=DEFAULT_CURRENCY_PREFERENCE):
+    """
+    Detects the currency of a string from its first currency symbol or ISO currency code.
+
+    Returns:
+    - str: The currency code, the most preferred one for shared symbols, or None if the string has no symbol.
+    """
+    return get_symbol_index(preference).detect(text)
@@ -0,0 +1,282 @@
+"""Vectorized formatting helpers, used when NumPy is installed"""
+import array
+import itertools
+
+from .grouping import group_sizes
+
+numpy = None
+numpy_import_attempted = False
+
+# Largest magnitude that a float64 keeps exact integer precision for
+MAX_EXACT_FLOAT = 2 ** 52
+# Most digits of an integer or decimal part laid out in vectorized form, their powers of ten have to fit a uint64
+MAX_DIGITS = 19
+# Rows per block when building the code point matrix, keeps temporary arrays small
+CHUNK_SIZE = 65536
+
+
+def load_numpy():
+    """Import NumPy on first use, returns None when it is not installed"""
+    global numpy, numpy_import_attempted
+
+    if not numpy_import_attempted:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        numpy = np
+        numpy_import_attempted = True
+    return numpy
+
+
+def is_array_like(numbers):
+    """Whether `numbers` is a buffer that can be handed to NumPy without a Python level copy"""
+    return isinstance(numbers, (array.array, memoryview)) or hasattr(numbers, '__array_interface__')
+
+
+def integer_layout(digits, grouping, thousands_separator):
+    """
+    Describe the right-aligned integer part for numbers of up to `digits` digits.
+
+    Returns:
+    - tuple of (list, list): Columns from the right, each being a digit index or the inverted (`~code`) code point of
+      a separator, so NUL stays negative, and the width taken by an integer part of `n` digits at index `n`.
+    """
+    separator = [ord(char) for char in reversed(thousands_separator)]
+    columns = []
+    widths = [0]
+    sizes = group_sizes(grouping) if grouping else itertools.repeat(digits)
+    digit = 0
+    for size in sizes:
+        for _ in range(size or digits):
+            columns.append(digit)
+            digit += 1
+            widths.append(len(columns))
+            if digit == digits:
+                return columns, widths
+        columns.extend(~code for code in separator)
+
+
+def split_numbers(values, decimal_places):
+    """
+    Split a numeric array into sign, integer part and decimal part, rounded half to even to `decimal_places`.
+
+    Returns:
+    - tuple of (ndarray, ndarray, ndarray, ndarray): Whether each number is negative, its integer part, its decimal
+      part as an integer (None for integer arrays), and whether it was split exactly. None if the dtype or the
+      decimal places are not supported.
+    """
+    np = load_numpy()
+    if decimal_places > MAX_DIGITS:
+        return None
+    if values.dtype.kind in 'iu':
+        negative = values < 0
+        if values.dtype.kind == 'i':
+            #* widened first, the absolute value of a narrow type's minimum wraps around in that type
+            magnitude = np.abs(values.astype(np.int64, copy=False)).astype(np.uint64)
+        else:
+            magnitude = values.astype(np.uint64, copy=False)
+        #* larger uint64 values have more digits than the layout handles
+        exact = magnitude < np.uint64(10 ** MAX_DIGITS)
+        integer_part = np.where(exact, magnitude, np.uint64(0))
+        return negative, integer_part, None, exact
+    if values.dtype.kind == 'f':
+        values = values.astype(np.float64, copy=False)
+        negative = np.signbit(values)
+        scale = 10.0 ** decimal_places
+        with np.errstate(invalid='ignore', over='ignore'):
+            scaled = np.abs(values) * scale
+            tie_distance = np.abs(scaled - np.floor(scaled) - 0.5)
+            exact = np.isfinite(scaled) & (scaled < MAX_EXACT_FLOAT) & (tie_distance > 2 * np.spacing(scaled))
+        units = np.where(exact, np.rint(scaled), 0).astype(np.uint64)
+        integer_part, fraction = np.divmod(units, np.uint64(10 ** decimal_places))
+        return negative, integer_part, fraction, exact
+    return None
+
+
+def split_minor_units(values, decimal_places, minor_unit_places):
+    """
+    Split an integer array of minor units (e.g. cents) like `split_numbers`, using integer arithmetic only.
+
+    Minor units have `minor_unit_places` decimal places, they are rounded half to even when fewer decimal places are
+    displayed. Amounts beyond 63 bits once scaled are marked as not exact. None if the decimal places are not
+    supported.
+    """
+    np = load_numpy()
+    if decimal_places > MAX_DIGITS:
+        return None
+    in_range = True
+    if values.dtype.kind == 'u':
+        #* uint64 amounts beyond the int64 range go through the scalar path
+        in_range = values <= np.iinfo(np.int64).max
+        values = np.where(in_range, values, 0)
+    values = values.astype(np.int64, copy=False)
+    negative = values < 0
+    exact = (values != np.iinfo(np.int64).min) & in_range
+    magnitude = np.abs(np.where(exact, values, 0)).astype(np.uint64)
+    shift = decimal_places - minor_unit_places
+    if shift >= 0:
+        factor = 10 ** shift
+        exact &= magnitude <= np.uint64((2 ** 63 - 1) // factor)
+        units = np.where(exact, magnitude, 0) * np.uint64(factor)
+    else:
+        divisor = np.uint64(10 ** -shift)
+        units, remainder = np.divmod(magnitude, divisor)
+        twice = remainder * np.uint64(2)
+        units += (twice > divisor) | ((twice == divisor) & (units % np.uint64(2) == 1))
+    if decimal_places > 0:
+        integer_part, fraction = np.divmod(units, np.uint64(10 ** decimal_places))
+    else:
+        integer_part, fraction = units, None
+    return negative, integer_part, fraction, exact
+
+
+def iter_code_point_rows(negative, integer_part, fraction, decimal_places, grouping, thousands_separator, decimal_separator, prefix, suffix):
+    """
+    Lay out split numbers as code points, `CHUNK_SIZE` rows at a time.
+
+    Yields:
+    - tuple: A `uint32` matrix per chunk, one row per number, left-aligned and padded with NUL, and the length of
+      every row. The lengths tell padding from NUL characters in the separators, prefix or suffix.
+    """
+    np = load_numpy()
+    max_integer = int(integer_part.max()) if len(integer_part) else 0
+    digits = len(str(max_integer))
+    columns, widths = integer_layout(digits, grouping, thousands_separator)
+
+    # Right-aligned layout: sign, integer digits and separators, decimal part, suffix
+    tail = [ord(char) for char in suffix]
+    if decimal_places > 0:
+        tail = [ord(char) for char in decimal_separator] + [None] * decimal_places + tail
+    width = 1 + len(columns) + len(tail)
+    fixed = np.zeros(width, dtype=np.uint32)
+    for index, column in enumerate(reversed(columns)):
+        if column < 0:
+            fixed[1 + index] = ~column
+    for index, code in enumerate(tail):
+        if code is not None:
+            fixed[1 + len(columns) + index] = code
+    integer_widths = np.asarray(widths, dtype=np.intp)
+    powers = np.asarray([10 ** power for power in range(max(digits, decimal_places) + 1)], dtype=np.uint64)
+    prefix_codes = np.asarray([ord(char) for char in prefix], dtype=np.uint32)
+    positions = np.arange(width, dtype=np.intp)
+
+    for begin in range(0, len(integer_part), CHUNK_SIZE):
+        end = begin + CHUNK_SIZE
+        chunk_integer = integer_part[begin:end]
+        chunk_negative = negative[begin:end]
+        rows = len(chunk_integer)
+
+        matrix = np.empty((rows, width), dtype=np.uint32)
+        matrix[:] = fixed
+        for index, column in enumerate(reversed(columns)):
+            if column >= 0:
+                matrix[:, 1 + index] = chunk_integer // powers[column] % 10 + 48
+        if fraction is not None:
+            chunk_fraction = fraction[begin:end]
+            for index in range(decimal_places):
+                power = powers[decimal_places - 1 - index]
+                matrix[:, width - len(suffix) - decimal_places + index] = chunk_fraction // power % 10 + 48
+        elif decimal_places > 0:
+            matrix[:, width - len(suffix) - decimal_places:width - len(suffix)] = 48
+
+        number_digits = np.searchsorted(powers[1:digits], chunk_integer, side='right') + 1
+        lengths = integer_widths[number_digits] + len(tail) + chunk_negative
+        start = width - lengths
+        matrix[np.arange(rows)[chunk_negative], start[chunk_negative]] = 45
+
+        # Left-align every row and pad with NUL, which NumPy strips from unicode strings
+        index = start[:, None] + positions[None, :]
+        aligned = np.take_along_axis(matrix, np.minimum(index, width - 1), axis=1)
+        aligned[index >= width] = 0
+        if len(prefix_codes):
+            aligned = np.hstack([np.broadcast_to(prefix_codes, (rows, len(prefix_codes))), aligned])
+        yield np.ascontiguousarray(aligned), lengths + len(prefix_codes)
+
+
+def format_array(numbers, decimal_places, grouping, thousands_separator, decimal_separator, prefix, suffix, fallback):
+    """
+    Format a numeric array in vectorized form.
+
+    Parameters:
+    - numbers: NumPy array or any object supporting the buffer protocol.
+    - decimal_places (int): Number of decimal places.
+    - grouping (tuple): Digit group sizes from the right, the last size repeats. Empty tuple disables grouping.
+    - thousands_separator (str): Separator between digit groups.
+    - decimal_separator (str): Separator between integer and fractional digits.
+    - prefix (str), suffix (str): Text placed around every formatted number.
+    - fallback (callable): Scalar formatter used for values the vectorized path can't format exactly.
+
+    Returns:
+    - list of str, or None if NumPy is not installed or the array dtype is not supported.
+
+    Notes:
+    - Values that are not finite, too large for exact float64 arithmetic, or sit too close to a rounding tie
+      are formatted with `fallback`, so the output always matches the scalar path.
+    """
+    np = load_numpy()
+    if np is None:
+        return None
+
+    values = np.asarray(numbers)
+    if values.ndim != 1:
+        values = values.ravel()
+
+    split = split_numbers(values, decimal_places)
+    if split is None:
+        return None
+    negative, integer_part, fraction, exact = split
+
+    result = []
+    for aligned, _ in iter_code_point_rows(negative, integer_part, fraction, decimal_places, grouping, thousands_separator, decimal_separator, prefix, suffix):
+        result.extend(aligned.view(f'U{aligned.shape[1]}').ravel().tolist())
+
+    inexact = np.flatnonzero(~exact)
+    if len(inexact) > 0:
+        for index, number in zip(inexact.tolist(), values[inexact].tolist()):
+            result[index] = fallback(number)
+    return result
+
+
+def utf8_code_units(text):
+    """The UTF-8 bytes of `text` as a string of one character per byte, so layouts can count in bytes"""
+    return text.encode('utf-8').decode('latin-1')
+
+
+def iter_utf8_chunks(split, values, decimal_places, grouping, thousands_separator, decimal_separator, prefix, suffix, delimiter, fallback):
+    """
+    Format split numbers as delimited UTF-8, without a Python string per number.
+
+    Parameters:
+    - split (tuple): The result of `split_numbers` or `split_minor_units` for `values`.
+    - delimiter (str): Written after every formatted number.
+    - fallback (callable): Scalar formatter for the numbers that were not split exactly, given the Python number.
+
+    Yields:
+    - bytes or memoryview: The encoded output, `CHUNK_SIZE` numbers at a time.
+    """
+    np = load_numpy()
+    negative, integer_part, fraction, exact = split
+    inexact = np.flatnonzero(~exact)
+    begin = 0
+    #* lay out bytes instead of code points, the delimiter goes into the suffix of every row
+    layout = [utf8_code_units(text) for text in (thousands_separator, decimal_separator, prefix, suffix + delimiter)]
+    for aligned, lengths in iter_code_point_rows(negative, integer_part, fraction, decimal_places, grouping, *layout):
+        rows = len(aligned)
+        keep = np.arange(aligned.shape[1]) < lengths[:, None]
+        data = aligned.astype(np.uint8)[keep].tobytes()
+
+        chunk_inexact = inexact[(inexact >= begin) & (inexact < begin + rows)] - begin
+        if not len(chunk_inexact):
+            yield data
+        else:
+            #* splice in the numbers formatted by the scalar path
+            offsets = np.concatenate([[0], np.cumsum(lengths)]).tolist()
+            view = memoryview(data)
+            previous = 0
+            for row, number in zip(chunk_inexact.tolist(), values[begin + chunk_inexact].tolist()):
+                yield view[offsets[previous]:offsets[row]]
+                yield (fallback(number) + delimiter).encode('utf-8')
+                previous = row + 1
+            yield view[offsets[previous]:]
+        begin += rows
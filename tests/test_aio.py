@@ -0,0 +1,100 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+async def measure_loop_latency(awaitable, interval=0.001):
+    """Run `awaitable` next to a ticker, return its result and the longest gap between ticks"""
+    gaps = []
+    done = False
+
+    async def ticker():
+        previous = time.perf_counter()
+        while not done:
+            await asyncio.sleep(interval)
+            now = time.perf_counter()
+            gaps.append(now - previous)
+            previous = now
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        result = await awaitable
+    finally:
+        done = True
+        await ticker_task
+    return result, max(gaps)
+
+class TestAsync(unittest.TestCase):
+
+    def tearDown(self):
+        from format_currency import Country
+        Country.clear_cache()
+
+    def test_preload_runs_off_loop(self):
+        from format_currency import Country
+        from format_currency import country
+        from format_currency.aio import preload
+
+        Country.clear_cache()
+        original_load_data_file = Country.load_data_file
+
+        def slow_load_data_file(filename):
+            time.sleep(0.2)
+            return original_load_data_file(filename)
+
+        with mock.patch.object(Country, 'load_data_file', staticmethod(slow_load_data_file)):
+            _, max_gap = asyncio.run(measure_loop_latency(preload()))
+        self.assertIsNotNone(country.cached_countries_index)
+        self.assertLess(max_gap, 0.1)
+
+    def test_format_currency_async(self):
+        from format_currency import Country
+        from format_currency.aio import format_currency_async
+        Country.clear_cache()
+        self.assertEqual(asyncio.run(format_currency_async(1234567.891, 'IN')), '₹ 12,34,567.89')
+
+    def test_format_currency_async_uses_caches(self):
+        from format_currency import disable_format_cache, enable_format_cache, format_cache_info
+        from format_currency.aio import format_currency_async, format_currency_many_async
+        enable_format_cache()
+        try:
+            for _ in range(2):
+                self.assertEqual(asyncio.run(format_currency_async(1234567.891, 'IN')), '₹ 12,34,567.89')
+            asyncio.run(format_currency_many_async([1, 2], 'IN'))
+            info = format_cache_info()
+        finally:
+            disable_format_cache()
+        self.assertEqual(info['results'].hits, 1)
+        self.assertEqual(info['formatters'].hits, 1)
+
+    def test_large_batch_keeps_loop_responsive(self):
+        from format_currency import format_currency_many
+        from format_currency.aio import format_currency_many_async, preload
+        numbers = [index * 1.37 for index in range(200000)]
+        asyncio.run(preload())
+
+        start = time.perf_counter()
+        expected = format_currency_many(numbers, 'IN')
+        blocking = time.perf_counter() - start
+
+        result, max_gap = asyncio.run(measure_loop_latency(format_currency_many_async(numbers, 'IN', chunk_size=1000)))
+        self.assertEqual(result, expected)
+        #* the whole batch would hold the loop for `blocking` seconds, a chunk only for a fraction of it
+        self.assertLess(max_gap, max(blocking / 4, 0.05))
+
+    def test_executor(self):
+        from format_currency import format_currency_many
+        from format_currency.aio import format_currency_many_async
+        numbers = [index * 1.37 for index in range(5000)] + [1, 2 ** 70]
+        with ThreadPoolExecutor(2) as executor:
+            result = asyncio.run(format_currency_many_async(numbers, 'ID', chunk_size=512, executor=executor))
+        self.assertEqual(result, format_currency_many(numbers, 'ID'))
+
+    def test_invalid_arguments(self):
+        from format_currency.aio import format_currency_many_async
+        with self.assertRaises(ValueError):
+            asyncio.run(format_currency_many_async([1], 'US', chunk_size=0))
+        with self.assertRaises(TypeError):
+            asyncio.run(format_currency_many_async([1], 'US', unknown=True))
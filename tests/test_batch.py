@@ -0,0 +1,80 @@
+import array
+import unittest
+
+from format_currency import vectorized
+
+numpy = vectorized.load_numpy()
+
+class TestBatchFormat(unittest.TestCase):
+
+    values = [0.0, -0.0, 0.005, 1.005, 2.675, 999.995, -0.001, 1234567.891, -1234567.891, 12345678912345.123,
+              float('nan'), float('inf'), 1e20]
+
+    options = [
+        {'country_code': 'US'},
+        {'country_code': 'ID'},
+        {'country_code': 'IN'},
+        {'country_code': 'CN', 'place_currency_symbol_at_end': True},
+        {'currency_code': 'BHD'},
+        {'currency_code': 'USD', 'number_format_system': 'none'},
+        {'currency_code': 'EUR', 'decimal_places': 0},
+        {'currency_code': 'USD', 'smart_number_formatting': True},
+    ]
+
+    def test_format_currency_many_list(self):
+        from format_currency import format_currency, format_currency_many
+        for option in self.options:
+            self.assertEqual(format_currency_many(self.values, **option), [format_currency(value, **option) for value in self.values])
+
+    def test_format_currency_many_iterable(self):
+        from format_currency import format_currency_many
+        self.assertEqual(format_currency_many((value for value in [1, 2.5]), 'ID'), ['Rp 1,00', 'Rp 2,50'])
+        self.assertEqual(format_currency_many([], 'ID'), [])
+
+    def test_format_many_array(self):
+        from format_currency import CurrencyFormatter
+        numbers = array.array('d', self.values)
+        for option in self.options:
+            formatter = CurrencyFormatter(**option)
+            self.assertEqual(formatter.format_many(numbers), [formatter.format(value) for value in self.values])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_format_many_numpy_matches_scalar(self):
+        from format_currency import CurrencyFormatter
+        generator = numpy.random.default_rng(0)
+        floats = numpy.concatenate([
+            generator.uniform(-1e12, 1e12, 500),
+            generator.uniform(-2000, 2000, 500),
+            numpy.round(generator.uniform(0, 1e6, 500), 3),
+            numpy.asarray(self.values),
+        ])
+        integers = numpy.concatenate([
+            generator.integers(-2 ** 62, 2 ** 62, 200),
+            generator.integers(-10 ** 7, 10 ** 7, 200),
+            [0, -1, 2 ** 53 + 1, -2 ** 63, 2 ** 63 - 1],
+        ]).astype(numpy.int64)
+
+        for option in self.options:
+            formatter = CurrencyFormatter(**option)
+            for numbers in (floats, integers, floats.astype(numpy.float32), floats[:0]):
+                self.assertEqual(formatter.format_many(numbers), [formatter.format(value) for value in numbers.tolist()])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_format_many_numpy_multichar_separator(self):
+        from format_currency import CurrencyFormatter
+        formatter = CurrencyFormatter(currency_symbol='CHF', thousands_separator="'", decimal_separator=' . ')
+        numbers = numpy.asarray([1234567.891, -0.5, 12.0])
+        self.assertEqual(formatter.format_many(numbers), [formatter.format(value) for value in numbers.tolist()])
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_format_many_numpy_dtype_limits(self):
+        from format_currency import CurrencyFormatter
+        arrays = [numpy.asarray([numpy.iinfo(dtype).min, numpy.iinfo(dtype).max, -1, 0], dtype=dtype) for dtype in ('int8', 'int16', 'int32', 'int64')]
+        arrays += [numpy.asarray([numpy.iinfo(dtype).max, 10 ** 19 - 1, 10 ** 19, 1], dtype=dtype) for dtype in ('uint64',)]
+        arrays.append(numpy.asarray([numpy.iinfo('uint8').max, 1], dtype='uint8'))
+        for option in self.options:
+            formatter = CurrencyFormatter(**option)
+            for numbers in arrays:
+                self.assertEqual(formatter.format_many(numbers), [formatter.format(value) for value in numbers.tolist()])
+        formatter = CurrencyFormatter('US', decimal_places=25)
+        self.assertEqual(formatter.format_many(numpy.asarray([1.5, -2])), ['$ 1.5000000000000000000000000', '$ -2.0000000000000000000000000'])
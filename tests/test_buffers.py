@@ -0,0 +1,93 @@
+import array
+import io
+import mmap
+import unittest
+from unittest import mock
+
+from format_currency import vectorized
+
+numpy = vectorized.load_numpy()
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestFormatCurrencyBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.floats = [0.0, -0.0, 0.005, 0.015, 2.675, -1234567.891, 1e15, 1e22, -1e300, float('nan'), float('inf'), float('-inf'), 5e-324]
+        self.cents = [0, 1, -1, 99, 100, 123456789, -123456789, 2 ** 63 - 1, -2 ** 63]
+
+    def expected(self, numbers, minor_units=False, delimiter='\n', *args, **kwargs):
+        from format_currency import format_currency, format_currency_minor_units
+        function = format_currency_minor_units if minor_units else format_currency
+        return ''.join(function(number, *args, **kwargs) + delimiter for number in numbers).encode('utf-8')
+
+    def test_floats(self):
+        from format_currency import format_currency_buffer
+        for country_code, kwargs in [('US', {}), ('IN', {}), ('ID', {}), ('CN', {'place_currency_symbol_at_end': True}), ('JP', {}), ('FR', {'number_format_system': 'auto'})]:
+            with self.subTest(country_code=country_code, **kwargs):
+                result = format_currency_buffer(numpy.array(self.floats), None, country_code, **kwargs)
+                self.assertEqual(result, self.expected(self.floats, False, '\n', country_code, **kwargs))
+
+    def test_minor_units(self):
+        from format_currency import format_currency_buffer
+        for currency_code in ['USD', 'INR', 'JPY', 'KWD', 'IDR']:
+            with self.subTest(currency_code=currency_code):
+                result = format_currency_buffer(array.array('q', self.cents), currency_code=currency_code, minor_units=True)
+                self.assertEqual(result, self.expected(self.cents, True, '\n', currency_code=currency_code))
+        with self.assertRaises(TypeError):
+            format_currency_buffer(numpy.array([1.5]), currency_code='USD', minor_units=True)
+
+    def test_dtype_limits(self):
+        from format_currency import format_currency_buffer
+        for dtype in ('int8', 'int16', 'int32', 'uint64'):
+            numbers = [int(numpy.iinfo(dtype).min), int(numpy.iinfo(dtype).max), 1]
+            with self.subTest(dtype=dtype):
+                self.assertEqual(format_currency_buffer(numpy.array(numbers, dtype=dtype), None, 'IN'), self.expected(numbers, False, '\n', 'IN'))
+                self.assertEqual(format_currency_buffer(numpy.array(numbers, dtype=dtype), None, 'IN', minor_units=True), self.expected(numbers, True, '\n', 'IN'))
+
+    def test_untyped_buffers(self):
+        from format_currency import format_currency_buffer
+        data = numpy.array(self.cents, dtype=numpy.int64).tobytes()
+        expected = self.expected(self.cents, True, ';', 'IN')
+        self.assertEqual(format_currency_buffer(data, None, 'IN', dtype='int64', minor_units=True, delimiter=';'), expected)
+        self.assertEqual(format_currency_buffer(memoryview(data), None, 'IN', dtype='int64', minor_units=True, delimiter=';'), expected)
+        with self.assertRaises(TypeError):
+            format_currency_buffer(data, None, 'IN')
+
+    def test_nul_delimiter_and_separators(self):
+        from format_currency import format_currency_buffer
+        numbers = numpy.array(self.floats)
+        self.assertEqual(format_currency_buffer(numbers, None, 'US', delimiter='\x00'), self.expected(self.floats, False, '\x00', 'US'))
+        kwargs = {'thousands_separator': '\x00', 'currency_symbol': '\x00'}
+        self.assertEqual(format_currency_buffer(numbers, None, 'US', **kwargs), self.expected(self.floats, False, '\n', 'US', **kwargs))
+
+    def test_outputs(self):
+        from format_currency import format_currency_buffer
+        numbers = numpy.array(self.floats)
+        expected = self.expected(self.floats, False, '\n', 'IN')
+
+        out = bytearray(b'header\n')
+        self.assertEqual(format_currency_buffer(numbers, out, 'IN'), len(expected))
+        self.assertEqual(bytes(out), b'header\n' + expected)
+
+        out = io.BytesIO()
+        self.assertEqual(format_currency_buffer(numbers, out, 'IN'), len(expected))
+        self.assertEqual(out.getvalue(), expected)
+
+        with mmap.mmap(-1, len(expected)) as out:
+            format_currency_buffer(numbers, out, 'IN')
+            self.assertEqual(out[:], expected)
+
+    def test_mmap_input_and_blocks(self):
+        from format_currency import buffers, format_currency_buffer
+        numbers = numpy.random.default_rng(0).integers(-10 ** 12, 10 ** 12, 3 * vectorized.CHUNK_SIZE + 7)
+        with mmap.mmap(-1, numbers.nbytes) as data, mock.patch.object(buffers, 'BLOCK_SIZE', 2 * vectorized.CHUNK_SIZE):
+            data[:] = numbers.tobytes()
+            result = format_currency_buffer(data, None, 'IN', dtype='int64', minor_units=True)
+        self.assertEqual(result, self.expected(numbers.tolist(), True, '\n', 'IN'))
+
+    def test_smart_formatting(self):
+        from format_currency import format_currency_buffer
+        numbers = [1234.5, 1234567.891, -9876543210.0]
+        result = format_currency_buffer(numpy.array(numbers), None, 'ID', smart_number_formatting=True)
+        self.assertEqual(result, self.expected(numbers, False, '\n', 'ID', smart_number_formatting=True))
+
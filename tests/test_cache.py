@@ -0,0 +1,135 @@
+import locale
+import threading
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+class TestFormatCache(unittest.TestCase):
+
+    def setUp(self):
+        from format_currency import enable_format_cache
+        enable_format_cache(maxsize=4, formatters_maxsize=2)
+
+    def tearDown(self):
+        from format_currency import LocaleSnapshot, disable_format_cache
+        disable_format_cache()
+        locale.setlocale(locale.LC_ALL, 'C')
+        LocaleSnapshot.clear_cache()
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        from format_currency.cache import LRUCache
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.info(), (2, 1, 2, 2))
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def test_results_are_cached(self):
+        from format_currency import CurrencyFormatter, format_cache_info, format_currency
+        with mock.patch.object(CurrencyFormatter, 'format', autospec=True, side_effect=CurrencyFormatter.format) as format:
+            for _ in range(5):
+                self.assertEqual(format_currency(9.99, 'US'), '$ 9.99')
+            self.assertEqual(format.call_count, 1)
+        info = format_cache_info()
+        self.assertEqual((info['results'].hits, info['results'].misses, info['results'].currsize), (4, 1, 1))
+        self.assertEqual(info['formatters'].currsize, 1)
+
+    def test_key_includes_type_and_options(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(1, 'US', decimal_places=0), '$ 1')
+        self.assertEqual(format_currency(1.4, 'US', decimal_places=0), '$ 1')
+        self.assertEqual(format_currency(True, 'US'), '$ 1.00')
+        self.assertEqual(format_currency(Decimal('1234.5'), 'ID'), 'Rp 1.234,50')
+        self.assertEqual(format_currency(1234.5, 'ID', place_currency_symbol_at_end=True), '1.234,50 Rp')
+        self.assertEqual(format_currency(1234.5, 'ID'), 'Rp 1.234,50')
+        self.assertEqual(format_currency(-0.0, 'US'), '$ -0.00')
+        self.assertEqual(format_currency(0.0, 'US'), '$ 0.00')
+
+    def test_cache_is_bounded(self):
+        from format_currency import format_cache_info, format_currency
+        for number in range(1, 20):
+            format_currency(number, 'US')
+            format_currency(number, ('ID', 'IN', 'CN')[number % 3])
+        info = format_cache_info()
+        self.assertEqual(info['results'].currsize, 4)
+        self.assertEqual(info['formatters'].currsize, 2)
+
+    def test_clear_and_disable(self):
+        from format_currency import clear_format_cache, disable_format_cache, format_cache_info, format_currency
+        format_currency(9.99, 'US')
+        clear_format_cache()
+        self.assertEqual(format_cache_info()['results'], (0, 0, 4, 0))
+        disable_format_cache()
+        self.assertEqual(format_cache_info(), {'results': None, 'formatters': None})
+        self.assertEqual(format_currency(9.99, 'US'), '$ 9.99')
+
+    def test_formatters_only(self):
+        from format_currency import enable_format_cache, format_cache_info, format_currency_many, format_currency_minor_units
+        enable_format_cache(maxsize=0)
+        self.assertEqual(format_currency_many([1, 2], 'US'), ['$ 1.00', '$ 2.00'])
+        self.assertEqual(format_currency_minor_units(123, 'US'), '$ 1.23')
+        info = format_cache_info()
+        self.assertIsNone(info['results'])
+        self.assertEqual((info['formatters'].hits, info['formatters'].misses), (1, 1))
+
+    def test_locale_change_is_never_stale(self):
+        from format_currency import format_currency
+        locale.setlocale(locale.LC_ALL, 'C')
+        #* the C locale has no monetary separators at all
+        self.assertEqual(format_currency(1234.5, 'US', use_current_locale=True), '$ 123450')
+        fake_localeconv = dict(locale.localeconv(), mon_thousands_sep='.', mon_decimal_point=',', mon_grouping=[3, 0])
+        with mock.patch('locale.localeconv', return_value=fake_localeconv):
+            locale.setlocale(locale.LC_ALL, 'C.UTF-8')
+            self.assertEqual(format_currency(1234.5, 'US', use_current_locale=True), '$ 1.234,50')
+        locale.setlocale(locale.LC_ALL, 'C')
+        self.assertEqual(format_currency(1234.5, 'US', use_current_locale=True), '$ 123450')
+
+    def test_registered_unit_table_is_never_stale(self):
+        from format_currency import format_currency, register_unit_table
+        register_unit_table('test_cache', {'': 1, 'Tsd.': 1000})
+        self.assertEqual(format_currency(1234567, 'US', smart_number_formatting=True, smart_units='test_cache'), '$ 1,234.57 Tsd.')
+        register_unit_table('test_cache', {'': 1, 'Tsd.': 1000, 'Mio.': 1000})
+        self.assertEqual(format_currency(1234567, 'US', smart_number_formatting=True, smart_units='test_cache'), '$ 1.23 Mio.')
+
+    def test_formatters_are_reused_by_default(self):
+        from format_currency import CurrencyFormatter, disable_format_cache, format_currency, register_currency, unregister_currency
+        disable_format_cache()
+        with mock.patch.object(CurrencyFormatter, '__init__', autospec=True, side_effect=CurrencyFormatter.__init__) as init:
+            for number in range(5):
+                self.assertEqual(format_currency(number, 'ID', place_currency_symbol_at_end=True), f'{number},00 Rp')
+            self.assertEqual(init.call_count, 1)
+        register_currency('IDR', decimal_places=0)
+        try:
+            self.assertEqual(format_currency(5, 'ID', place_currency_symbol_at_end=True), '5 Rp')
+        finally:
+            unregister_currency('IDR')
+        self.assertEqual(format_currency(5, 'ID', place_currency_symbol_at_end=True), '5,00 Rp')
+
+    def test_unhashable_options(self):
+        from format_currency import format_currency
+        with self.assertRaises(TypeError):
+            format_currency(1, 'US', decimal_places=[2])
+
+    def test_concurrent_format_currency(self):
+        from format_currency import format_currency
+        errors = []
+
+        def worker():
+            try:
+                for index in range(500):
+                    number = index % 7 + 0.99
+                    self.assertEqual(format_currency(number, 'US'), f'$ {number:.2f}')
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
@@ -0,0 +1,100 @@
+import io
+import json
+import unittest
+
+class TestCommandLine(unittest.TestCase):
+
+    def run_cli(self, argv, text):
+        from format_currency.cli import main
+        stdout = io.StringIO()
+        exit_code = main(argv, stdin=io.StringIO(text), stdout=stdout)
+        return exit_code, stdout.getvalue()
+
+    def test_csv_fixed_currency(self):
+        exit_code, output = self.run_cli(['-c', 'amount', '--country-code', 'ID'], 'id,amount\n1,1234567.891\n2,\n')
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output, 'id,amount\n1,"Rp 1.234.567,89"\n2,\n')
+
+    def test_csv_currency_column(self):
+        text = 'amount,currency\n1234567.891,IDR\n-42,USD\n1234567.891,INR\n'
+        exit_code, output = self.run_cli(['-c', 'amount', '--currency-column', 'currency', '--suffix', '_formatted'], text)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output.splitlines(), [
+            'amount,currency,amount_formatted',
+            '1234567.891,IDR,"Rp 1.234.567,89"',
+            '-42,USD,$ -42.00',
+            '1234567.891,INR,"₹ 12,34,567.89"',
+        ])
+
+    def test_csv_options(self):
+        text = 'amount\n1234567.891\n'
+        exit_code, output = self.run_cli(['-c', 'amount', '--currency-code', 'USD', '--smart-number-formatting', '--place-currency-symbol-at-end'], text)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output, 'amount\n1.23 Million $\n')
+
+    def test_jsonl(self):
+        text = '{"amount": 1234.5, "ccy": "USD"}\n\n{"amount": "99.995", "ccy": "JPY"}\n'
+        exit_code, output = self.run_cli(['-f', 'jsonl', '-c', 'amount', '--currency-column', 'ccy'], text)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([json.loads(line) for line in output.splitlines()], [
+            {'amount': '$ 1,234.50', 'ccy': 'USD'},
+            {'amount': '¥ 100', 'ccy': 'JPY'},
+        ])
+
+    def test_formatter_cached_per_currency(self):
+        from format_currency.cli import ColumnFormatter, build_parser
+        column_formatter = ColumnFormatter(build_parser().parse_args(['-c', 'amount', '--currency-column', 'ccy']))
+        for code in ['USD', 'IDR', 'USD', 'USD', 'IDR']:
+            column_formatter.format('1', code)
+        self.assertEqual(sorted(column_formatter.formatters), ['IDR', 'USD'])
+
+    def test_invalid_amount(self):
+        exit_code, output = self.run_cli(['-c', 'amount', '--country-code', 'US'], 'amount\n1\nabc\n')
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(output, 'amount\n$ 1.00\n')
+
+    def test_missing_column(self):
+        exit_code, _ = self.run_cli(['-c', 'price', '--country-code', 'US'], 'amount\n1\n')
+        self.assertEqual(exit_code, 1)
+
+    def test_short_csv_row(self):
+        from unittest import mock
+        with mock.patch('sys.stderr') as stderr:
+            exit_code, output = self.run_cli(['-c', 'amount', '--currency-column', 'ccy'], 'amount,ccy\n1,USD\n2\n')
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(output, 'amount,ccy\n$ 1.00,USD\n')
+        self.assertIn("line 3: column 'ccy' is missing", stderr.write.call_args[0][0])
+
+    def test_jsonl_line_not_an_object(self):
+        from unittest import mock
+        for line in ['[1, 2]', '42', '"USD"', '{"amount": 1']:
+            with self.subTest(line=line), mock.patch('sys.stderr') as stderr:
+                exit_code, output = self.run_cli(['-f', 'jsonl', '-c', 'amount', '--country-code', 'US'], '{"amount": 1}\n' + line + '\n')
+                self.assertEqual(exit_code, 1)
+                self.assertEqual(output, '{"amount": "$ 1.00"}\n')
+                self.assertIn('line 2: ', stderr.write.call_args[0][0])
+
+    def test_use_current_locale(self):
+        import locale
+        from unittest import mock
+        from format_currency import LocaleSnapshot
+        fake_localeconv = dict(locale.localeconv(), mon_thousands_sep='.', mon_decimal_point=',', mon_grouping=[3, 0])
+        LocaleSnapshot.clear_cache()
+        try:
+            with mock.patch('locale.setlocale', wraps=locale.setlocale) as setlocale, mock.patch('locale.localeconv', return_value=fake_localeconv):
+                exit_code, output = self.run_cli(['-c', 'amount', '--country-code', 'US', '--use-current-locale'], 'amount\n1234567.89\n')
+            setlocale.assert_any_call(locale.LC_MONETARY, '')
+        finally:
+            locale.setlocale(locale.LC_ALL, 'C')
+            LocaleSnapshot.clear_cache()
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(output, 'amount\n"$ 1.234.567,89"\n')
+
+    def test_unknown_row_code(self):
+        from unittest import mock
+        for column in ('--currency-column', '--country-column'):
+            with self.subTest(column=column), mock.patch('sys.stderr') as stderr:
+                exit_code, output = self.run_cli(['-c', 'amount', column, 'code'], 'amount,code\n1,' + ('USD' if 'currency' in column else 'US') + '\n1,ZZZ\n')
+                self.assertEqual(exit_code, 1)
+                self.assertEqual(output, 'amount,code\n$ 1.00,' + ('USD' if 'currency' in column else 'US') + '\n')
+                self.assertIn("line 3: unknown", stderr.write.call_args[0][0])
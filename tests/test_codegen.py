@@ -0,0 +1,48 @@
+import itertools
+import unittest
+from decimal import Decimal
+
+class TestCodegen(unittest.TestCase):
+
+    def test_compiled_matches_format_currency(self):
+        from format_currency import Country, LocaleSnapshot, format_currency
+        from format_currency.codegen import compile_formatter
+        numbers = [0, -7, 12345678901234567890, -0.0, 0.005, -1234567.891, 1e21, float('nan'), float('-inf'), True, Decimal('-98765.4321'), Decimal('NaN')]
+        snapshot = LocaleSnapshot(' ', ',', (3, 0))
+        for country_code in list(Country.load_countries_index()['alpha2'])[::7] + ['IN', 'CN', 'ID', None]:
+            for number_format_system, smart_number_formatting, decimal_places in itertools.product(['auto', 'indian', 'chinese', 'none'], [False, True], [0, 3]):
+                kwargs = dict(number_format_system=number_format_system, smart_number_formatting=smart_number_formatting, decimal_places=decimal_places)
+                compiled = compile_formatter(country_code, **kwargs)
+                with_locale = compile_formatter(country_code, locale_snapshot=snapshot, place_currency_symbol_at_end=True, **kwargs)
+                for number in numbers:
+                    self.assertEqual(compiled(number), format_currency(number, country_code, **kwargs))
+                    self.assertEqual(with_locale(number), format_currency(number, country_code, locale_snapshot=snapshot, place_currency_symbol_at_end=True, **kwargs))
+
+    def test_custom_separators(self):
+        from format_currency import format_currency
+        from format_currency.codegen import compile_formatter
+        for kwargs in [dict(currency_symbol='X'), dict(decimal_separator=',', thousands_separator='.'), dict(thousands_separator=''), dict(decimal_separator='_')]:
+            compiled = compile_formatter(**kwargs)
+            for number in [7, -1234567.891, Decimal('1234.5')]:
+                self.assertEqual(compiled(number), format_currency(number, **kwargs))
+
+    def test_constants_are_compiled_in(self):
+        from format_currency.codegen import compile_formatter
+        format_idr = compile_formatter('ID')
+        self.assertEqual(format_idr.__name__, 'format_idr')
+        self.assertIn("'Rp '", format_idr.__source__)
+        self.assertNotIn('number_format_system', format_idr.__source__)
+        self.assertEqual(format_idr(1234567.891), 'Rp 1.234.567,89')
+
+    def test_compiled_functions_are_cached(self):
+        from format_currency.codegen import compile_all_countries, compile_formatter
+        self.assertIs(compile_formatter('US'), compile_formatter('US'))
+        self.assertIsNot(compile_formatter('US'), compile_formatter('US', decimal_places=0))
+        compiled = compile_all_countries()
+        self.assertEqual(len(compiled), 239)
+        self.assertIs(compiled['US'], compile_formatter('US'))
+
+    def test_traceback_shows_generated_source(self):
+        import inspect
+        from format_currency.codegen import compile_formatter
+        self.assertEqual(inspect.getsource(compile_formatter('IN')), compile_formatter('IN').__source__)
@@ -102,3 +102,89 @@ class TestCountryData(unittest.TestCase):
         from format_currency import Country
         country = Country.load_country('XX')
         self.assertIsNone(country)
+
+    def test_countries_data_has_no_flags(self):
+        from format_currency import Country
+        data = Country.load_countries_data()
+        self.assertEqual(len(data), 239)
+        self.assertTrue(all('flag' not in country_data for country_data in data))
+
+    def test_load_country_flag(self):
+        from format_currency import Country
+        country = Country.load_country('ID')
+        self.assertTrue(country.flag_base64.startswith('iVBORw0KGgo'))
+        self.assertEqual(Country.load_flags_data()['ID'], country.flag_base64)
+
+    def test_load_country_by_alpha3(self):
+        from format_currency import Country
+        country = Country.load_country_by_alpha3('idn')
+        self.assertIsNotNone(country)
+        self.assertEqual(country.alpha2, 'ID')
+        self.assertIs(country, Country.load_country('ID'))
+        self.assertIsNone(Country.load_country_by_alpha3('XXX'))
+
+    def test_load_country_by_numeric(self):
+        from format_currency import Country
+        self.assertEqual(Country.load_country_by_numeric(840).alpha2, 'US')
+        self.assertEqual(Country.load_country_by_numeric('840').alpha2, 'US')
+        self.assertEqual(Country.load_country_by_numeric('004').alpha2, 'AF')
+        self.assertIsNone(Country.load_country_by_numeric('abc'))
+        self.assertIsNone(Country.load_country_by_numeric(999))
+        for code in (840.0, 840.9, True, '840.0', '-840', '', None, b'840'):
+            with self.subTest(code=code):
+                self.assertIsNone(Country.load_country_by_numeric(code))
+        self.assertIsNone(Country.load_country_by_numeric(1))
+        self.assertIsNone(Country.load_country_by_numeric(True))
+
+    def test_load_country_normalizes_case(self):
+        from format_currency import Country
+        self.assertIs(Country.load_country('us'), Country.load_country('US'))
+        self.assertIs(Country.load_country_by_currency_code('usd'), Country.load_country_by_currency_code('USD'))
+
+    def test_load_country_by_shared_currency_code(self):
+        from format_currency import Country
+        #* first country using the currency in the data wins
+        self.assertEqual(Country.load_country_by_currency_code('EUR').alpha2, 'AD')
+
+    def test_load_country_miss_is_cached(self):
+        from format_currency import Country, country
+        self.assertIsNone(Country.load_country('ZZ'))
+        self.assertIn('ZZ', country.cached_countries_data_dict)
+        self.assertIsNone(country.cached_countries_data_dict['ZZ'])
+        self.assertIsNone(Country.load_country('ZZ'))
+
+    def test_country_is_immutable(self):
+        from format_currency import Country
+        country = Country.load_country('US')
+        self.assertFalse(hasattr(country, '__dict__'))
+        with self.assertRaises(AttributeError):
+            country.currency_symbol = 'US$'
+        with self.assertRaises(AttributeError):
+            del country.currency_code
+        self.assertEqual(country.currency_symbol, '$')
+
+    def test_country_is_hashable(self):
+        from format_currency import Country
+        country = Country.load_country('ID')
+        copy = Country(*country.key()[:9], numeric=country.numeric)
+        self.assertEqual(country, copy)
+        self.assertEqual(hash(country), hash(copy))
+        self.assertNotEqual(country, Country.load_country('US'))
+        cache = {country: 'Rp'}
+        self.assertEqual(cache[copy], 'Rp')
+
+    def test_country_indexes_share_instances(self):
+        from format_currency import Country
+        index = Country.load_countries_index()
+        country = Country.load_country('US')
+        self.assertIs(index['alpha3']['USA'], country)
+        self.assertIs(index['numeric'][840], country)
+        self.assertIs(index['currency_code']['USD'], country)
+
+    def test_unpickled_country_is_canonical(self):
+        import pickle
+        from format_currency import Country
+        country = Country.load_country('JP')
+        self.assertIs(pickle.loads(pickle.dumps(country)), country)
+        custom = Country('Testland', 'TL', 'TLD', 'TLD', 'Test', 'T', '.', ',')
+        self.assertEqual(pickle.loads(pickle.dumps(custom)), custom)
@@ -0,0 +1,84 @@
+import random
+import unittest
+from decimal import Decimal
+
+from format_currency import vectorized
+
+numpy = vectorized.load_numpy()
+try:
+    import pandas
+except ImportError:
+    pandas = None
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+@unittest.skipIf(numpy is None, 'NumPy is not installed')
+class TestFormatCurrencyColumn(unittest.TestCase):
+
+    def setUp(self):
+        from format_currency import format_currency
+        random.seed(0)
+        self.amounts = [random.choice([9.99, 19.99, 0.0, -0.0, 1234567.891]) if random.random() < 0.7 else random.uniform(-1e7, 1e7) for _ in range(3000)]
+        self.currencies = [random.choice(['IDR', 'USD', 'INR', 'CNY', None, 'XXX']) for _ in range(3000)]
+        self.expected = [format_currency(amount, currency_code=currency_code) for amount, currency_code in zip(self.amounts, self.currencies)]
+
+    def test_sequence(self):
+        from format_currency import format_currency_column, format_currency_many
+        self.assertEqual(format_currency_column(self.amounts, 'ID'), format_currency_many(self.amounts, 'ID'))
+        self.assertEqual(format_currency_column(self.amounts, currency_code=self.currencies), self.expected)
+        self.assertEqual(format_currency_column(self.amounts, currency_code=self.currencies, categorical=True), self.expected)
+
+    def test_categorical_keeps_types_and_signed_zero(self):
+        from format_currency import format_currency_column
+        numbers = [1, 1.0, Decimal('1.005'), True, -0.0, 0.0, Decimal('-0'), 2 ** 60 + 1]
+        self.assertEqual(format_currency_column(numbers, 'US', categorical=True), format_currency_column(numbers, 'US'))
+        self.assertEqual(format_currency_column(numpy.array([1.5, -0.0, 0.0, 1.5]), 'US', categorical=True), ['$ 1.50', '$ -0.00', '$ 0.00', '$ 1.50'])
+
+    def test_country_code_column(self):
+        from format_currency import format_currency_column
+        self.assertEqual(format_currency_column([1234567.891] * 3, country_code=['IN', 'CN', 'ID'], decimal_places=0), ['₹ 12,34,568', '¥ 123,4568', 'Rp 1.234.568'])
+        with self.assertRaises(ValueError):
+            format_currency_column([1], country_code=['IN'], currency_code=['INR'])
+        with self.assertRaises(ValueError):
+            format_currency_column([1, 2], currency_code=['INR'])
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed')
+    def test_pandas_series(self):
+        from format_currency import format_currency_column
+        frame = pandas.DataFrame({'amount': self.amounts + [None], 'currency': self.currencies + ['USD']}, index=range(10, 3011))
+        result = format_currency_column(frame['amount'], currency_code=frame['currency'])
+        self.assertEqual(str(result.dtype), 'string')
+        self.assertEqual(result.name, 'amount')
+        self.assertTrue(result.index.equals(frame.index))
+        self.assertEqual(result.iloc[:-1].tolist(), self.expected)
+        self.assertTrue(pandas.isna(result.iloc[-1]))
+
+        categorical = format_currency_column(frame['amount'], currency_code=frame['currency'], categorical=True)
+        self.assertEqual(str(categorical.dtype), 'category')
+        self.assertEqual(categorical.iloc[:-1].astype(object).tolist(), self.expected)
+        self.assertTrue(pandas.isna(categorical.iloc[-1]))
+        self.assertLessEqual(len(categorical.cat.categories), len(set(self.expected)))
+
+    @unittest.skipIf(pandas is None, 'pandas is not installed')
+    def test_pandas_nullable_integers(self):
+        from format_currency import format_currency_column
+        series = pandas.Series([1, None, 2 ** 60 + 1], dtype='Int64')
+        self.assertEqual(format_currency_column(series, 'US').tolist(), ['$ 1.00', pandas.NA, '$ 1,152,921,504,606,846,977.00'])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_arrays(self):
+        from format_currency import format_currency_column
+        amounts = pyarrow.chunked_array([self.amounts[:1000], self.amounts[1000:] + [None]])
+        currencies = pyarrow.array(self.currencies + ['USD'])
+        result = format_currency_column(amounts, currency_code=currencies)
+        self.assertEqual(result.type, pyarrow.string())
+        self.assertEqual(result.to_pylist(), self.expected + [None])
+
+        categorical = format_currency_column(amounts, currency_code=currencies, categorical=True)
+        self.assertTrue(pyarrow.types.is_dictionary(categorical.type))
+        self.assertEqual(categorical.to_pylist(), self.expected + [None])
+
+        decimals = pyarrow.array([Decimal('1.005'), None, Decimal('-12345.678')], pyarrow.decimal128(10, 3))
+        self.assertEqual(format_currency_column(decimals, 'US').to_pylist(), ['$ 1.00', None, '$ -12,345.68'])
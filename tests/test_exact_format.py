@@ -0,0 +1,57 @@
+import unittest
+from decimal import Decimal
+
+class TestExactFormat(unittest.TestCase):
+
+    def test_decimal(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(Decimal('1234567.891'), 'US'), '$ 1,234,567.89')
+        self.assertEqual(format_currency(Decimal('1234567.891'), 'ID'), 'Rp 1.234.567,89')
+        self.assertEqual(format_currency(Decimal('1234567.891'), 'IN'), '₹ 12,34,567.89')
+        self.assertEqual(format_currency(Decimal('1234567.891'), 'CN'), '¥ 123,4567.89')
+        self.assertEqual(format_currency(Decimal('-0.001'), 'US'), '$ -0.00')
+        self.assertEqual(format_currency(Decimal('1E+3'), 'BH'), 'BHD 1,000.000')
+
+    def test_decimal_rounds_half_even(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(Decimal('0.125'), 'US'), '$ 0.12')
+        self.assertEqual(format_currency(Decimal('0.135'), 'US'), '$ 0.14')
+        self.assertEqual(format_currency(Decimal('-2.5'), 'US', decimal_places=0), '$ -2')
+
+    def test_decimal_above_float_precision(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(Decimal('12345678901234567890.125'), 'US'), '$ 12,345,678,901,234,567,890.12')
+        self.assertEqual(format_currency(Decimal('12345678901234567890.125'), 'IN'), '₹ 1,23,45,67,89,01,23,45,67,890.12')
+
+    def test_decimal_not_finite(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(Decimal('NaN'), 'US'), '$ NaN')
+        self.assertEqual(format_currency(Decimal('-Infinity'), 'US'), '$ -Infinity')
+
+    def test_int_above_float_precision(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(2 ** 60 + 1, 'US'), '$ 1,152,921,504,606,846,977.00')
+        self.assertEqual(format_currency(-(2 ** 60 + 1), 'CN'), '¥ -115,2921,5046,0684,6977.00')
+
+    def test_minor_units(self):
+        from format_currency import format_currency_minor_units
+        self.assertEqual(format_currency_minor_units(123456789, currency_code='USD'), '$ 1,234,567.89')
+        self.assertEqual(format_currency_minor_units(123456789, 'ID'), 'Rp 1.234.567,89')
+        self.assertEqual(format_currency_minor_units(-5, 'US'), '$ -0.05')
+        self.assertEqual(format_currency_minor_units(1234567, 'BH'), 'BHD 1,234.567')
+        self.assertEqual(format_currency_minor_units(1234567, 'JP'), '¥ 1,234,567')
+        self.assertEqual(format_currency_minor_units(2 ** 70, 'US'), '$ 11,805,916,207,174,113,034.24')
+
+    def test_minor_units_display_precision(self):
+        from format_currency import format_currency_minor_units
+        self.assertEqual(format_currency_minor_units(125, 'US', decimal_places=1), '$ 1.2')
+        self.assertEqual(format_currency_minor_units(135, 'US', decimal_places=1), '$ 1.4')
+        self.assertEqual(format_currency_minor_units(-135, 'US', decimal_places=1), '$ -1.4')
+        self.assertEqual(format_currency_minor_units(125, 'US', decimal_places=4), '$ 1.2500')
+        self.assertEqual(format_currency_minor_units(125, currency_symbol='X', decimal_places=2), 'X 1.25')
+
+    def test_minor_units_formatter(self):
+        from format_currency import CurrencyFormatter
+        formatter = CurrencyFormatter(currency_code='INR', place_currency_symbol_at_end=True)
+        self.assertEqual(formatter.minor_unit_places, 2)
+        self.assertEqual(formatter.format_minor_units(123456789), '12,34,567.89 ₹')
@@ -0,0 +1,58 @@
+import unittest
+
+class TestCurrencyFormatter(unittest.TestCase):
+
+    def test_matches_format_currency(self):
+        from format_currency import CurrencyFormatter, format_currency
+
+        values = [0, 0.5, -0.001, 999.995, 1234567.891, -1234567.891, 12345678912345.123]
+        options = [
+            {'country_code': 'US'},
+            {'country_code': 'ID'},
+            {'country_code': 'IN'},
+            {'country_code': 'CN'},
+            {'currency_code': 'BHD'},
+            {'currency_code': 'USD', 'smart_number_formatting': True},
+            {'currency_code': 'INR', 'number_format_system': 'indian', 'smart_number_formatting': True},
+            {'currency_code': 'CNY', 'number_format_system': 'chinese', 'smart_number_formatting': True},
+            {'currency_code': 'USD', 'number_format_system': 'none'},
+            {'currency_code': 'EUR', 'decimal_places': 0, 'place_currency_symbol_at_end': True},
+        ]
+        for option in options:
+            formatter = CurrencyFormatter(**option)
+            for value in values:
+                self.assertEqual(formatter.format(value), format_currency(value, **option))
+
+    def test_resolved_state(self):
+        from format_currency import CurrencyFormatter
+        formatter = CurrencyFormatter(currency_code='idr')
+        self.assertEqual(formatter.country_code, 'ID')
+        self.assertEqual(formatter.currency_code, 'IDR')
+        self.assertEqual(formatter.currency_symbol, 'Rp')
+        self.assertEqual(formatter.decimal_separator, ',')
+        self.assertEqual(formatter.thousands_separator, '.')
+        self.assertEqual(formatter.decimal_places, 2)
+
+    def test_custom_separators(self):
+        from format_currency import CurrencyFormatter
+        formatter = CurrencyFormatter(currency_symbol='EUR', decimal_separator=',', thousands_separator='_')
+        self.assertEqual(formatter.format(1234567.891), 'EUR 1_234_567,89')
+        self.assertEqual(CurrencyFormatter(currency_symbol='CHF').format(1234.5), 'CHF 1,234.50')
+
+    def test_invalid_options(self):
+        from format_currency import CurrencyFormatter
+        with self.assertRaises(ValueError):
+            CurrencyFormatter(currency_code='USD', number_format_system='invalid')
+        with self.assertRaises(TypeError):
+            CurrencyFormatter(currency_code='USD', unexpected_kwarg=True)
+
+    def test_swapped_separators_of_each_type(self):
+        from decimal import Decimal
+        from format_currency import CurrencyFormatter
+        for decimal_separator, thousands_separator in [(',', '.'), ('_', '.'), (',', '_'), ('.', ' '), (',', "'")]:
+            formatter = CurrencyFormatter(currency_symbol='X', decimal_separator=decimal_separator, thousands_separator=thousands_separator)
+            expected = f'X 1{thousands_separator}234{thousands_separator}567{decimal_separator}89'
+            self.assertEqual(formatter.format(1234567.891), expected)
+            self.assertEqual(formatter.format(Decimal('1234567.891')), expected)
+            self.assertEqual(formatter.format(1234567), expected[:-2] + '00')
+            self.assertEqual(formatter.format_minor_units(123456789), expected)
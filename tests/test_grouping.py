@@ -0,0 +1,33 @@
+import unittest
+
+class TestDigitGrouping(unittest.TestCase):
+
+    def test_group_bounds(self):
+        from format_currency.grouping import group_bounds
+        self.assertEqual(group_bounds((3,), 7), [(0, 1), (1, 4), (4, 7)])
+        self.assertEqual(group_bounds((3, 2), 7), [(0, 2), (2, 4), (4, 7)])
+        self.assertEqual(group_bounds((4,), 9), [(0, 1), (1, 5), (5, 9)])
+        self.assertEqual(group_bounds((3,), 3), [(0, 3)])
+        self.assertEqual(group_bounds((), 7), [(0, 7)])
+
+    def test_group(self):
+        from format_currency.grouping import DigitGrouping
+        self.assertEqual(DigitGrouping((3,), ',').group('1234567'), '1,234,567')
+        self.assertEqual(DigitGrouping((3, 2), ',').group('1234567'), '12,34,567')
+        self.assertEqual(DigitGrouping((3, 2), ',').group('123456'), '1,23,456')
+        self.assertEqual(DigitGrouping((4,), ' ').group('123456789'), '1 2345 6789')
+        self.assertEqual(DigitGrouping((3,), '.').group('1'), '1')
+        self.assertEqual(DigitGrouping((), '.').group('1234567'), '1234567')
+
+    def test_separators_are_not_swapped_twice(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(1234567.891, currency_symbol='X', thousands_separator='_', decimal_separator='.'), 'X 1_234_567.89')
+        self.assertEqual(format_currency(1234567.891, currency_symbol='X', thousands_separator='.', decimal_separator='_'), 'X 1.234.567_89')
+        self.assertEqual(format_currency(1234567.891, currency_symbol='X', thousands_separator='_', decimal_separator='.', number_format_system='indian'), 'X 12_34_567.89')
+
+    def test_numbering_system_helpers(self):
+        from format_currency import format_china_numbering_system, format_india_numbering_system
+        self.assertEqual(format_india_numbering_system('1,234,567.89'), '12,34,567.89')
+        self.assertEqual(format_india_numbering_system('-1,234,567.89'), '-12,34,567.89')
+        self.assertEqual(format_china_numbering_system('123,456,789'), '1,2345,6789')
+        self.assertEqual(format_india_numbering_system('12,345,678.90', smart_format=True), '1.23 Crore')
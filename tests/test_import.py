@@ -0,0 +1,48 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Prints the modules a snippet imported, besides the package's own
+IMPORTED_MODULES_SCRIPT = '''
+import json, sys
+before = set(sys.modules)
+{}
+print(json.dumps(sorted(name for name in set(sys.modules) - before if not name.startswith('format_currency'))))
+'''
+
+class TestImport(unittest.TestCase):
+
+    def imported_modules(self, code):
+        environment = dict(os.environ)
+        environment['PYTHONPATH'] = os.pathsep.join(filter(None, [SRC_PATH, environment.get('PYTHONPATH')]))
+        #* json is loaded by the script itself, so it can't be checked here
+        output = subprocess.run([sys.executable, '-c', IMPORTED_MODULES_SCRIPT.format(code)], env=environment,
+                                check=True, capture_output=True, text=True).stdout
+        return set(json.loads(output))
+
+    def test_import_is_lazy(self):
+        modules = self.imported_modules('import format_currency')
+        self.assertEqual(modules, set())
+
+    def test_explicit_separators_skip_data_and_locale(self):
+        modules = self.imported_modules("import format_currency; format_currency.format_currency(1234.5, currency_symbol='$', thousands_separator=',')")
+        for heavy in ('locale', 're', 'decimal', 'statistics', 'asyncio', 'numpy', 'concurrent.futures'):
+            self.assertNotIn(heavy, modules)
+        modules = self.imported_modules("import format_currency; format_currency.format_currency(1234.5, 'US')")
+        self.assertNotIn('locale', modules)
+        self.assertNotIn('asyncio', modules)
+
+    def test_public_names(self):
+        import format_currency
+        for name in format_currency.__all__:
+            self.assertTrue(hasattr(format_currency, name), name)
+        self.assertIn('format_currency_series', dir(format_currency))
+        self.assertNotIn('cached_countries_index', format_currency.__all__)
+        with self.assertRaises(AttributeError):
+            format_currency.cached_countries_index
+        from format_currency import vectorized
+        self.assertTrue(callable(vectorized.load_numpy))
@@ -0,0 +1,82 @@
+import unittest
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        from format_currency import reset_stats
+        reset_stats()
+
+    def tearDown(self):
+        from format_currency import disable_instrumentation, reset_stats
+        disable_instrumentation()
+        reset_stats()
+
+    def test_disabled_has_no_wrappers(self):
+        from format_currency import Country, CurrencyFormatter, disable_instrumentation, enable_instrumentation, format_currency, stats
+        format_method = CurrencyFormatter.__dict__['format']
+        load_country = Country.__dict__['load_country']
+        enable_instrumentation()
+        self.assertIsNot(CurrencyFormatter.__dict__['format'], format_method)
+        disable_instrumentation()
+        self.assertIs(CurrencyFormatter.__dict__['format'], format_method)
+        self.assertIs(Country.__dict__['load_country'], load_country)
+
+        format_currency(1, 'US')
+        self.assertFalse(stats()['enabled'])
+        self.assertEqual(stats()['calls'], {})
+
+    def test_calls_per_path(self):
+        from format_currency import enable_instrumentation, format_currency, format_currency_many, stats
+        enable_instrumentation()
+        self.assertEqual(format_currency(1234567.891, 'IN'), '₹ 12,34,567.89')
+        format_currency(1234567.891, 'US', smart_number_formatting=True)
+        format_currency(1234567.891, 'US', number_format_system='none')
+        format_currency_many([1, 2, 3], 'CN')
+        calls = stats()['calls']
+        #* lists are formatted one number at a time, so they count as `format` calls too
+        self.assertEqual(calls['format'], {'auto:indian': 1, 'auto:international.smart': 1, 'none:none': 1, 'auto:chinese': 3})
+        self.assertEqual(calls['format_many'], {'auto:chinese': 3})
+        self.assertEqual(sum(calls['formatter'].values()), 4)
+        self.assertIn('auto:indian', stats()['seconds']['format'])
+
+    def test_format_cache_is_dropped(self):
+        from format_currency import disable_format_cache, enable_format_cache, enable_instrumentation, format_currency, stats
+        enable_format_cache()
+        try:
+            format_currency(1234567.891, 'US')
+            format_currency(7.5, 'US')
+            enable_instrumentation()
+            format_currency(1234567.891, 'US')
+        finally:
+            disable_format_cache()
+        calls = stats()['calls']
+        self.assertEqual(calls['format'], {'auto:international': 1})
+        self.assertEqual(sum(calls['formatter'].values()), 1)
+
+    def test_lookup_cache_outcomes(self):
+        from format_currency import Country, enable_instrumentation, format_currency, stats
+        Country.clear_cache()
+        enable_instrumentation()
+        #* formatters are reused per options, other options resolve the country again
+        format_currency(1, 'ID')
+        format_currency(1, 'ID', decimal_places=0)
+        format_currency(1, 'XX')
+        format_currency(1, 'XX', decimal_places=0)
+        format_currency(1, currency_code='EUR')
+        lookups = stats()['lookups']
+        self.assertEqual(lookups['alpha2'], {'hits': 1, 'negative_hits': 1, 'misses': 2})
+        self.assertEqual(lookups['currency_code'], {'hits': 0, 'negative_hits': 0, 'misses': 1})
+        data_loads = stats()['data_loads']
+        self.assertEqual(data_loads['countries.json']['count'], 1)
+        self.assertGreater(data_loads['countries.json']['seconds'], 0)
+        self.assertNotIn('flags.json', data_loads)
+
+    def test_latency_and_callback(self):
+        from format_currency import enable_instrumentation, format_currency, stats
+        events = []
+        enable_instrumentation(latency=True, callback=events.append)
+        format_currency(1, 'US')
+        histogram = stats()['latency']['format']['auto:international']
+        self.assertEqual(sum(histogram.values()), 1)
+        self.assertTrue(all(bucket & (bucket - 1) == 0 for bucket in histogram))
+        self.assertEqual([(event.kind, event.name) for event in events][-2:], [('formatter', 'auto:international'), ('format', 'auto:international')])
@@ -0,0 +1,65 @@
+import locale
+import unittest
+from unittest import mock
+
+class TestLocaleSnapshot(unittest.TestCase):
+
+    def tearDown(self):
+        from format_currency import LocaleSnapshot
+        locale.setlocale(locale.LC_ALL, 'C')
+        LocaleSnapshot.clear_cache()
+
+    def test_grouping_from_localeconv(self):
+        from format_currency.locale_snapshot import grouping_from_localeconv
+        self.assertEqual(grouping_from_localeconv([3, 3, 0]), (3, 3))
+        self.assertEqual(grouping_from_localeconv([3, 2, 0]), (3, 2))
+        self.assertEqual(grouping_from_localeconv([]), ())
+        self.assertEqual(grouping_from_localeconv([3, locale.CHAR_MAX]), (3, 0))
+
+    def test_explicit_snapshot(self):
+        from format_currency import CurrencyFormatter, LocaleSnapshot, format_currency
+        en_in = LocaleSnapshot(thousands_separator=',', decimal_separator='.', grouping=(3, 2), name='en_IN')
+        de_de = LocaleSnapshot(thousands_separator='.', decimal_separator=',', grouping=(3,), name='de_DE')
+        self.assertEqual(format_currency(1234567.891, 'US', locale_snapshot=en_in), '$ 12,34,567.89')
+        self.assertEqual(format_currency(1234567.891, 'US', locale_snapshot=de_de), '$ 1.234.567,89')
+        #* an explicit numbering system still wins over the locale grouping
+        self.assertEqual(format_currency(1234567.891, 'US', locale_snapshot=en_in, number_format_system='international'), '$ 1,234,567.89')
+        formatter = CurrencyFormatter(currency_code='INR', locale_snapshot=de_de)
+        self.assertEqual(formatter.format_many([1234567.891, 1.5]), ['₹ 1.234.567,89', '₹ 1,50'])
+
+    def test_grouping_stops_after_char_max(self):
+        from format_currency import LocaleSnapshot, format_currency
+        snapshot = LocaleSnapshot(thousands_separator=' ', decimal_separator=',', grouping=(3, 0))
+        self.assertEqual(format_currency(1234567.891, 'US', locale_snapshot=snapshot), '$ 1234 567,89')
+
+    def test_snapshot_is_immutable_and_hashable(self):
+        from format_currency import LocaleSnapshot
+        snapshot = LocaleSnapshot(',', '.', [3, 2])
+        self.assertEqual(snapshot, LocaleSnapshot(',', '.', (3, 2), name='other'))
+        self.assertEqual(len({snapshot, LocaleSnapshot(',', '.', (3, 2))}), 1)
+        with self.assertRaises(AttributeError):
+            snapshot.decimal_separator = ','
+
+    def test_snapshot_pickles(self):
+        import pickle
+        from format_currency import LocaleSnapshot
+        snapshot = LocaleSnapshot(',', '.', (3, 2), name='en_IN')
+        restored = pickle.loads(pickle.dumps(snapshot))
+        self.assertEqual(restored, snapshot)
+        self.assertEqual(restored.name, 'en_IN')
+        with self.assertRaises(AttributeError):
+            restored.name = 'other'
+
+    def test_current_is_cached_until_setlocale(self):
+        from format_currency import LocaleSnapshot, format_currency
+        locale.setlocale(locale.LC_ALL, 'C')
+        LocaleSnapshot.clear_cache()
+        with mock.patch('locale.localeconv', wraps=locale.localeconv) as localeconv:
+            for _ in range(5):
+                format_currency(1234.5, 'US', use_current_locale=True)
+            self.assertEqual(localeconv.call_count, 1)
+            self.assertEqual(LocaleSnapshot.current().name, 'C')
+
+            locale.setlocale(locale.LC_ALL, 'C.UTF-8')
+            self.assertEqual(LocaleSnapshot.current().name, locale.setlocale(locale.LC_MONETARY))
+            self.assertEqual(localeconv.call_count, 2)
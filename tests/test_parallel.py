@@ -0,0 +1,75 @@
+import array
+import random
+import unittest
+from decimal import Decimal
+
+from format_currency import vectorized
+
+numpy = vectorized.load_numpy()
+
+class TestParallelFormat(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        self.numbers = [random.uniform(-1e9, 1e9) for _ in range(2000)]
+
+    def test_preserves_order(self):
+        from format_currency import format_currency, format_currency_parallel
+        result = format_currency_parallel(self.numbers, 'IN', workers=2, chunk_size=128)
+        self.assertEqual(result, [format_currency(number, 'IN') for number in self.numbers])
+
+    def test_mixed_and_exact_inputs(self):
+        from format_currency import format_currency_parallel
+        numbers = [1, 2.5, Decimal('12345678901234567890.125'), 2 ** 60 + 1]
+        self.assertEqual(format_currency_parallel(numbers, currency_code='USD', workers=2, chunk_size=2), [
+            '$ 1.00', '$ 2.50', '$ 12,345,678,901,234,567,890.12', '$ 1,152,921,504,606,846,977.00',
+        ])
+
+    def test_array_input_and_reused_executor(self):
+        from format_currency import format_currency_many, format_currency_parallel
+        from format_currency.parallel import create_executor
+        numbers = array.array('d', self.numbers)
+        with create_executor(2) as executor:
+            for options in ({'country_code': 'ID'}, {'country_code': 'CN', 'smart_number_formatting': True}):
+                result = format_currency_parallel(numbers, chunk_size=500, executor=executor, **options)
+                self.assertEqual(result, format_currency_many(self.numbers, **options))
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_input(self):
+        from format_currency import format_currency_many, format_currency_parallel
+        numbers = numpy.asarray(self.numbers)
+        self.assertEqual(format_currency_parallel(numbers, 'US', workers=2, chunk_size=300), format_currency_many(self.numbers, 'US'))
+
+    def test_locale_snapshot(self):
+        from format_currency import LocaleSnapshot, format_currency_many, format_currency_parallel
+        snapshot = LocaleSnapshot('.', ',', (3,), name='de_DE')
+        result = format_currency_parallel(self.numbers, 'US', workers=2, chunk_size=500, locale_snapshot=snapshot)
+        self.assertEqual(result, format_currency_many(self.numbers, 'US', locale_snapshot=snapshot))
+
+    def test_single_worker_and_empty_input(self):
+        from format_currency import format_currency_parallel
+        self.assertEqual(format_currency_parallel([1.5], 'US', workers=1), ['$ 1.50'])
+        self.assertEqual(format_currency_parallel([], 'US', workers=2), [])
+
+    def test_invalid_options_raise_in_caller(self):
+        from format_currency import format_currency_parallel
+        with self.assertRaises(ValueError):
+            format_currency_parallel(self.numbers, 'US', workers=2, number_format_system='invalid')
+        with self.assertRaises(ValueError):
+            format_currency_parallel(self.numbers, 'US', workers=2, chunk_size=0)
+
+    def test_worker_formatters_follow_registrations(self):
+        from format_currency import register_currency, unregister_currency
+        from format_currency.cache import MAX_RESOLVED_FORMATTERS, resolved_formatters
+        from format_currency.parallel import format_chunk
+        options = ((None, 'IDR', None, None, None, False), ())
+        self.assertEqual(format_chunk(options, [1.5]), 'Rp 1,50')
+        register_currency('IDR', decimal_places=0)
+        try:
+            self.assertEqual(format_chunk(options, [1.5]), 'Rp 2')
+        finally:
+            unregister_currency('IDR')
+        self.assertEqual(format_chunk(options, [1.5]), 'Rp 1,50')
+        for decimal_places in range(MAX_RESOLVED_FORMATTERS + 10):
+            format_chunk((options[0], (('decimal_places', decimal_places),)), [1])
+        self.assertLessEqual(len(resolved_formatters), MAX_RESOLVED_FORMATTERS)
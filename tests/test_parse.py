@@ -0,0 +1,60 @@
+import unittest
+from decimal import Decimal
+
+class TestParseCurrency(unittest.TestCase):
+
+    def test_parse(self):
+        from format_currency import parse_currency
+        self.assertEqual(parse_currency('Rp 1.234.567,89', 'ID'), (Decimal('1234567.89'), 'IDR'))
+        self.assertEqual(parse_currency('12,34,567.89 ₹', 'IN'), (Decimal('1234567.89'), 'INR'))
+        self.assertEqual(parse_currency('¥ -123,4567.89', currency_code='CNY'), (Decimal('-1234567.89'), 'CNY'))
+        self.assertEqual(parse_currency('  € 1 234,50 ', 'FR').amount, Decimal('1234.50'))
+        self.assertEqual(parse_currency('1,234.56', decimal_separator='.', thousands_separator=','), (Decimal('1234.56'), None))
+        self.assertEqual(parse_currency('BTC 1.000,5', currency_symbol='BTC', decimal_separator=',', thousands_separator='.'), (Decimal('1000.5'), None))
+
+    def test_parse_smart_units(self):
+        from format_currency import parse_currency
+        self.assertEqual(parse_currency('$ 1.23 Million', 'US').amount, Decimal('1230000'))
+        self.assertEqual(parse_currency('¥ 123.46 万', 'CN').amount, Decimal('1234600'))
+        self.assertEqual(parse_currency('₹ 1.23 Sau crore', 'IN').amount, Decimal('1230000000'))
+        self.assertEqual(parse_currency('$ -1,234,567.00 Only', 'US').amount, Decimal('-1234567'))
+        self.assertEqual(parse_currency('$ 1.5 million', 'US').amount, Decimal('1500000'))
+
+    def test_detect_currency(self):
+        from format_currency import parse_currency
+        self.assertEqual(parse_currency('Rp 1.234.567,89'), (Decimal('1234567.89'), 'IDR'))
+        self.assertEqual(parse_currency('1,23 Million €'), (Decimal('1230000'), 'EUR'))
+        self.assertEqual(parse_currency('€ 1,00').amount, Decimal('1.00'))
+        self.assertEqual(parse_currency('BHD 1,234.500'), (Decimal('1234.500'), 'BHD'))
+        self.assertEqual(parse_currency('1,234.50'), (Decimal('1234.50'), None))
+
+    def test_invalid(self):
+        from format_currency import parse_currency
+        for text in ('', 'Rp', 'Rp 1,234.56', '$ 12', '1,2,3', 'Rp 1e5', 'Rp 1_000'):
+            with self.assertRaises(ValueError, msg=text):
+                parse_currency(text, 'ID')
+
+    def test_parse_many(self):
+        from format_currency import CurrencyParser, parse_currency_many
+        self.assertEqual(parse_currency_many(['$ 1.00', '$ -2.50', '3.00 $'], 'US'), [(Decimal('1.00'), 'USD'), (Decimal('-2.50'), 'USD'), (Decimal('3.00'), 'USD')])
+        self.assertEqual([parsed.currency_code for parsed in CurrencyParser().parse_many(['₹ 1.00', 'Rp 1,00', '1,00 zł'])], ['INR', 'IDR', 'PLN'])
+
+    def test_round_trip_all_countries(self):
+        from format_currency import Country, format_currency, parse_currency, CurrencyParser
+        numbers = [0, 7, -1, 0.5, 1234.5, -1234567.891, 123456789012.345, 10 ** 15, Decimal('-98765.4321')]
+        for country in Country.load_countries_index()['alpha2'].values():
+            parser = CurrencyParser(country.alpha2)
+            for number in numbers:
+                expected = Decimal(f'{number:.{country.currency_decimal_place}f}')
+                for place_currency_symbol_at_end in (False, True):
+                    formatted = format_currency(number, country.alpha2, place_currency_symbol_at_end=place_currency_symbol_at_end)
+                    self.assertEqual(parser.parse(formatted), (expected, country.currency_code), formatted)
+                    self.assertEqual(parse_currency(formatted).amount, expected, formatted)
+
+    def test_round_trip_smart_formatting(self):
+        from format_currency import format_currency, parse_currency
+        for country_code in ('US', 'IN', 'CN', 'ID'):
+            for number in (999.5, 12345678.9, -1234567.5, 1.5e12):
+                formatted = format_currency(number, country_code, smart_number_formatting=True)
+                amount = parse_currency(formatted, country_code).amount
+                self.assertAlmostEqual(float(amount), number, delta=abs(number) * 0.01, msg=formatted)
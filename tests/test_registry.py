@@ -0,0 +1,109 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+class TestRegistry(unittest.TestCase):
+
+    def tearDown(self):
+        from format_currency import disable_format_cache, reload_countries
+        disable_format_cache()
+        reload_countries(currencies={})
+
+    def test_register_currency(self):
+        from format_currency import Country, format_currency, register_currency, unregister_currency
+        register_currency('btc', '₿', decimal_places=8, currency_name='Bitcoin')
+        self.assertEqual(format_currency(0.5, currency_code='BTC'), '₿ 0.50000000')
+        self.assertEqual(Country.load_country_by_currency_code('BTC').currency_name, 'Bitcoin')
+        self.assertIsNone(Country.load_country(''))
+
+        #* a redenomination keeps the fields not given
+        register_currency('IDR', decimal_places=0)
+        self.assertEqual(format_currency(1234567.5, 'ID'), 'Rp 1.234.568')
+        self.assertEqual(format_currency(1234567.5, currency_code='IDR'), 'Rp 1.234.568')
+        unregister_currency('IDR')
+        self.assertEqual(format_currency(1234567.5, 'ID'), 'Rp 1.234.567,50')
+
+        register_currency('VED', 'Bs.', decimal_separator=',', thousands_separator='.', country_code='VE')
+        self.assertEqual(Country.load_country('VE').currency_code, 'VED')
+        self.assertEqual(format_currency(1234567.5, 'VE'), 'Bs. 1.234.567,50')
+
+        with self.assertRaises(ValueError):
+            unregister_currency('XYZ')
+        with self.assertRaises(ValueError):
+            register_currency('BTC', decimal_places=-1)
+
+    def test_parse_and_find_registered_currency(self):
+        from format_currency import find_currencies, parse_currency, register_currency
+        from decimal import Decimal
+        self.assertEqual(find_currencies('paid ₿ 2'), [])
+        register_currency('BTC', '₿', decimal_places=8)
+        self.assertEqual(parse_currency('₿ 0.50000000'), (Decimal('0.50000000'), 'BTC'))
+        self.assertEqual(find_currencies('paid ₿ 2')[0].currency_codes, ('BTC',))
+
+    def test_caches_are_invalidated(self):
+        from format_currency import compile_formatter, enable_format_cache, format_currency, register_currency
+        enable_format_cache()
+        self.assertEqual(format_currency(1234.6, 'JP'), '¥ 1,235')
+        format_jpy = compile_formatter('JP')
+        register_currency('JPY', '円', decimal_places=2)
+        self.assertEqual(format_currency(1234.6, 'JP'), '円 1,234.60')
+        self.assertEqual(compile_formatter('JP')(1234.6), '円 1,234.60')
+        self.assertEqual(format_jpy(1234.6), '¥ 1,235')
+
+    def test_reload_countries(self):
+        from format_currency import Country, format_currency, register_currency, reload_countries
+        register_currency('BTC', '₿', decimal_places=8)
+        data = Country.load_data_file('countries.json')
+        for country_data in data:
+            if country_data['isoAlpha2'] == 'US':
+                country_data['currency']['symbol'] = 'US$'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'countries.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            version = reload_countries(path)
+            self.assertEqual(format_currency(1, 'US'), 'US$ 1.00')
+            self.assertEqual(format_currency(1, currency_code='BTC'), '₿ 1.00000000')
+
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('[{')
+            with self.assertRaises(ValueError):
+                reload_countries(path)
+            self.assertEqual(format_currency(1, 'US'), 'US$ 1.00')
+
+            currencies_path = os.path.join(directory, 'currencies.json')
+            with open(currencies_path, 'w', encoding='utf-8') as f:
+                json.dump({'XTS': {'currency_symbol': 'T', 'decimal_places': 4}}, f)
+            self.assertGreater(reload_countries(currencies=currencies_path), version)
+        self.assertEqual(format_currency(1, 'US'), '$ 1.00')
+        self.assertEqual(format_currency(1, currency_code='XTS'), 'T 1.0000')
+        self.assertEqual(format_currency(1, currency_code='BTC'), '1.00')
+
+    def test_concurrent_swaps(self):
+        from format_currency import format_currency, register_currency, unregister_currency
+        allowed = {'Rp 1.234.567,50', 'Rp 1.234.568'}
+        stop = threading.Event()
+        seen = set()
+        errors = []
+
+        def worker():
+            try:
+                while not stop.is_set():
+                    seen.add(format_currency(1234567.5, currency_code='IDR'))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for _ in range(50):
+            register_currency('IDR', decimal_places=0)
+            unregister_currency('IDR')
+        stop.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(seen, allowed)
+        self.assertEqual(format_currency(1234567.5, currency_code='IDR'), 'Rp 1.234.567,50')
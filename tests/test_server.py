@@ -0,0 +1,143 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+async def exchange(reader, writer, payload, lines):
+    writer.write(payload)
+    await writer.drain()
+    return [await reader.readline() for _ in range(lines)]
+
+class TestServer(unittest.TestCase):
+
+    def run_with_server(self, client, **kwargs):
+        from format_currency.server import start_server
+
+        async def run():
+            server = await start_server(port=0, **kwargs)
+            async with server:
+                if 'path' in kwargs:
+                    connect = lambda: asyncio.open_unix_connection(kwargs['path'])
+                else:
+                    connect = lambda: asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+                return await client(connect, server)
+
+        return asyncio.run(run())
+
+    def test_requests(self):
+        from format_currency.server import decode_response, encode_request
+
+        async def client(connect, server):
+            reader, writer = await connect()
+            payload = b''.join([
+                b'USD 1234.5 -42\n',
+                b'\n',
+                b'IN 12345678.905\n',
+                encode_request([12345678.9], 'IN', smart_number_formatting=True),
+                encode_request([1.5], currency_code='EUR', thousands_separator='.', decimal_separator=','),
+                'currency_symbol=%E2%82%BF&decimal_places=8 0.5\n'.encode('utf-8'),
+                b'USD 12abc\n',
+                b'country_code=US&decimal_places=x 1\n',
+                b'XYZ 1\n',
+                b'USD\n',
+                b'USD 1e30000000 1\n',
+                b'decimal_places=30000000&currency_code=USD 1\n',
+                b'USD 1e-30000000 9e99\n',
+            ])
+            lines = await exchange(reader, writer, payload, 12)
+            writer.close()
+            return lines
+
+        lines = self.run_with_server(client)
+        self.assertEqual(decode_response(lines[0]), ['$ 1,234.50', '$ -42.00'])
+        self.assertEqual(decode_response(lines[1]), ['₹ 1,23,45,678.90'])
+        self.assertEqual(decode_response(lines[2]), ['₹ 1.23 Crore'])
+        self.assertEqual(decode_response(lines[3]), ['1,50'])
+        self.assertEqual(decode_response(lines[4]), ['₿ 0.50000000'])
+        self.assertEqual(lines[5], b"-invalid amount '12abc'\n")
+        self.assertEqual(lines[6], b"-invalid decimal_places 'x'\n")
+        #* unknown codes format without a symbol, as `format_currency` does
+        self.assertEqual(decode_response(lines[7]), ['1.00'])
+        self.assertEqual(decode_response(lines[8]), [])
+        self.assertEqual(lines[9], b"-amount '1e30000000' out of range\n")
+        self.assertEqual(lines[10], b"-decimal_places '30000000' out of range\n")
+        self.assertEqual(decode_response(lines[11]), ['$ 0.00', '$ 9' + ',000' * 33 + '.00'])
+        with self.assertRaises(ValueError):
+            decode_response(lines[5])
+
+    def test_concurrent_requests_are_batched(self):
+        from format_currency import format_currency
+
+        async def client(connect, server):
+            async def one_client(index):
+                reader, writer = await connect()
+                currency_code = ('USD', 'INR', 'IDR')[index % 3]
+                amounts = [index * 1000 + offset + 0.25 for offset in range(20)]
+                payload = b''.join(f'{currency_code} {amount}\n'.encode('utf-8') for amount in amounts)
+                lines = await exchange(reader, writer, payload, len(amounts))
+                writer.close()
+                return [(currency_code, amount, line) for amount, line in zip(amounts, lines)]
+
+            results = await asyncio.gather(*[one_client(index) for index in range(30)])
+            return [result for client_results in results for result in client_results], server.batcher
+
+        results, batcher = self.run_with_server(client)
+        self.assertEqual(len(results), 600)
+        for currency_code, amount, line in results:
+            self.assertEqual(line.decode('utf-8'), '+' + format_currency(amount, currency_code=currency_code) + '\n')
+        self.assertEqual(batcher.requests, 600)
+        self.assertLess(batcher.batches, 600)
+
+    def test_failing_request_in_shared_batch(self):
+        from format_currency import CurrencyFormatter
+        format_many = CurrencyFormatter.format_many
+
+        def failing_format_many(formatter, numbers):
+            if formatter.currency_code == 'EUR':
+                raise RuntimeError('formatting failed')
+            return format_many(formatter, numbers)
+
+        async def client(connect, server):
+            (bad_reader, bad_writer), (good_reader, good_writer) = await connect(), await connect()
+            #* sent before the batch delay ends, so all of them are formatted in one batch
+            lines = await asyncio.wait_for(asyncio.gather(
+                exchange(bad_reader, bad_writer, b'locale_snapshot=x 5\nEUR 1\ncountry_code=US&smart_units=nope&smart_number_formatting=1 1\n', 3),
+                exchange(good_reader, good_writer, b'USD 5\n', 1),
+            ), 5)
+            bad_writer.close()
+            good_writer.close()
+            return lines, server.batcher
+
+        with mock.patch.object(CurrencyFormatter, 'format_many', autospec=True, side_effect=failing_format_many):
+            (bad_lines, good_lines), batcher = self.run_with_server(client, batch_delay=0.05)
+        self.assertEqual(bad_lines[0], b"-unsupported option 'locale_snapshot'\n")
+        self.assertEqual(bad_lines[1], b'-formatting failed\n')
+        self.assertTrue(bad_lines[2].startswith(b"-Unknown smart unit table 'nope'"))
+        self.assertEqual(good_lines, [b'+$ 5.00\n'])
+        self.assertEqual((batcher.batches, batcher.requests), (1, 4))
+
+    def test_max_batch_amounts(self):
+        async def client(connect, server):
+            reader, writer = await connect()
+            lines = await exchange(reader, writer, b'USD 1 2 3\n' * 10, 10)
+            writer.close()
+            return lines, server.batcher
+
+        lines, batcher = self.run_with_server(client, max_batch_amounts=6)
+        self.assertEqual(set(lines), {b'+$ 1.00\t$ 2.00\t$ 3.00\n'})
+        self.assertEqual(batcher.batches, 5)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), 'Unix sockets are not supported')
+    def test_unix_socket(self):
+        async def client(connect, server):
+            reader, writer = await connect()
+            lines = await exchange(reader, writer, b'ID 1234567.891\n', 1)
+            writer.close()
+            await writer.wait_closed()
+            return lines
+
+        with tempfile.TemporaryDirectory() as directory:
+            lines = self.run_with_server(client, path=os.path.join(directory, 'format_currency.sock'))
+        self.assertEqual(lines, ['+Rp 1.234.567,89\n'.encode('utf-8')])
@@ -0,0 +1,103 @@
+import unittest
+from decimal import Decimal
+
+class TestSmartUnits(unittest.TestCase):
+
+    def test_builtin_tables(self):
+        from format_currency import format_currency
+        self.assertEqual(format_currency(999999.999, 'US', smart_number_formatting=True), '$ 1.00 Million')
+        self.assertEqual(format_currency(999.99, 'US', smart_number_formatting=True), '$ 999.99')
+        self.assertEqual(format_currency(-1234567.89, 'US', smart_number_formatting=True), '$ -1,234,567.89 Only')
+        self.assertEqual(format_currency(-12345678.9, 'IN', smart_number_formatting=True), '₹ -1,23,45,678.90')
+        self.assertEqual(format_currency(9999.99, 'CN', smart_number_formatting=True), '¥ 9999.99')
+        self.assertEqual(format_currency(10 ** 25, 'IN', smart_number_formatting=True), '₹ 1,00,00,00,00,000.00 Crore crore')
+        self.assertEqual(format_currency(Decimal('12345678.905'), 'IN', smart_number_formatting=True), '₹ 1.23 Crore')
+
+    def test_register_unit_table(self):
+        from format_currency import format_currency, format_currency_minor_units, register_unit_table
+        register_unit_table('test_de', {'': 1, 'Tsd.': 1000, 'Mio.': 1000, 'Mrd.': 1000})
+        register_unit_table('test_ja', {'': 1, '万': 10000, '億': 10000, '兆': 10000})
+        self.assertEqual(format_currency(1234567.89, 'DE', smart_number_formatting=True, smart_units='test_de'), '€ 1,23 Mio.')
+        self.assertEqual(format_currency(-1234567.89, 'DE', smart_number_formatting=True, smart_units='test_de'), '€ -1,23 Mio.')
+        self.assertEqual(format_currency(999.5, 'DE', smart_number_formatting=True, smart_units='test_de'), '€ 999,50')
+        self.assertEqual(format_currency(123456789, 'JP', smart_number_formatting=True, smart_units='test_ja'), '¥ 1 億')
+        self.assertEqual(format_currency_minor_units(-123456789, 'US', smart_number_formatting=True, smart_units='test_de'), '$ -1.23 Mio.')
+        #* smart_units only applies with smart formatting
+        self.assertEqual(format_currency(1234567.89, 'DE', smart_units='test_de'), '€ 1.234.567,89')
+
+    def test_unit_table_instance(self):
+        from format_currency import SmartUnitTable, format_currency
+        units = SmartUnitTable({'': 1, 'K': 1000, 'M': 1000}, negative='ignore')
+        self.assertEqual(format_currency(2.5e12, 'US', smart_number_formatting=True, smart_units=units), '$ 2,500,000.00 M')
+        self.assertEqual(format_currency(-2500, 'US', smart_number_formatting=True, smart_units=units), '$ -2,500.00')
+
+    def test_split(self):
+        from format_currency import SmartUnitTable
+        units = SmartUnitTable({'': 1, 'K': 1000, 'M': 1000})
+        self.assertEqual(units.split(0.5), (0.5, ''))
+        self.assertEqual(units.split(1500.0), (1.5, 'K'))
+        self.assertEqual(units.split(-1500.0), (-1.5, 'K'))
+        self.assertEqual(units.split(999999999.0), (999.999999, 'M'))
+        self.assertEqual(units.multipliers, (1, 1000, 1000000))
+        self.assertIsNone(SmartUnitTable({'': 1, 'K': 1000}, negative='ignore').split(-1500.0))
+        self.assertEqual(SmartUnitTable({'': 1, 'K': 1000}, negative='base_unit').split(-1500.0), (-1500.0, ''))
+
+    def test_invalid_tables(self):
+        from format_currency import SmartUnitTable, format_currency
+        with self.assertRaises(ValueError):
+            SmartUnitTable({'K': 1000})
+        with self.assertRaises(ValueError):
+            SmartUnitTable({'': 1}, negative='absolute')
+        with self.assertRaises(ValueError):
+            format_currency(1, 'US', smart_number_formatting=True, smart_units='missing')
+
+    def test_parse_registered_units(self):
+        from format_currency import CurrencyParser, parse_currency, register_unit_table
+        parser = CurrencyParser('US')
+        register_unit_table('test_kmb', {'': 1, 'K': 1000, 'M': 1000, 'B': 1000})
+        self.assertEqual(parser.parse('$ 1.5 B').amount, Decimal('1500000000'))
+        self.assertEqual(parse_currency('$ 1.5 k', 'US').amount, Decimal('1500'))
+
+    def test_parse_reregistered_units(self):
+        from format_currency import format_currency, parse_currency, register_unit_table
+        register_unit_table('test_lots', {'': 1, 'Lots': 1000})
+        register_unit_table('test_lots', {'': 1, 'Lots': 100})
+        text = format_currency(2500, 'US', smart_number_formatting=True, smart_units='test_lots')
+        self.assertEqual(text, '$ 25.00 Lots')
+        self.assertEqual(parse_currency(text, 'US').amount, Decimal('2500'))
+
+    def test_format_series(self):
+        from format_currency import CurrencyFormatter, format_currency_series
+        amounts = [250000, 1500000.0, -12000000, float('nan')]
+        self.assertEqual(format_currency_series(amounts, 'US'), ['$ 0.25 Million', '$ 1.50 Million', '$ -12.00 Million', '$ nan'])
+        self.assertEqual(format_currency_series(amounts, 'IN'), ['₹ 0.03 Crore', '₹ 0.15 Crore', '₹ -1.20 Crore', '₹ nan'])
+        self.assertEqual(format_currency_series(amounts, 'IN', unit='median'), ['₹ 2.50 Lakhs', '₹ 15.00 Lakhs', '₹ -120.00 Lakhs', '₹ nan'])
+        self.assertEqual(format_currency_series(amounts, 'CN', unit='min'), ['¥ 25.00 万', '¥ 150.00 万', '¥ -1200.00 万', '¥ nan'])
+        self.assertEqual(format_currency_series([1234567, 999], 'US', unit='thousands'), ['$ 1,234.57 Thousands', '$ 1.00 Thousands'])
+        self.assertEqual(format_currency_series([1234567, 999], 'US', unit=lambda magnitudes: 1), ['$ 1,234,567.00', '$ 999.00'])
+        self.assertEqual(format_currency_series([Decimal('12345678.905')], 'IN', decimal_places=3), ['₹ 1.235 Crore'])
+        self.assertEqual(format_currency_series([12.5, 999], 'US'), ['$ 12.50', '$ 999.00'])
+        self.assertEqual(format_currency_series([], 'US'), [])
+        self.assertEqual(CurrencyFormatter('US').format_series([1234567]), ['$ 1,234,567.00'])
+        with self.assertRaises(ValueError):
+            format_currency_series(amounts, 'US', unit='Crore')
+
+    def test_format_series_unit_threshold(self):
+        from format_currency import format_currency, format_currency_series
+        for country_code, amount, kwargs in [('US', 999999.999, {}), ('IN', 9999999.999, {}), ('CN', 99999999.996, {}), ('US', 999.5, {'decimal_places': 0}), ('US', 999999.994, {})]:
+            with self.subTest(country_code=country_code, amount=amount):
+                expected = format_currency(amount, country_code, smart_number_formatting=True, **kwargs)
+                self.assertEqual(format_currency_series([amount], country_code, **kwargs), [expected])
+                self.assertEqual(format_currency_series([-amount], country_code, unit='median', **kwargs), [expected.replace(' ', ' -', 1)])
+        self.assertEqual(format_currency_series([999999.999, 1], 'US'), ['$ 1.00 Million', '$ 0.00 Million'])
+
+    def test_format_series_arrays(self):
+        import array
+        from format_currency import format_currency_series, vectorized
+        numpy = vectorized.load_numpy()
+        amounts = [250000.0, 1500000.0, -12000000.0, float('inf')]
+        expected = format_currency_series(amounts, 'IN', unit='median')
+        self.assertEqual(format_currency_series(array.array('d', amounts), 'IN', unit='median'), expected)
+        if numpy is not None:
+            self.assertEqual(format_currency_series(numpy.array(amounts), 'IN', unit='median'), expected)
+            self.assertEqual(format_currency_series(numpy.array([250000, -12000000]), 'US'), ['$ 0.25 Million', '$ -12.00 Million'])
@@ -0,0 +1,43 @@
+import unittest
+
+class TestSymbolIndex(unittest.TestCase):
+
+    def test_find(self):
+        from format_currency import SymbolMatch, find_currencies
+        matches = find_currencies('paid R$ 12,00, 5 kr and €3')
+        self.assertEqual([(match.start, match.end, match.symbol) for match in matches], [(5, 7, 'R$'), (17, 19, 'kr'), (24, 25, '€')])
+        self.assertEqual(matches[0], SymbolMatch(5, 7, 'R$', ('BRL',)))
+        self.assertEqual(find_currencies(''), [])
+
+    def test_iso_codes_match_whole_words(self):
+        from format_currency import find_currencies
+        self.assertEqual([match.symbol for match in find_currencies('USDT 5, 10 USD, EURO, (EUR)')], ['USD', 'EUR'])
+        self.assertEqual(find_currencies('Rate: Kr8 Lorem'), [])
+
+    def test_overlapping(self):
+        from format_currency import find_currencies
+        self.assertEqual([match.symbol for match in find_currencies('R$ 5')], ['R$'])
+        self.assertEqual([match.symbol for match in find_currencies('R$ 5', overlapping=True)], ['R$', 'R', '$'])
+
+    def test_shared_symbols_ranked_by_preference(self):
+        from format_currency import detect_currency, find_currencies
+        self.assertEqual(detect_currency('$ 5'), 'USD')
+        self.assertEqual(detect_currency('$ 5', preference=['CAD', 'AUD']), 'CAD')
+        self.assertEqual(find_currencies('£ 5', preference=['EGP'])[0].currency_codes[:2], ('EGP', 'FKP'))
+        codes = find_currencies('$ 5')[0].currency_codes
+        self.assertEqual(codes[:3], ('USD', 'AUD', 'CAD'))
+        self.assertIn('XCD', codes)
+        self.assertIsNone(detect_currency('no money here'))
+
+    def test_every_symbol_and_code_is_found(self):
+        from format_currency import Country, find_currencies
+        for country in Country.load_countries_index()['alpha2'].values():
+            for symbol in {(country.currency_symbol or '').strip(), country.currency_code} - {''}:
+                matches = find_currencies(f'total {symbol} 5', overlapping=True)
+                self.assertIn(country.currency_code, [code for match in matches if match.symbol == symbol for code in match.currency_codes], symbol)
+
+    def test_custom_symbols(self):
+        from format_currency import SymbolIndex
+        index = SymbolIndex({'<>': ['A'], '><': ['B'], '<><': ['C'], '>>': ['D', 'E']}, preference=['E'])
+        self.assertEqual([(match.start, match.symbol) for match in index.find('<><>>', overlapping=True)], [(0, '<><'), (0, '<>'), (1, '><'), (2, '<>'), (3, '>>')])
+        self.assertEqual(index.find('<><>>'), [(0, 3, '<><', ('C',)), (3, 5, '>>', ('E', 'D'))])
@@ -0,0 +1,72 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+class TestThreadSafety(unittest.TestCase):
+
+    def tearDown(self):
+        from format_currency import Country
+        Country.clear_cache()
+
+    def test_cold_concurrent_format_currency(self):
+        from format_currency import Country, format_currency
+
+        Country.clear_cache()
+        original_load_data_file = Country.load_data_file
+        loaded_files = []
+
+        def slow_load_data_file(filename):
+            loaded_files.append(filename)
+            #* widen the window in which other threads could start a second load
+            time.sleep(0.05)
+            return original_load_data_file(filename)
+
+        thread_count = 32
+        barrier = threading.Barrier(thread_count)
+        results = []
+        errors = []
+
+        def worker(index):
+            try:
+                barrier.wait()
+                country_code = ('US', 'ID', 'IN', 'CN')[index % 4]
+                for _ in range(200):
+                    results.append((country_code, format_currency(1234567.891, country_code)))
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch.object(Country, 'load_data_file', staticmethod(slow_load_data_file)):
+            threads = [threading.Thread(target=worker, args=(index,)) for index in range(thread_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(loaded_files, ['countries.json'])
+        self.assertEqual(len(results), thread_count * 200)
+        expected = {'US': '$ 1,234,567.89', 'ID': 'Rp 1.234.567,89', 'IN': '₹ 12,34,567.89', 'CN': '¥ 123,4567.89'}
+        for country_code, formatted in results:
+            self.assertEqual(formatted, expected[country_code])
+
+    def test_cold_concurrent_index_is_shared(self):
+        from format_currency import Country
+
+        Country.clear_cache()
+        thread_count = 16
+        barrier = threading.Barrier(thread_count)
+        countries = []
+
+        def worker():
+            barrier.wait()
+            countries.append(Country.load_country_by_currency_code('IDR'))
+
+        threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(countries), thread_count)
+        self.assertTrue(all(country is countries[0] for country in countries))